@@ -8,8 +8,18 @@
 let jobData = null;
 let remoteOnsiteChart = null;
 let countryComparisonChart = null;
+let trendChart = null;
+
+// Trend files already fetched, keyed by country
+const trendCache = {};
+
+// Country detail files (job listings) already fetched, keyed by role and country
+const detailCache = {};
 
 // DOM elements
+const roleSelector = document.getElementById('role-selector');
+const roleSelectorContainer = document.getElementById('role-selector-container');
+const roleSubtitleElement = document.getElementById('role-subtitle');
 const countrySelector = document.getElementById('country-selector');
 const lastUpdatedElement = document.getElementById('last-updated');
 const jobs24hElement = document.getElementById('jobs-24h');
@@ -28,6 +38,9 @@ async function initDashboard() {
         // Display the last updated timestamp
         updateTimestamp(jobData.last_updated);
         
+        // Offer the other roles the scraper searched for, if any
+        populateRoleSelector();
+        
         // Set up event listeners
         setupEventListeners();
         
@@ -40,6 +53,7 @@ async function initDashboard() {
         
         // Update charts with data
         updateCharts(initialCountry);
+        updateTrendChart(initialCountry);
         
     } catch (error) {
         console.error('Error initializing dashboard:', error);
@@ -48,11 +62,17 @@ async function initDashboard() {
 }
 
 /**
- * Fetch job data from the JSON file
+ * Fetch the manifest with the job counts of every country
  */
 async function fetchJobData() {
     try {
-        const response = await fetch('data/data.json');
+        // The manifest changes every run, so always revalidate it
+        let response = await fetch('data/manifest.json', { cache: 'no-cache' });
+        
+        // Data published before the manifest existed only has data.json
+        if (response.status === 404) {
+            response = await fetch('data/data.json');
+        }
         
         if (!response.ok) {
             throw new Error(`HTTP error! Status: ${response.status}`);
@@ -65,6 +85,84 @@ async function fetchJobData() {
     }
 }
 
+/**
+ * Fill the role selector; the main role comes first and is selected
+ */
+function populateRoleSelector() {
+    const mainRole = jobData.role || 'Data Analyst';
+    const roles = [mainRole, ...Object.keys(jobData.roles || {})];
+    
+    roles.forEach(role => {
+        const option = document.createElement('option');
+        option.value = role;
+        option.textContent = role;
+        roleSelector.appendChild(option);
+    });
+    
+    roleSelectorContainer.classList.toggle('hidden', roles.length < 2);
+}
+
+/**
+ * Whether the selected role is the main role, whose data is at the top level
+ */
+function isMainRole() {
+    return !roleSelector.value || roleSelector.value === (jobData.role || 'Data Analyst');
+}
+
+/**
+ * Counts and skill ranking of the selected role: { countries, skill_counts }
+ */
+function selectedRoleData() {
+    return isMainRole() ? jobData : jobData.roles[roleSelector.value];
+}
+
+/**
+ * Fetch the detail file (job listings) of a country for the selected role
+ */
+async function fetchCountryDetail(countryName) {
+    const cacheKey = `${roleSelector.value}|${countryName}`;
+    if (cacheKey in detailCache) {
+        return detailCache[cacheKey];
+    }
+    
+    const countryData = selectedRoleData().countries[countryName];
+    
+    // data.json already carries the listings
+    if (!countryData.detail) {
+        return countryData;
+    }
+    
+    // Detail files are named after their content and never change, so the browser cache can serve them
+    const response = await fetch(`data/${countryData.detail}`);
+    if (!response.ok) {
+        throw new Error(`HTTP error! Status: ${response.status}`);
+    }
+    
+    detailCache[cacheKey] = await response.json();
+    return detailCache[cacheKey];
+}
+
+/**
+ * Fetch the trend file of a country, or null if it has no history yet
+ */
+async function fetchTrend(countryName) {
+    if (countryName in trendCache) {
+        return trendCache[countryName];
+    }
+    
+    // Same file names as country_slug() in scraper/history.py
+    const slug = countryName.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-+|-+$/g, '');
+    
+    try {
+        const response = await fetch(`data/trends/${slug}.json`);
+        trendCache[countryName] = response.ok ? await response.json() : null;
+    } catch (error) {
+        console.error(`Error fetching trend for ${countryName}:`, error);
+        trendCache[countryName] = null;
+    }
+    return trendCache[countryName];
+}
+
 /**
  * Set up event listeners for interactive elements
  */
@@ -74,60 +172,67 @@ function setupEventListeners() {
         const selectedCountry = event.target.value;
         displayCountryData(selectedCountry);
         updateCharts(selectedCountry);
+        updateTrendChart(selectedCountry);
+    });
+    
+    // Role selector change event; the trend history only covers the main role
+    roleSelector.addEventListener('change', (event) => {
+        const selectedCountry = countrySelector.value;
+        roleSubtitleElement.textContent = `Real-time job market insights for ${event.target.value} positions`;
+        displayCountryData(selectedCountry);
+        updateCharts(selectedCountry);
+        updateCountryComparisonChart();
+        updateTrendChart(selectedCountry);
     });
 }
 
 /**
  * Display job data for the selected country
  */
-function displayCountryData(countryName) {
-    if (!jobData || !jobData.countries || !jobData.countries[countryName]) {
+async function displayCountryData(countryName) {
+    const roleData = jobData && selectedRoleData();
+    if (!roleData || !roleData.countries || !roleData.countries[countryName]) {
         showError(`No data available for ${countryName}`);
         return;
     }
     
-    const countryData = jobData.countries[countryName];
+    const role = roleSelector.value;
+    const countryData = roleData.countries[countryName];
     
     // Update summary cards with appropriate text based on value
     jobs24hElement.textContent = countryData.last_24h === -1 ? "Can't find data" : countryData.last_24h;
     jobs7dElement.textContent = countryData.last_7d === -1 ? "Can't find data" : countryData.last_7d;
     jobs30dElement.textContent = countryData.last_30d === -1 ? "Can't find data" : countryData.last_30d;
     
-    // Display skills from job listings
-    displaySkills(countryData.job_listings);
+    // Counts the scraper carried forward from an earlier run show when they were observed
+    const stale = countryData.stale || {};
+    jobs24hElement.title = stale.last_24h ? `As of ${stale.last_24h}` : '';
+    jobs7dElement.title = stale.last_7d ? `As of ${stale.last_7d}` : '';
+    jobs30dElement.title = stale.last_30d ? `As of ${stale.last_30d}` : '';
+    
+    // Display skills once the country's detail file is loaded
+    skillsContainerElement.innerHTML = '<div class="text-gray-500">Loading skills data...</div>';
+    try {
+        const detail = await fetchCountryDetail(countryName);
+        
+        // Ignore the response if the user picked another country or role meanwhile
+        if (countrySelector.value === countryName && roleSelector.value === role) {
+            displaySkills(detail.skill_counts);
+        }
+    } catch (error) {
+        console.error(`Error fetching listings for ${countryName}:`, error);
+        displaySkills(null);
+    }
 }
 
 /**
- * Display skills from job listings, sorted by frequency
+ * Display the skill ranking computed by the scraper, one section per category
  */
-function displaySkills(listings) {
+function displaySkills(skillCounts) {
     // Clear existing skills
     skillsContainerElement.innerHTML = '';
     
-    if (!listings || listings.length === 0) {
-        skillsContainerElement.innerHTML = '<div class="text-gray-500">No skills data available</div>';
-        return;
-    }
-    
-    // Collect all skills from job listings
-    const skillsCount = {};
-    
-    listings.forEach(job => {
-        if (job.skills && Array.isArray(job.skills) && job.skills.length > 0) {
-            job.skills.forEach(skill => {
-                if (skill) {
-                    skillsCount[skill] = (skillsCount[skill] || 0) + 1;
-                }
-            });
-        }
-    });
-    
-    // Convert to array for sorting
-    const sortedSkills = Object.entries(skillsCount)
-        .sort((a, b) => b[1] - a[1]) // Sort by count in descending order
-        .map(([skill, count]) => ({ skill, count }));
-    
-    if (sortedSkills.length === 0) {
+    if (!skillCounts || skillCounts.listings === 0) {
         skillsContainerElement.innerHTML = '<div class="text-gray-500">No skills data available</div>';
         return;
     }
@@ -136,50 +241,9 @@ function displaySkills(listings) {
     const skillsContainer = document.createElement('div');
     skillsContainer.className = 'w-full';
     
-    // Define skill categories
-    const technicalSkills = [
-        "SQL", "Python", "R", "Excel", "Tableau", "Power BI", "SPSS", "SAS",
-        "D3.js", "Java", "Scala", "MATLAB", "Hadoop", "Spark", "AWS", "Azure",
-        "Google Cloud", "MongoDB", "PostgreSQL", "MySQL", "Oracle", "ETL",
-        "Machine Learning", "Deep Learning", "AI", "Statistics", "Pandas",
-        "NumPy", "Scikit-learn", "TensorFlow", "PyTorch", "Jupyter",
-        "Data Visualization", "Data Modeling", "Business Intelligence",
-        "Data Mining", "A/B Testing", "Data Warehousing", "Looker",
-        "Snowflake", "Redshift", "BigQuery", "Alteryx", "SSRS", "SSIS",
-        "DAX", "Power Query", "VBA", "Qlik", "Cognos", "Teradata",
-        "Informatica", "DataOps", "MLOps", "PowerPoint", "Word", "Outlook",
-        "SharePoint", "Teams", "Jira", "Confluence", "Git", "GitHub", "GitLab",
-        "NoSQL", "Airflow", "dbt", "Data Quality", "JSON", "XML", "API",
-        "REST", "SOAP", "Flask", "Django", "FastAPI"
-    ];
-    
-    const educationSkills = [
-        "Bachelor's Degree", "Master's Degree", "PhD", "MBA",
-        "Bachelor", "Master", "Doctorate", "BSc", "MSc",
-        "BS", "MS", "Computer Science", "Statistics", "Mathematics",
-        "Information Technology", "Data Science", "Economics", "Business",
-        "Engineering", "Quantitative Field", "Degree"
-    ];
-    
-    // Filter skills by category
-    const technicalSkillsFound = sortedSkills.filter(item => 
-        technicalSkills.includes(item.skill)
-    );
-    
-    const educationSkillsFound = sortedSkills.filter(item => 
-        educationSkills.includes(item.skill) || 
-        /degree|bachelor|master|phd|msc|bsc/i.test(item.skill)
-    );
-    
-    const softSkillsFound = sortedSkills.filter(item => 
-        !technicalSkills.includes(item.skill) && 
-        !educationSkills.includes(item.skill) && 
-        !/degree|bachelor|master|phd|msc|bsc/i.test(item.skill)
-    );
-    
     // Function to create a skill category section
     function createSkillSection(title, skills, colorClass) {
-        if (skills.length === 0) return '';
+        if (skills.length === 0) return null;
         
         const section = document.createElement('div');
         section.className = 'mb-6';
@@ -206,18 +270,16 @@ function displaySkills(listings) {
         return section;
     }
     
-    // Add sections to container
-    skillsContainer.appendChild(
-        createSkillSection('Technical Skills', technicalSkillsFound, 'bg-blue-100 text-blue-800')
-    );
-    
-    skillsContainer.appendChild(
-        createSkillSection('Education Requirements', educationSkillsFound, 'bg-purple-100 text-purple-800')
-    );
-    
-    skillsContainer.appendChild(
-        createSkillSection('Other Skills & Qualifications', softSkillsFound, 'bg-green-100 text-green-800')
-    );
+    // Add sections to container, skipping empty categories
+    [
+        createSkillSection('Technical Skills', skillCounts.technical, 'bg-blue-100 text-blue-800'),
+        createSkillSection('Education Requirements', skillCounts.education, 'bg-purple-100 text-purple-800'),
+        createSkillSection('Other Skills & Qualifications', skillCounts.soft, 'bg-green-100 text-green-800')
+    ].forEach(section => {
+        if (section) {
+            skillsContainer.appendChild(section);
+        }
+    });
     
     // Add the container to the DOM
     skillsContainerElement.appendChild(skillsContainer);
@@ -254,22 +316,13 @@ function initializeCharts() {
     // Country comparison chart
     const countryComparisonCtx = document.getElementById('country-comparison-chart').getContext('2d');
     
-    // Process data for country comparison, replacing -1 with null for better visualization
-    const countryLabels = Object.keys(jobData.countries);
-    const countryData = Object.values(jobData.countries).map(country => {
-        return country.last_30d === -1 ? null : country.last_30d;
-    });
-    
-    // Check if all values are null/can't find data
-    const allDataMissing = countryData.every(value => value === null);
-    
     countryComparisonChart = new Chart(countryComparisonCtx, {
         type: 'bar',
         data: {
-            labels: countryLabels,
+            labels: [],
             datasets: [{
                 label: 'Last 30 Days',
-                data: countryData,
+                data: [],
                 backgroundColor: '#818cf8'
             }]
         },
@@ -297,7 +350,7 @@ function initializeCharts() {
                     display: false
                 },
                 title: {
-                    display: allDataMissing,
+                    display: false,
                     text: "Can't find data",
                     color: '#888',
                     font: {
@@ -307,17 +360,38 @@ function initializeCharts() {
             }
         }
     });
+    updateCountryComparisonChart();
+}
+
+/**
+ * Show the 30-day counts of every country for the selected role
+ */
+function updateCountryComparisonChart() {
+    const countries = selectedRoleData().countries;
+    
+    // Process data for country comparison, replacing -1 with null for better visualization
+    const countryData = Object.values(countries).map(country => {
+        return country.last_30d === -1 ? null : country.last_30d;
+    });
+    
+    countryComparisonChart.data.labels = Object.keys(countries);
+    countryComparisonChart.data.datasets[0].data = countryData;
+    
+    // Check if all values are null/can't find data
+    countryComparisonChart.options.plugins.title.display = countryData.every(value => value === null);
+    countryComparisonChart.update();
 }
 
 /**
  * Update charts with new data
  */
 function updateCharts(countryName) {
-    if (!jobData || !jobData.countries || !jobData.countries[countryName]) {
+    const roleData = jobData && selectedRoleData();
+    if (!roleData || !roleData.countries || !roleData.countries[countryName]) {
         return;
     }
     
-    const countryData = jobData.countries[countryName];
+    const countryData = roleData.countries[countryName];
     
     // Update Remote vs On-site chart
     // If data can't be found, show empty chart
@@ -341,7 +415,79 @@ function updateCharts(countryName) {
     }
     remoteOnsiteChart.update();
     
-    // The country comparison chart already has all countries, doesn't need to be updated
+    // The country comparison chart already has all countries, it only changes with the role
+}
+
+/**
+ * Show the daily history of job counts for the selected country
+ */
+async function updateTrendChart(countryName) {
+    // The scraper only keeps the history of the main role
+    const mainRole = isMainRole();
+    const trend = mainRole ? await fetchTrend(countryName) : null;
+    
+    // Ignore the response if the user picked another country or role meanwhile
+    if (countrySelector.value !== countryName || isMainRole() !== mainRole) {
+        return;
+    }
+    
+    // One label per day from the start date; missing days stay null
+    const labels = [];
+    const series = trend ? trend.last_30d : [];
+    if (trend) {
+        const start = new Date(`${trend.start}T00:00:00Z`);
+        for (let day = 0; day < series.length; day++) {
+            const date = new Date(start.getTime() + day * 86400000);
+            labels.push(date.toISOString().slice(0, 10));
+        }
+    }
+    
+    const datasets = [
+        { label: 'Last 24 Hours', data: trend ? trend.last_24h : [], borderColor: '#c7d2fe' },
+        { label: 'Last 7 Days', data: trend ? trend.last_7d : [], borderColor: '#818cf8' },
+        { label: 'Last 30 Days', data: series, borderColor: '#4f46e5' }
+    ];
+    
+    if (!trendChart) {
+        const trendCtx = document.getElementById('trend-chart').getContext('2d');
+        trendChart = new Chart(trendCtx, {
+            type: 'line',
+            data: { labels, datasets },
+            options: {
+                responsive: true,
+                maintainAspectRatio: false,
+                // Skipped and carried-forward counts are gaps in the history
+                spanGaps: true,
+                scales: {
+                    y: {
+                        beginAtZero: true,
+                        title: {
+                            display: true,
+                            text: 'Number of Jobs'
+                        }
+                    }
+                },
+                plugins: {
+                    legend: {
+                        position: 'bottom'
+                    }
+                }
+            }
+        });
+    } else {
+        trendChart.data.labels = labels;
+        trendChart.data.datasets = datasets;
+    }
+    
+    trendChart.options.plugins.title = {
+        display: !trend,
+        text: mainRole ? 'No history yet' : 'History is only kept for the main role',
+        color: '#888',
+        font: {
+            size: 14
+        }
+    };
+    trendChart.update();
 }
 
 /**
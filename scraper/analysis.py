@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Browser-free analysis of scraped job data
+
+Everything that turns scraped listings into the published output: skill
+extraction, skill rankings per country and role, re-applying re-extracted
+skills, and writing data.json and the dashboard files (extract_skills,
+aggregate_skills and write_artifacts are re-exported from their modules).
+main.py uses these for every run; analysis scripts and the description
+archive CLI import this module instead, so they never load selenium or
+undetected-chromedriver. bench_import.py keeps its cold import time under a
+budget.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, List
+
+from artifacts import write_artifacts
+from checkpoint import write_json_atomic
+from skills import aggregate_skills, extract_skills
+
+logger = logging.getLogger("glassdoor_scraper")
+
+
+def rank_skills(countries: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rank skills per country and overall for one role.
+
+    Sets the "skill_counts" of every country. The overall ranking is
+    aggregated over the listings of all countries, so a posting listed in
+    several countries counts once.
+
+    Returns:
+        The overall ranking, in the aggregate_skills format
+    """
+    for country_data in countries.values():
+        country_data["skill_counts"] = aggregate_skills(country_data.get("job_listings", []))
+    return aggregate_skills(
+        listing for country_data in countries.values() for listing in country_data.get("job_listings", [])
+    )
+
+
+def build_output(role_countries: Dict[str, Dict[str, Any]], main_role: str) -> Dict[str, Any]:
+    """
+    Build the data.json layout from the country data of every role, with skills ranked.
+
+    Args:
+        role_countries: Role -> country -> country data
+        main_role: Role kept at the top level, where the history and older
+            dashboards read it
+
+    Returns:
+        {"role", "countries", "skill_counts", "roles"}, where "roles" holds
+        the countries and skill_counts of every other role
+    """
+    role_data = {
+        role: {"countries": countries, "skill_counts": rank_skills(countries)}
+        for role, countries in role_countries.items()
+    }
+    primary = role_data.pop(main_role, {"countries": {}, "skill_counts": aggregate_skills([])})
+    return {"role": main_role, "countries": primary["countries"], "skill_counts": primary["skill_counts"],
+            "roles": role_data}
+
+
+def apply_skills(data: Dict[str, Any], skills_by_id: Dict[str, List[str]]) -> Dict[str, int]:
+    """
+    Replace the skills of every listing with an archived description and re-rank skills.
+
+    The skill rankings of every country and role are recomputed, including
+    those of listings without an archived description, which keep their skills.
+
+    Args:
+        data: Run output in the data.json format, updated in place
+        skills_by_id: Skills by description ID, from description_archive.reextract_skills
+
+    Returns:
+        Listings updated, and listings left as they were for lack of an archived description
+    """
+    counts = {"updated": 0, "unarchived": 0}
+    for role_data in [data] + list(data.get("roles", {}).values()):
+        countries = role_data.get("countries", {})
+        for country_data in countries.values():
+            for listing in country_data.get("job_listings", []):
+                skills = skills_by_id.get(listing.get("description_id", ""))
+                if skills is None:
+                    counts["unarchived"] += 1
+                    continue
+                listing["skills"] = skills
+                counts["updated"] += 1
+        role_data["skill_counts"] = rank_skills(countries)
+    return counts
+
+
+def save_data(data: Dict[str, Any], output_path: Path) -> None:
+    """Save the scraped data to a JSON file, replacing it atomically."""
+    logger.info(f"Saving data to {output_path}")
+
+    # Written to a temporary file first, so the dashboard never reads a truncated file
+    write_json_atomic(output_path, data, indent=2)
+
+    logger.info(f"Data saved successfully to {output_path}")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Dashboard data files
+
+Splits a run's output into a small manifest with the counts of every country
+(and the overall skill ranking) and one detail file per country with its job
+listings and skill ranking, for the main role and for every other role. Detail files are minified and named after a hash
+of their content, so browsers can cache them indefinitely and only the
+manifest has to be revalidated.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+from history import country_slug
+from queries import role_slug
+
+logger = logging.getLogger("glassdoor_scraper")
+
+# Directory served with the dashboard
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+# Manifest read first by js/app.js
+MANIFEST_FILE = "manifest.json"
+
+# Subdirectory of the per-country detail files
+DETAIL_DIR = "countries"
+
+# Fields kept in the manifest; everything else goes to the detail file
+SUMMARY_FIELDS = ["last_24h", "last_7d", "last_30d", "remote", "on_site"]
+
+# Fields describing how a run went rather than the jobs; they differ on every
+# run, so they are left out of the detail files to keep their hashes stable
+RUNTIME_FIELDS = ["memory", "sources"]
+
+
+def _minified(data: Any) -> bytes:
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _write_countries(countries: Dict[str, Any], detail_dir: Path, prefix: str,
+                     written: List[str]) -> Dict[str, Any]:
+    """Write the detail file of every country; returns the manifest entries of the countries."""
+    summaries: Dict[str, Any] = {}
+    for country, country_data in countries.items():
+        detail = {field: value for field, value in country_data.items()
+                  if field not in SUMMARY_FIELDS and field not in RUNTIME_FIELDS}
+        body = _minified(detail)
+        filename = f"{prefix}{country_slug(country)}.{hashlib.sha256(body).hexdigest()[:12]}.json"
+
+        # Same content, same name: an unchanged country is not rewritten
+        if not (detail_dir / filename).exists():
+            (detail_dir / filename).write_bytes(body)
+        written.append(filename)
+
+        summary = {field: country_data.get(field, -1) for field in SUMMARY_FIELDS}
+        if country_data.get("stale"):
+            summary["stale"] = country_data["stale"]
+        summary["detail"] = f"{DETAIL_DIR}/{filename}"
+        summaries[country] = summary
+    return summaries
+
+
+def write_artifacts(data: Dict[str, Any], directory: Path = DATA_DIR) -> Path:
+    """
+    Write the manifest and per-country detail files of a run.
+
+    Detail files no longer referenced by the manifest are removed afterwards.
+
+    Args:
+        data: Run output in the data.json format
+        directory: Directory to write into
+
+    Returns:
+        Path of the manifest
+    """
+    directory = Path(directory)
+    detail_dir = directory / DETAIL_DIR
+    os.makedirs(detail_dir, exist_ok=True)
+
+    written: List[str] = []
+    manifest: Dict[str, Any] = {"last_updated": data.get("last_updated")}
+    if "role" in data:
+        manifest["role"] = data["role"]
+    if "skill_counts" in data:
+        manifest["skill_counts"] = data["skill_counts"]
+    manifest["countries"] = _write_countries(data.get("countries", {}), detail_dir, "", written)
+
+    # Other roles get the same layout, with detail files prefixed by the role
+    manifest["roles"] = {
+        role: {
+            "skill_counts": role_data.get("skill_counts"),
+            "countries": _write_countries(role_data.get("countries", {}), detail_dir, f"{role_slug(role)}--", written)
+        }
+        for role, role_data in data.get("roles", {}).items()
+    }
+
+    # The manifest is written last so it never points at a missing detail file
+    manifest_path = directory / MANIFEST_FILE
+    temp_path = manifest_path.with_suffix(".tmp")
+    temp_path.write_bytes(_minified(manifest))
+    os.replace(temp_path, manifest_path)
+
+    for old_file in detail_dir.glob("*.json"):
+        if old_file.name not in written:
+            old_file.unlink()
+
+    logger.info(f"Wrote {manifest_path} and {len(written)} country detail files")
+    return manifest_path
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark of the non-scraping tools
+
+Imports each module in a fresh interpreter with `python -X importtime` and
+reports its cumulative cold import time. Fails if a browser-free module takes
+longer than the budget, or if any of them (main.py included) pulls in
+selenium or undetected-chromedriver at import, which only a starting
+browser should load.
+
+Usage:
+    python scraper/bench_import.py [--budget-ms 100] [--repeat 5]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+# Modules used without a browser, with a cold import time budget
+ANALYSIS_MODULES = [
+    "analysis", "skills", "description_archive", "near_duplicates", "job_index",
+    "artifacts", "history", "run_profile", "selector_registry"
+]
+
+# Modules that must not import the browser stack, but may be slower to import
+BROWSER_FREE_MODULES = ANALYSIS_MODULES + ["main"]
+
+# Top-level packages of the browser stack
+BROWSER_PACKAGES = {"selenium", "undetected_chromedriver"}
+
+# Default budget per module (milliseconds)
+DEFAULT_BUDGET_MS = 100.0
+
+# "import time: self [us] | cumulative | imported package"
+_IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)')
+
+
+def import_time(module: str) -> Tuple[float, Set[str]]:
+    """
+    Import a module in a fresh interpreter.
+
+    Returns:
+        Cumulative import time of the module in milliseconds, and the top-level
+        packages imported along with it
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=Path(__file__).parent, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+
+    cumulative = 0.0
+    packages = set()
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if not match:
+            continue
+        packages.add(match.group(4).split(".")[0])
+        if match.group(4) == module and not match.group(3):
+            cumulative = int(match.group(2)) / 1000
+    return cumulative, packages
+
+
+def run_benchmark(modules: List[str], repeat: int) -> Dict[str, Tuple[float, Set[str]]]:
+    """Best cumulative import time of each module over repeat runs, and the packages it imported."""
+    results = {}
+    for module in modules:
+        runs = [import_time(module) for _ in range(repeat)]
+        results[module] = (min(seconds for seconds, _ in runs), set().union(*(packages for _, packages in runs)))
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="fail if an analysis module takes longer to import")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh imports per module; the fastest counts")
+    args = parser.parse_args()
+
+    failures = []
+    for module in BROWSER_FREE_MODULES:
+        try:
+            milliseconds, packages = run_benchmark([module], args.repeat)[module]
+        except RuntimeError as e:
+            print(f"{module:22s} {str(e)}")
+            failures.append(module)
+            continue
+        browser = sorted(packages & BROWSER_PACKAGES)
+        over_budget = module in ANALYSIS_MODULES and milliseconds > args.budget_ms
+        flag = "  OVER BUDGET" if over_budget else ""
+        flag += f"  IMPORTS {', '.join(browser)}" if browser else ""
+        print(f"{module:22s} {milliseconds:8.1f} ms{flag}")
+        if over_budget or browser:
+            failures.append(module)
+
+    if failures:
+        print(f"FAILED: {', '.join(failures)} (budget {args.budget_ms:.0f} ms, browser stack must load lazily)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
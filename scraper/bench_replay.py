@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Scraper benchmark against replayed pages
+
+Replays the synthetic pages in scraper/fixtures (or a directory recorded with
+SCRAPER_RECORD_DIR) from a local server and times extract_job_count,
+extract_skills_from_page and a full scrape_country with a real browser,
+without any network access. The HTTP tier is disabled, so every page is
+loaded and read by the browser. Results can
+be saved as a baseline and compared on later runs to catch regressions.
+
+Usage:
+    python scraper/bench_replay.py [--country Canada] [--repeat 5]
+    python scraper/bench_replay.py --save baseline.json
+    python scraper/bench_replay.py --compare baseline.json [--tolerance 1.25]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import undetected_chromedriver as uc
+
+import main as scraper_main
+from main import COUNTRY_CONFIGS, GlassdoorScraper, ResultCache
+from replay import FIXTURES_DIR, ReplayServer, replay_country_configs
+
+
+def time_calls(func: Callable[[], object], repeat: int) -> List[float]:
+    """Call func repeatedly and return the wall time of each call in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run_benchmarks(country: str, repeat: int) -> Dict[str, Dict[str, float]]:
+    """Time the browser scraper stages on the replayed pages for one country."""
+    # The HTTP tier would answer every replayed page without the browser
+    scraper = GlassdoorScraper(http_first=False)
+    scraper.initialize()
+
+    try:
+        listings_url = f"{COUNTRY_CONFIGS[country]['base_url']}?fromAge=1"
+        scraper.load_search_page(listings_url)
+
+        def scrape_uncached():
+            # A fresh cache so every pass loads every page
+            scraper.cache = ResultCache()
+            scraper.scrape_country(country)
+
+        stages = {
+            "extract_job_count": time_calls(scraper.extract_job_count, repeat),
+            "extract_skills_from_page": time_calls(lambda: scraper.extract_skills_from_page(country), repeat),
+            "scrape_country": time_calls(scrape_uncached, repeat),
+        }
+    finally:
+        scraper.close()
+
+    return {
+        stage: {"min": min(timings), "median": statistics.median(timings)}
+        for stage, timings in stages.items()
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fixtures", default=str(FIXTURES_DIR), help="directory of pages to replay")
+    parser.add_argument("--country", default="Canada", help="country covered by the fixtures")
+    parser.add_argument("--repeat", type=int, default=5, help="timed calls per stage")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="fail if a stage's median is this many times slower than the baseline")
+    args = parser.parse_args()
+
+    if not uc.find_chrome_executable():
+        print("Chrome is not installed; the replay benchmark needs a browser")
+        return 1
+
+    # Human-like pauses would dominate the timings
+    scraper_main.HUMANIZE_BUDGET = 0
+
+    with ReplayServer(Path(args.fixtures)) as server:
+        COUNTRY_CONFIGS.update(replay_country_configs(COUNTRY_CONFIGS, server.origin))
+        results = run_benchmarks(args.country, args.repeat)
+
+    for stage, timing in results.items():
+        print(f"{stage:26s} min {timing['min']:8.3f}s   median {timing['median']:8.3f}s")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        regressions = [
+            stage for stage, timing in results.items()
+            if stage in baseline and timing["median"] > baseline[stage]["median"] * args.tolerance
+        ]
+        for stage in regressions:
+            print(f"REGRESSION: {stage} median {results[stage]['median']:.3f}s "
+                  f"vs baseline {baseline[stage]['median']:.3f}s")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
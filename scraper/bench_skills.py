@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Skill matcher micro-benchmark
+
+Compares the compiled single-scan matcher in skills.py against the previous
+per-skill regex loop on a corpus of long job descriptions and reports
+descriptions/sec for each. Both implementations must agree on every
+description, so the benchmark doubles as an equivalence check.
+
+Usage:
+    python scraper/bench_skills.py [--descriptions 300] [--words 800] [--corpus FILE]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from typing import Callable, List
+
+from skills import ALL_SKILLS, DEGREE_PATTERNS, extract_skills
+
+# Filler vocabulary for synthetic descriptions
+FILLER_WORDS = (
+    "we are looking for a motivated analyst to join our growing team you will work "
+    "closely with stakeholders across the business to turn data into insights build "
+    "reports and dashboards and support decisions with clear recommendations "
+    "experience with large datasets and strong ownership of deliverables required"
+).split()
+
+# Variants that exercise case folding, overlapping skills and degree phrases
+TRICKY_PHRASES = [
+    "bachelor's degree", "Master degree", "GitHub", "power bi", "Verbal communication",
+    "Degree in Computer Science", "ms excel", "R&D", "PhD", "msc", "scikit-learn"
+]
+
+
+def legacy_extract_skills(text: str) -> List[str]:
+    """The per-skill search loop extract_skills replaced, kept as the baseline."""
+    found_skills = []
+    for skill in ALL_SKILLS:
+        pattern = r'\b' + re.escape(skill) + r'\b'
+        if re.search(pattern, text, re.IGNORECASE):
+            found_skills.append(skill)
+
+    for compiled in DEGREE_PATTERNS:
+        if re.search(compiled.pattern, text):
+            match = re.search(compiled.pattern, text)
+            if match and match.group(0) not in found_skills:
+                found_skills.append(match.group(0))
+
+    return found_skills
+
+
+def build_corpus(descriptions: int, words: int, seed: int = 42) -> List[str]:
+    """Generate long, skill-dense job descriptions deterministically."""
+    rng = random.Random(seed)
+    vocabulary = FILLER_WORDS * 6 + ALL_SKILLS + TRICKY_PHRASES
+    return [" ".join(rng.choice(vocabulary) for _ in range(words)) for _ in range(descriptions)]
+
+
+def time_matcher(matcher: Callable[[str], List[str]], corpus: List[str], repeat: int) -> float:
+    """Return the best descriptions/sec over several passes."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in corpus:
+            matcher(text)
+        best = min(best, time.perf_counter() - start)
+    return len(corpus) / best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--descriptions", type=int, default=300, help="number of synthetic descriptions")
+    parser.add_argument("--words", type=int, default=800, help="words per synthetic description")
+    parser.add_argument("--corpus", help="text file with one description per blank-line separated block")
+    parser.add_argument("--repeat", type=int, default=3, help="passes per matcher; the best is reported")
+    args = parser.parse_args()
+
+    if args.corpus:
+        with open(args.corpus, encoding="utf-8") as f:
+            corpus = [block.strip() for block in f.read().split("\n\n") if block.strip()]
+    else:
+        corpus = build_corpus(args.descriptions, args.words)
+
+    mismatches = sum(1 for text in corpus if legacy_extract_skills(text) != extract_skills(text))
+    if mismatches:
+        print(f"ERROR: matchers disagree on {mismatches} of {len(corpus)} descriptions")
+        return 1
+
+    average_chars = sum(len(text) for text in corpus) / len(corpus)
+    print(f"Corpus: {len(corpus)} descriptions, {average_chars:.0f} chars on average")
+
+    before = time_matcher(legacy_extract_skills, corpus, args.repeat)
+    after = time_matcher(extract_skills, corpus, args.repeat)
+    print(f"per-skill regex loop: {before:10.1f} descriptions/sec")
+    print(f"compiled matcher:     {after:10.1f} descriptions/sec")
+    print(f"speedup:              {after / before:10.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Checkpoints of partially completed runs
+
+Every country of every role is written to the checkpoint file as soon as it
+is scraped, so a run that is killed halfway keeps the countries it finished.
+A later run in the same run window resumes from the checkpoint and only
+scrapes the remaining ones. A window starts at the scheduled run time and
+lasts a day, so a retry after midnight UTC still resumes the run it follows.
+All writes go to a temporary file that is renamed over the target, so readers
+never see a truncated file.
+"""
+
+import datetime
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("glassdoor_scraper")
+
+# Checkpoint of the current run, next to data.json
+CHECKPOINT_FILE = Path(__file__).parent.parent / "data" / "checkpoint.json"
+
+# UTC hour the daily run is scheduled at (the workflow's cron); run windows start then
+WINDOW_START_HOUR = int(os.environ.get('SCRAPER_WINDOW_START_HOUR', '23'))
+
+# Run window set by the caller, e.g. the workflow's scheduled run date
+RUN_WINDOW = os.environ.get('SCRAPER_RUN_WINDOW', '')
+
+
+def run_window(now: Optional[datetime.datetime] = None) -> str:
+    """
+    The window a run belongs to; runs in the same window can resume each other.
+
+    Named after the date of the scheduled run that opened it, so with the
+    default 23:00 UTC schedule a run at 01:00 UTC the next day is in the same
+    window.
+    """
+    if RUN_WINDOW:
+        return RUN_WINDOW
+    now = now or datetime.datetime.now(datetime.timezone.utc)
+    return (now - datetime.timedelta(hours=WINDOW_START_HOUR)).strftime("%Y-%m-%d")
+
+
+def write_json_atomic(path: Path, data: Any, **dump_options: Any) -> None:
+    """Write JSON to a temporary file next to path and rename it over path."""
+    path = Path(path)
+    os.makedirs(path.parent, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, **dump_options)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+class Checkpoint:
+    """
+    Countries completed per role in the current run window.
+
+    Safe to use from several browser workers.
+    """
+
+    def __init__(self, path: Path = CHECKPOINT_FILE, window: str = ""):
+        self.path = Path(path)
+        self.window = window or run_window()
+        self.roles: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Read countries completed earlier in this run window.
+
+        Returns:
+            Country data by role and country name; empty if there is no
+            checkpoint or it belongs to another window
+        """
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                checkpoint = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read checkpoint {self.path}, starting over: {str(e)}")
+            return {}
+
+        if checkpoint.get("window") != self.window:
+            logger.info(f"Ignoring checkpoint from run window {checkpoint.get('window')}")
+            return {}
+
+        with self._lock:
+            self.roles = checkpoint.get("roles", {})
+            return {role: dict(countries) for role, countries in self.roles.items()}
+
+    def save(self, role: str, country: str, country_data: Dict[str, Any]) -> None:
+        """Add a completed country of a role and rewrite the checkpoint."""
+        with self._lock:
+            self.roles.setdefault(role, {})[country] = country_data
+            write_json_atomic(self.path, {"window": self.window, "roles": self.roles},
+                              separators=(',', ':'))
+            done = sum(len(countries) for countries in self.roles.values())
+        logger.info(f"Checkpointed {role} in {country} ({done} done)")
+
+    def clear(self) -> None:
+        """Remove the checkpoint once the run's output is saved."""
+        with self._lock:
+            self.roles = {}
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Archive of raw job descriptions
+
+Every description the scraper extracts skills from is kept in a compressed,
+content-addressed archive next to data.json, so a change to the skill lists
+in skills.py can be applied to past listings without scraping Glassdoor
+again. Descriptions are keyed by a hash of their text and stored once, however
+many listings, countries or runs they appear in. Each run writes the
+descriptions that are new to the archive as one gzip segment of JSON lines;
+segments are never rewritten, and index.json maps every description to its
+segment. Listings carry the key of their description as "description_id".
+
+Run this module to re-extract the skills of every archived description and
+regenerate the listings' skills and the skill rankings:
+    python scraper/description_archive.py [--data data/data.json] [--workers 4]
+"""
+
+import argparse
+import datetime
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from analysis import apply_skills, extract_skills, save_data, write_artifacts
+from checkpoint import write_json_atomic
+from job_index import JobIndex, JOB_INDEX_FILE
+from near_duplicates import NearDuplicateIndex, NEAR_DUPLICATES_FILE
+
+logger = logging.getLogger("glassdoor_scraper")
+
+# Archive directory next to data.json; the workflow carries it between runs in the Actions cache
+ARCHIVE_DIR = Path(__file__).parent.parent / "data" / "descriptions"
+
+# Maps each description ID to the segment that holds it
+INDEX_FILE = "index.json"
+
+# Extension of the segment files
+SEGMENT_SUFFIX = ".jsonl.gz"
+
+# Published run output whose listings are re-extracted by default
+DATA_FILE = Path(__file__).parent.parent / "data" / "data.json"
+
+
+def description_id(text: str) -> str:
+    """Content hash of a description; descriptions differing only in whitespace share it."""
+    return hashlib.sha256(" ".join(text.split()).encode('utf-8')).hexdigest()[:16]
+
+
+class DescriptionArchive:
+    """
+    Raw descriptions by content hash.
+
+    Descriptions added during a run are held in memory and written as one new
+    segment by save(). Shared by all browser workers of a run; safe to use
+    from several threads.
+    """
+
+    def __init__(self, directory: Path = ARCHIVE_DIR):
+        self.directory = Path(directory)
+        # Description ID -> segment file name
+        self.index: Dict[str, str] = {}
+        # Descriptions added this run that are not in a segment yet
+        self.pending: Dict[str, str] = {}
+        self.known = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, directory: Path = ARCHIVE_DIR) -> "DescriptionArchive":
+        """Load the archive index, starting empty if it is missing or unreadable."""
+        archive = cls(directory)
+        try:
+            with open(archive.directory / INDEX_FILE, encoding='utf-8') as f:
+                archive.index = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read description archive index in {archive.directory}, "
+                           f"starting empty: {str(e)}")
+        return archive
+
+    def add(self, text: str) -> str:
+        """Archive a description unless it already is; returns its ID."""
+        key = description_id(text)
+        with self._lock:
+            if key in self.index or key in self.pending:
+                self.known += 1
+            else:
+                self.pending[key] = text
+        return key
+
+    def save(self) -> Optional[Path]:
+        """
+        Write the descriptions added this run as a new segment and update the index.
+
+        Returns:
+            Path of the new segment, or None if there was nothing new
+        """
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            if not self.pending:
+                # The workflow commits the directory, so it has to exist after the first run
+                if not (self.directory / INDEX_FILE).exists():
+                    write_json_atomic(self.directory / INDEX_FILE, self.index)
+                return None
+
+            stamp = datetime.datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+            segment = self.directory / f"{stamp}{SEGMENT_SUFFIX}"
+            suffix = 1
+            while segment.exists():
+                suffix += 1
+                segment = self.directory / f"{stamp}-{suffix}{SEGMENT_SUFFIX}"
+
+            lines = "".join(
+                json.dumps({"id": key, "text": text}, separators=(',', ':'), ensure_ascii=False) + "\n"
+                for key, text in self.pending.items()
+            )
+            # A fixed mtime keeps the bytes of a segment reproducible
+            temp_path = segment.with_name(f".{segment.name}.tmp")
+            temp_path.write_bytes(gzip.compress(lines.encode('utf-8'), mtime=0))
+            os.replace(temp_path, segment)
+
+            # The index is written last so it never points at a missing segment
+            for key in self.pending:
+                self.index[key] = segment.name
+            write_json_atomic(self.directory / INDEX_FILE, self.index, separators=(',', ':'), sort_keys=True)
+            self.pending = {}
+        return segment
+
+    def descriptions(self) -> Iterator[Tuple[str, str]]:
+        """Yield (ID, text) of every archived description, one segment at a time."""
+        with self._lock:
+            segments = sorted(set(self.index.values()))
+        for name in segments:
+            try:
+                with gzip.open(self.directory / name, 'rt', encoding='utf-8') as f:
+                    for line in f:
+                        record = json.loads(line)
+                        yield record["id"], record["text"]
+            except (OSError, EOFError, ValueError) as e:
+                logger.warning(f"Could not read description segment {name}, skipping it: {str(e)}")
+
+    def summary(self) -> Dict[str, int]:
+        """Descriptions already archived and new this run, and the size of the archive."""
+        with self._lock:
+            return {"known": self.known, "new": len(self.pending), "archived": len(self.index) + len(self.pending)}
+
+
+def reextract_skills(archive: DescriptionArchive, workers: Optional[int] = None) -> Dict[str, List[str]]:
+    """
+    Run skill extraction over every archived description in parallel processes.
+
+    Returns:
+        Skills by description ID
+    """
+    ids: List[str] = []
+    texts: List[str] = []
+    for key, text in archive.descriptions():
+        ids.append(key)
+        texts.append(text)
+    if not texts:
+        return {}
+
+    workers = workers or os.cpu_count() or 1
+    # Large chunks keep the pickling overhead per description small
+    chunksize = max(1, len(texts) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(ids, pool.map(extract_skills, texts, chunksize=chunksize)))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Re-extract skills from archived job descriptions")
+    parser.add_argument("--archive", default=str(ARCHIVE_DIR), help="description archive directory")
+    parser.add_argument("--data", default=str(DATA_FILE), help="run output to update")
+    parser.add_argument("--job-index", default=str(JOB_INDEX_FILE),
+                        help="seen-jobs index whose skills are updated too")
+    parser.add_argument("--near-duplicates", default=str(NEAR_DUPLICATES_FILE),
+                        help="near-duplicate postings whose skills are updated too")
+    parser.add_argument("--workers", type=int, help="extraction processes (default: one per CPU)")
+    parser.add_argument("--no-artifacts", action="store_true",
+                        help="do not rewrite the dashboard manifest and detail files next to the data file")
+    args = parser.parse_args()
+
+    archive = DescriptionArchive.load(Path(args.archive))
+    if not archive.index:
+        print(f"No archived descriptions in {args.archive}")
+        return 1
+
+    start = time.perf_counter()
+    skills_by_id = reextract_skills(archive, args.workers)
+    print(f"Extracted skills from {len(skills_by_id)} descriptions in {time.perf_counter() - start:.1f}s")
+
+    data_path = Path(args.data)
+    with open(data_path, encoding='utf-8') as f:
+        data = json.load(f)
+    counts = apply_skills(data, skills_by_id)
+    save_data(data, data_path)
+    print(f"Updated {counts['updated']} listings in {data_path}; "
+          f"{counts['unarchived']} without an archived description kept their skills")
+
+    if not args.no_artifacts:
+        write_artifacts(data, data_path.parent)
+
+    # Otherwise the next run would bring back the old skills of known jobs
+    job_index = JobIndex.load(Path(args.job_index))
+    updated = job_index.update_skills(skills_by_id)
+    if updated:
+        job_index.save()
+    print(f"Updated {updated} jobs in {args.job_index}")
+
+    near_duplicates = NearDuplicateIndex.load(Path(args.near_duplicates))
+    updated = near_duplicates.update_skills(skills_by_id)
+    if updated:
+        near_duplicates.save()
+    print(f"Updated {updated} postings in {args.near_duplicates}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+History of job counts across runs
+
+Every run appends its per-country counts to a SQLite table keyed by
+(date, country), so trends survive data.json being overwritten. From that
+table, export_trends() writes one small columnar JSON file per country that
+the dashboard fetches only for the country on screen.
+"""
+
+import datetime
+import json
+import logging
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("glassdoor_scraper")
+
+# History database, committed next to data.json so it survives between CI runs
+HISTORY_DB = Path(__file__).parent.parent / "data" / "history.sqlite"
+
+# Per-country trend files read by js/app.js
+TRENDS_DIR = Path(__file__).parent.parent / "data" / "trends"
+
+# Counts tracked over time, in column order
+COUNT_FIELDS = ["last_24h", "last_7d", "last_30d", "remote", "on_site"]
+
+# Days of history exported to the trend files
+TREND_DAYS = 365
+
+
+def country_slug(country: str) -> str:
+    """File name stem for a country, e.g. "United Arab Emirates" -> "united-arab-emirates"."""
+    return re.sub(r'[^a-z0-9]+', '-', country.lower()).strip('-')
+
+
+class CountHistory:
+    """
+    Daily job counts per country, stored in SQLite.
+
+    One row per (date, country); a second run on the same day replaces the
+    first. Missing counts (-1 in data.json) and counts carried forward from
+    an earlier run are stored as NULL, so only observed values are kept.
+
+    Usage:
+        with CountHistory() as history:
+            history.record_run(data)
+            history.export_trends()
+    """
+
+    def __init__(self, path: Path = HISTORY_DB):
+        self.path = Path(path)
+        os.makedirs(self.path.parent, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        columns = ", ".join(f"{field} INTEGER" for field in COUNT_FIELDS)
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS counts (date TEXT NOT NULL, country TEXT NOT NULL, {columns}, "
+            f"PRIMARY KEY (date, country)) WITHOUT ROWID"
+        )
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "CountHistory":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def record_run(self, data: Dict[str, Any], date: Optional[str] = None) -> int:
+        """
+        Append the counts of a run.
+
+        Args:
+            data: Run output in the data.json format
+            date: Day to file the counts under (YYYY-MM-DD), defaults to the
+                day of data["last_updated"]
+
+        Returns:
+            Number of countries recorded
+        """
+        date = date or data.get("last_updated", "")[:10] or datetime.datetime.utcnow().strftime("%Y-%m-%d")
+
+        rows = []
+        for country, country_data in data.get("countries", {}).items():
+            # Counts carried forward from an earlier run were not observed today
+            stale = country_data.get("stale", {})
+            counts = [-1 if field in stale else country_data.get(field, -1) for field in COUNT_FIELDS]
+            rows.append([date, country] + [count if count >= 0 else None for count in counts])
+
+        placeholders = ", ".join("?" * (len(COUNT_FIELDS) + 2))
+        with self.conn:
+            self.conn.executemany(f"INSERT OR REPLACE INTO counts VALUES ({placeholders})", rows)
+        return len(rows)
+
+    def series(self, country: str, since: str = "") -> List[tuple]:
+        """Rows of (date, *COUNT_FIELDS) for a country from the given date on, oldest first."""
+        return self.conn.execute(
+            f"SELECT date, {', '.join(COUNT_FIELDS)} FROM counts WHERE country = ? AND date >= ? ORDER BY date",
+            (country, since)
+        ).fetchall()
+
+    def latest(self, country: str) -> Dict[str, Tuple[str, int]]:
+        """Last observed value of each count of a country, as field -> (date, value)."""
+        latest = {}
+        for field in COUNT_FIELDS:
+            row = self.conn.execute(
+                f"SELECT date, {field} FROM counts WHERE country = ? AND {field} IS NOT NULL ORDER BY date DESC LIMIT 1",
+                (country,)
+            ).fetchone()
+            if row:
+                latest[field] = row
+        return latest
+
+    def countries(self) -> List[str]:
+        return [row[0] for row in self.conn.execute("SELECT DISTINCT country FROM counts ORDER BY country")]
+
+    def export_trends(self, directory: Path = TRENDS_DIR, days: int = TREND_DAYS) -> List[Path]:
+        """
+        Write one trend file per country covering the last days of history,
+        counted back from the most recent run.
+
+        Each file holds a start date and one array per count with a slot per
+        day (null where a day is missing), as minified JSON:
+        {"country": ..., "start": "YYYY-MM-DD", "last_24h": [...], ...}
+
+        Returns:
+            Paths of the written files
+        """
+        directory = Path(directory)
+        os.makedirs(directory, exist_ok=True)
+        latest = self.conn.execute("SELECT MAX(date) FROM counts").fetchone()[0]
+        if latest is None:
+            return []
+        since = (datetime.date.fromisoformat(latest) - datetime.timedelta(days=days - 1)).isoformat()
+
+        written = []
+        for country in self.countries():
+            rows = self.series(country, since)
+            if not rows:
+                continue
+
+            start = datetime.date.fromisoformat(rows[0][0])
+            span = (datetime.date.fromisoformat(rows[-1][0]) - start).days + 1
+            trend: Dict[str, Any] = {"country": country, "start": start.isoformat()}
+            for field in COUNT_FIELDS:
+                trend[field] = [None] * span
+            for row in rows:
+                slot = (datetime.date.fromisoformat(row[0]) - start).days
+                for field, value in zip(COUNT_FIELDS, row[1:]):
+                    trend[field][slot] = value
+
+            path = directory / f"{country_slug(country)}.json"
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(trend, f, separators=(',', ':'))
+            written.append(path)
+
+        logger.info(f"Exported {len(written)} trend files to {directory}")
+        return written
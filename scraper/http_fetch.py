@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+HTTP fast path for Glassdoor search pages
+
+Fetches search result pages with a pooled requests.Session and parses job
+counts and job cards with BeautifulSoup, or from the JSON state embedded in
+the page. Callers fall back to the browser whenever fetch() reports a
+challenge page or the parsers find nothing.
+"""
+
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urljoin
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from page_selectors import (
+    JOB_COUNT_SELECTORS, JOB_CARD_SELECTORS, CARD_TITLE_SELECTORS,
+    CARD_COMPANY_SELECTORS, CARD_DESCRIPTION_SELECTORS, JOB_TITLE_SELECTORS,
+    JOB_COMPANY_SELECTORS, JOB_DESCRIPTION_SELECTORS, NEXT_PAGE_SELECTORS
+)
+from replay import record_page
+
+logger = logging.getLogger("glassdoor_scraper")
+
+# Headers of a regular desktop Chrome so the plain GET is served the normal page
+DEFAULT_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Seconds to wait for a response before giving the page to the browser
+REQUEST_TIMEOUT = 15
+
+# Status codes and page markers of Cloudflare and other bot challenges
+CHALLENGE_STATUS_CODES = {403, 429, 503}
+CHALLENGE_MARKERS = ["Just a moment", "cf-browser-verification", "challenge-platform", "cf_chl_opt"]
+
+
+# Paths of the job count in the JSON state embedded by Glassdoor's frontend. Only
+# these are read: counts nested elsewhere belong to other parts of the page
+EMBEDDED_COUNT_PATHS = [
+    ("props", "pageProps", "totalJobsCount"),
+    ("props", "pageProps", "jobListings", "totalJobsCount"),
+    ("props", "pageProps", "searchResultsData", "jobListings", "totalJobsCount"),
+]
+
+# Job description fields (HTML) in the JSON state of a job detail page
+EMBEDDED_DESCRIPTION_KEYS = ["jobDescription", "description"]
+
+
+def job_count_pattern(role: str = "") -> str:
+    """
+    Regex of a job count like "123 jobs" or "123 <role> jobs", with the count as group 1.
+
+    Valid in Python and JavaScript alike, so the browser scripts use it too.
+    """
+    words = r'\s+'.join(re.escape(word) for word in role.split())
+    role_words = rf'(?:{words}\s+)?' if words else ''
+    return rf'(\d[\d,]*)\s+{role_words}jobs'
+
+
+class HttpFetcher:
+    """Fetch and parse search pages over plain HTTP without a browser."""
+
+    def __init__(self, pool_size: int = 4, record_dir: Optional[str] = None):
+        # Pages served over HTTP are recorded too, so a recorded run replays in full
+        self.record_dir = Path(record_dir) if record_dir else None
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def fetch(self, url: str) -> Optional[str]:
+        """
+        GET a page.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            The page HTML, or None on errors and challenge pages
+        """
+        try:
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            logger.info(f"HTTP fetch failed for {url}: {str(e)}")
+            return None
+
+        if response.status_code in CHALLENGE_STATUS_CODES or is_challenge_page(response.text):
+            logger.info(f"HTTP fetch hit a challenge page ({response.status_code}) for {url}")
+            return None
+
+        if response.status_code != 200:
+            logger.info(f"HTTP fetch returned {response.status_code} for {url}")
+            return None
+
+        if self.record_dir is not None:
+            try:
+                record_page(self.record_dir, url, response.text)
+            except OSError as e:
+                logger.warning(f"Could not record page {url}: {str(e)}")
+
+        return response.text
+
+
+def is_challenge_page(html: str) -> bool:
+    """Return True if the HTML is a Cloudflare or bot challenge page."""
+    return any(marker in html for marker in CHALLENGE_MARKERS)
+
+
+def _find_key(data: Any, keys: List[str], kind: type = int) -> Any:
+    """Depth-first search of nested JSON for the first value of the given type under any of the keys."""
+    if isinstance(data, dict):
+        for key in keys:
+            if isinstance(data.get(key), kind) and not isinstance(data.get(key), bool):
+                return data[key]
+        children = data.values()
+    elif isinstance(data, list):
+        children = data
+    else:
+        return None
+
+    for child in children:
+        found = _find_key(child, keys, kind)
+        if found is not None:
+            return found
+    return None
+
+
+def _value_at(data: Any, path: tuple) -> Optional[int]:
+    """Return the integer at the key path of nested JSON, or None."""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    if isinstance(data, int) and not isinstance(data, bool):
+        return data
+    return None
+
+
+def parse_search_page(html: str, base_url: str = "", limit: int = 20, role: str = "") -> Dict[str, Any]:
+    """
+    Parse everything the scraper reads from a search results page in one pass.
+
+    The HTML is parsed once and can be dropped afterwards; only the parsed
+    values need to be kept.
+
+    Args:
+        html: Page HTML
+        base_url: URL the page was fetched from, used to resolve relative links
+        limit: Maximum number of cards to return
+        role: Role searched for, which the job count text may name
+
+    Returns:
+        "count" as parse_job_count(), "cards" as parse_job_cards() and
+        "next", the URL of the next result page ("" on the last page)
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    parsed = {
+        "count": _job_count(soup, role),
+        "cards": _job_cards(soup, base_url, limit),
+        "next": _next_page(soup, base_url)
+    }
+    # The tree is full of reference cycles; break them so it is freed now
+    # rather than at the next garbage collection
+    soup.decompose()
+    return parsed
+
+
+def parse_job_count(html: str, role: str = "") -> Optional[int]:
+    """
+    Parse the job count from a search results page.
+
+    Tries the known paths of the embedded JSON state first, then the count
+    selectors, then the page title. The count text may name the role searched for, e.g. "123
+    Data Analyst jobs".
+
+    Returns:
+        The job count, or None if the page does not show one
+    """
+    return _job_count(BeautifulSoup(html, "html.parser"), role)
+
+
+def _job_count(soup: BeautifulSoup, role: str = "") -> Optional[int]:
+    # 1. Embedded JSON state (Next.js / Apollo)
+    for state in _embedded_json(soup):
+        for path in EMBEDDED_COUNT_PATHS:
+            count = _value_at(state, path)
+            if count is not None:
+                return count
+
+    # 2. Selectors that typically contain job counts
+    count_text = re.compile(job_count_pattern(role), re.IGNORECASE)
+    for selector in JOB_COUNT_SELECTORS:
+        for element in soup.select(selector):
+            match = count_text.search(element.get_text(" ", strip=True))
+            if match:
+                return int(match.group(1).replace(',', ''))
+
+    # 3. Page title, only with the count right before "jobs"; other numbers
+    # in the title, like a year, are not counts
+    title = soup.title.get_text(strip=True) if soup.title else ""
+    match = count_text.search(title)
+    if match:
+        return int(match.group(1).replace(',', ''))
+
+    return None
+
+
+def _embedded_json(soup: BeautifulSoup) -> List[Any]:
+    """Return the parsed JSON state blocks embedded in the page."""
+    blocks = []
+    for script in soup.find_all("script", type="application/json"):
+        try:
+            blocks.append(json.loads(script.string or ""))
+        except ValueError:
+            continue
+    return blocks
+
+
+def _first_text(root, selectors: List[str]) -> str:
+    """Return the first non-empty text matched by the selectors."""
+    for selector in selectors:
+        for element in root.select(selector):
+            text = element.get_text(" ", strip=True)
+            if text:
+                return text
+    return ""
+
+
+def parse_job_cards(html: str, base_url: str = "", limit: int = 20) -> List[Dict[str, str]]:
+    """
+    Parse job cards from a search results page.
+
+    Args:
+        html: Page HTML
+        base_url: URL the page was fetched from, used to resolve relative links
+        limit: Maximum number of cards to return
+
+    Returns:
+        Up to limit cards with title, company, description and link
+        (empty strings where a field is missing)
+    """
+    return _job_cards(BeautifulSoup(html, "html.parser"), base_url, limit)
+
+
+def _job_cards(soup: BeautifulSoup, base_url: str, limit: int) -> List[Dict[str, str]]:
+    for selector in JOB_CARD_SELECTORS:
+        cards = soup.select(selector)
+        if cards:
+            break
+    else:
+        return []
+
+    parsed = []
+    for card in cards[:limit]:
+        link = ""
+        for anchor in card.find_all("a", href=True):
+            href = anchor["href"]
+            if "job-details" in href or "Job-View" in href or "/job/" in href:
+                link = urljoin(base_url, href)
+                break
+
+        parsed.append({
+            "title": _first_text(card, CARD_TITLE_SELECTORS),
+            "company": _first_text(card, CARD_COMPANY_SELECTORS),
+            "description": _first_text(card, CARD_DESCRIPTION_SELECTORS),
+            "link": link,
+        })
+
+    return parsed
+
+
+def _next_page(soup: BeautifulSoup, base_url: str) -> str:
+    for selector in NEXT_PAGE_SELECTORS:
+        for anchor in soup.select(selector):
+            if anchor.get("href"):
+                return urljoin(base_url, anchor["href"])
+    return ""
+
+
+def parse_job_detail(html: str) -> Dict[str, str]:
+    """
+    Parse a job detail page.
+
+    Returns:
+        Title, company and description (empty strings where a field is missing)
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    description = _first_text(soup, JOB_DESCRIPTION_SELECTORS)
+    if not description:
+        for state in _embedded_json(soup):
+            embedded = _find_key(state, EMBEDDED_DESCRIPTION_KEYS, str)
+            if embedded:
+                description = BeautifulSoup(embedded, "html.parser").get_text(" ", strip=True)
+                break
+
+    return {
+        "title": _first_text(soup, JOB_TITLE_SELECTORS),
+        "company": _first_text(soup, JOB_COMPANY_SELECTORS),
+        "description": description,
+    }
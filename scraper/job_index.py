@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Persistent index of job listings seen in earlier runs
+
+Stores the skills extracted for every job together with when it was first and
+last seen, keyed by a stable job ID. Runs consult the index so only jobs that
+are new since the last run have their descriptions fetched and parsed.
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from checkpoint import write_json_atomic
+
+logger = logging.getLogger("glassdoor_scraper")
+
+# Index file, committed next to data.json so it survives between CI runs
+JOB_INDEX_FILE = Path(__file__).parent.parent / "data" / "job_index.json"
+
+# Jobs not seen for this many days are dropped from the index
+RETENTION_DAYS = 60
+
+# Placeholder used when a card has no company; a card without a title gets the
+# role being scraped as its title, which callers flag with placeholder_title.
+# Neither identifies anything
+DEFAULT_COMPANY = "Unknown Company"
+
+# Listing fields stored only when the listing has them: the key of its archived
+# description and the near-duplicate posting it belongs to
+OPTIONAL_FIELDS = ("description_id", "posting_id")
+
+# Glassdoor job listing IDs in detail links, e.g. "?jl=1009123456789" or "jobListingId=..."
+_LISTING_ID = re.compile(r'(?:[?&]jl=|jobListingId=)(\d+)')
+
+
+def job_id(title: str, company: str, link: str = "", placeholder_title: bool = False) -> Optional[str]:
+    """
+    Return a stable ID for a job listing.
+
+    The listing ID in the job link is preferred; without one, a hash of title
+    and company is used. Returns None when neither identifies the job, e.g. a
+    card with no link and only the default company, or whose title is a
+    placeholder (placeholder_title) rather than read from the page.
+    """
+    match = _LISTING_ID.search(link or "")
+    if match:
+        return f"jl:{match.group(1)}"
+
+    if not title or not company or placeholder_title or company == DEFAULT_COMPANY:
+        return None
+
+    digest = hashlib.sha1(f"{title.strip().lower()}|{company.strip().lower()}".encode('utf-8'))
+    return f"h:{digest.hexdigest()[:16]}"
+
+
+def _utc_now() -> str:
+    return datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class JobIndex:
+    """
+    Seen-jobs index shared by all browser workers of a run.
+
+    Each entry holds title, company, skills, link, any OPTIONAL_FIELDS and
+    first_seen / last_seen timestamps. Safe to use from several threads.
+    """
+
+    def __init__(self, path: Path = JOB_INDEX_FILE):
+        self.path = Path(path)
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.known = 0
+        self.new = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path = JOB_INDEX_FILE) -> "JobIndex":
+        """Load the index from disk, starting empty if it is missing or unreadable."""
+        index = cls(path)
+        try:
+            with open(index.path, encoding='utf-8') as f:
+                index.jobs = json.load(f).get("jobs", {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read job index {index.path}, starting empty: {str(e)}")
+        return index
+
+    def lookup(self, title: str, company: str, link: str = "",
+               placeholder_title: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Return the listing of a job seen in an earlier run and mark it as seen now.
+
+        placeholder_title marks a title that stands in for a missing one
+        (see job_id).
+
+        Returns:
+            A job listing (title, company, skills, link and any
+            OPTIONAL_FIELDS), or None for new, unidentifiable or skill-less
+            jobs
+        """
+        key = job_id(title, company, link, placeholder_title)
+        if key is None:
+            return None
+
+        with self._lock:
+            entry = self.jobs.get(key)
+            if entry is None or not entry["skills"]:
+                # Jobs stored without skills get another chance at a description
+                return None
+            entry["last_seen"] = _utc_now()
+            self.known += 1
+            listing = {field: entry[field] for field in ("title", "company", "skills", "link")}
+            listing.update({field: entry[field] for field in OPTIONAL_FIELDS if entry.get(field)})
+            return listing
+
+    def record(self, listing: Dict[str, Any], placeholder_title: bool = False) -> None:
+        """Add or refresh a job listing; placeholder_title as in lookup()."""
+        key = job_id(listing["title"], listing["company"], listing.get("link", ""), placeholder_title)
+        if key is None:
+            return
+
+        now = _utc_now()
+        with self._lock:
+            entry = self.jobs.get(key)
+            if entry is None:
+                self.new += 1
+                entry = self.jobs[key] = {"first_seen": now}
+            entry.update({
+                "title": listing["title"],
+                "company": listing["company"],
+                "skills": listing["skills"],
+                "link": listing.get("link", ""),
+                "last_seen": now
+            })
+            entry.update({field: listing[field] for field in OPTIONAL_FIELDS if listing.get(field)})
+
+    def update_skills(self, skills_by_description: Dict[str, List[str]]) -> int:
+        """Replace the skills of jobs whose description was re-extracted; returns how many changed."""
+        updated = 0
+        with self._lock:
+            for entry in self.jobs.values():
+                skills = skills_by_description.get(entry.get("description_id", ""))
+                if skills is not None and skills != entry["skills"]:
+                    entry["skills"] = skills
+                    updated += 1
+        return updated
+
+    def prune(self, retention_days: int = RETENTION_DAYS) -> int:
+        """Drop jobs not seen for retention_days; returns how many were removed."""
+        cutoff = (datetime.datetime.utcnow() - datetime.timedelta(days=retention_days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        with self._lock:
+            stale = [key for key, entry in self.jobs.items() if entry["last_seen"] < cutoff]
+            for key in stale:
+                del self.jobs[key]
+        return len(stale)
+
+    def save(self) -> None:
+        """Write the index to disk."""
+        with self._lock:
+            write_json_atomic(self.path, {"jobs": self.jobs}, separators=(',', ':'), sort_keys=True)
+
+    def summary(self) -> Dict[str, int]:
+        """Known and new jobs this run, and the size of the index."""
+        with self._lock:
+            return {"known": self.known, "new": self.new, "indexed": len(self.jobs)}
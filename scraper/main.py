@@ -17,27 +17,75 @@ import datetime
 import re
 import random
 import time
+import queue
+import threading
+import itertools
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-
-# Use undetected-chromedriver which is better at bypassing Cloudflare protections
-import undetected_chromedriver as uc
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("scraper/scraper.log"),
-        logging.StreamHandler()
-    ]
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+
+from analysis import extract_skills, build_output, save_data, write_artifacts
+from http_fetch import HttpFetcher, job_count_pattern, parse_search_page, parse_job_detail
+from job_index import JobIndex, JOB_INDEX_FILE
+from description_archive import DescriptionArchive, ARCHIVE_DIR
+from near_duplicates import NearDuplicateIndex, NEAR_DUPLICATES_FILE
+from history import CountHistory
+from scheduler import Scheduler
+from queries import query_configs, plan_pages, plan_queries, plan_tasks
+from checkpoint import Checkpoint, CHECKPOINT_FILE
+from run_profile import RunProfile, PROFILE_FILE, profiled, rss_mb
+from selector_registry import SelectorRegistry, SELECTOR_STATS_FILE
+from navigation import (
+    RetryBudget, classify_exception, backoff_delay, CLOUDFLARE, SELECTOR_MISS, DRIVER_CRASH
+)
+from replay import ReplayServer, record_page, replay_country_configs
+from page_selectors import (
+    JOB_COUNT_SELECTORS, JOB_CARD_SELECTORS, CARD_TITLE_SELECTORS, CARD_COMPANY_SELECTORS,
+    CARD_DESCRIPTION_SELECTORS, EXPANDED_DESCRIPTION_SELECTORS, JOB_TITLE_SELECTORS,
+    JOB_COMPANY_SELECTORS, JOB_DESCRIPTION_SELECTORS, POPUP_SELECTORS, POPUP_BUTTON_TEXTS,
+    POPUP_CONTAINER_SELECTORS, POPUP_PROTECTED_SELECTORS, READY_SELECTORS, NEXT_PAGE_SELECTORS,
+    LOAD_MORE_SELECTORS, NO_RESULTS_SELECTORS, NO_RESULTS_TEXTS
 )
+
+# The browser stack is only imported once a browser starts (load_browser_modules),
+# so importing this module for its configuration or save_data stays cheap
+uc = None
+By = None
+WebDriverWait = None
+EC = None
+TimeoutException = None
+NoSuchElementException = None
+
 logger = logging.getLogger("glassdoor_scraper")
 
+# Log file of scraper runs, next to this file whatever the working directory
+LOG_FILE = Path(__file__).parent / "scraper.log"
+
+
+def setup_logging(log_file: Path = LOG_FILE) -> None:
+    """Log to the console and to log_file; called by the entry points, never at import."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_file),
+            logging.StreamHandler()
+        ]
+    )
+
+
+def load_browser_modules() -> None:
+    """Import undetected-chromedriver and selenium into this module on first use."""
+    global uc, By, WebDriverWait, EC, TimeoutException, NoSuchElementException
+    if uc is not None:
+        return
+    # Use undetected-chromedriver which is better at bypassing Cloudflare protections
+    import undetected_chromedriver as uc
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+
+
 # Constants
 OUTPUT_FILE = Path(__file__).parent.parent / "data" / "data.json"
 COUNTRIES = ["Canada", "Ireland", "Portugal", "United Arab Emirates", "Germany"]
@@ -50,53 +98,503 @@ TIME_PERIODS = {
     "last_30d": 30
 }
 
-# Country specific parameters with correct URLs
-COUNTRY_CONFIGS = {
-    "Canada": {
-        "base_url": "https://www.glassdoor.com/Job/canada-data-analyst-jobs-SRCH_IL.0,6_IN3_KO7,19.htm",
-        "remote_url": "https://www.glassdoor.com/Job/canada-remote-data-analyst-jobs-SRCH_IL.0,6_IN3_KO7,27.htm",
-        "avg_count": 500,
-        "remote_ratio": 0.3
-    },
-    "Ireland": {
-        "base_url": "https://www.glassdoor.com/Job/ireland-data-analyst-jobs-SRCH_IL.0,7_IN70_KO8,20.htm",
-        "remote_url": "https://www.glassdoor.com/Job/ireland-remote-data-analyst-jobs-SRCH_IL.0,7_IN70_KO8,28.htm",
-        "avg_count": 120,
-        "remote_ratio": 0.4
-    },
-    "Portugal": {
-        "base_url": "https://www.glassdoor.com/Job/portugal-data-analyst-jobs-SRCH_IL.0,8_IN195_KO9,21.htm",
-        "remote_url": "https://www.glassdoor.com/Job/portugal-remote-data-analyst-jobs-SRCH_IL.0,8_IN195_KO9,29.htm",
-        "avg_count": 90,
-        "remote_ratio": 0.5
-    },
-    "United Arab Emirates": {
-        "base_url": "https://www.glassdoor.com/Job/united-arab-emirates-data-analyst-jobs-SRCH_IL.0,20_IN6_KO21,33.htm",
-        "remote_url": "https://www.glassdoor.com/Job/united-arab-emirates-remote-data-analyst-jobs-SRCH_IL.0,20_IN6_KO21,41.htm",
-        "avg_count": 150,
-        "remote_ratio": 0.2
-    },
-    "Germany": {
-        "base_url": "https://www.glassdoor.com/Job/germany-data-analyst-jobs-SRCH_IL.0,7_IN96_KO8,20.htm",
-        "remote_url": "https://www.glassdoor.com/Job/germany-remote-data-analyst-jobs-SRCH_IL.0,7_IN96_KO8,28.htm",
-        "avg_count": 450,
-        "remote_ratio": 0.35
-    }
-}
+# Extra roles scraped alongside JOB_TITLE, comma-separated (e.g. "Data Engineer,BI Analyst")
+EXTRA_ROLES = [role.strip() for role in os.environ.get('SCRAPER_EXTRA_ROLES', '').split(',') if role.strip()]
+
+# Search URLs per role and country, built from the Glassdoor locations in queries.py
+QUERY_CONFIGS = query_configs([JOB_TITLE] + EXTRA_ROLES, COUNTRIES)
+
+# Search URLs of JOB_TITLE; the same dicts as in QUERY_CONFIGS, so overriding one overrides both
+COUNTRY_CONFIGS = QUERY_CONFIGS[JOB_TITLE]
 
 # Check if running in GitHub Actions
 is_github_actions = os.environ.get('GITHUB_ACTIONS') == 'true'
 
+# Read pages with one injected script per page instead of one WebDriver
+# round trip per find_elements / is_displayed / text call ("0" disables)
+PROBE_MODE = os.environ.get('SCRAPER_PROBE_MODE', '1') != '0'
+
+# Collects everything the scraper reads from a page in a single execute_script
+# call. Visibility and text follow WebDriver's is_displayed() and .text closely
+# enough for the selectors in page_selectors. Popup targets come back as
+# WebElements so they can be clicked without looking them up again.
+PAGE_PROBE_SCRIPT = """
+const opts = arguments[0];
+const visible = el => {
+    if (!el.getClientRects().length) return false;
+    const style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+};
+const query = (root, selector) => {
+    try { return Array.from(root.querySelectorAll(selector)); } catch (e) { return []; }
+};
+const firstText = (root, selector) => {
+    for (const el of query(root, selector)) {
+        const text = visible(el) ? (el.innerText || '').trim() : '';
+        if (text) return text;
+    }
+    return '';
+};
+const textsFor = (root, selectors) => {
+    const texts = {};
+    for (const selector of selectors) texts[selector] = firstText(root, selector);
+    return texts;
+};
+
+const jobCountPattern = new RegExp(opts.jobCountPattern, 'i');
+let jobCountText = '';
+let jobCountSelector = '';
+search: for (const selector of opts.countSelectors) {
+    for (const el of query(document, selector)) {
+        if (visible(el) && jobCountPattern.test(el.innerText || '')) {
+            jobCountText = el.innerText;
+            jobCountSelector = selector;
+            break search;
+        }
+    }
+}
+
+const popupTargets = [];
+const popupLabels = [];
+for (const selector of opts.popupSelectors) {
+    for (const el of query(document, selector)) {
+        if (visible(el) && !popupTargets.includes(el)) {
+            popupTargets.push(el);
+            popupLabels.push(selector);
+        }
+    }
+}
+for (const el of query(document, 'button')) {
+    const label = opts.popupTexts.find(text => (el.textContent || '').includes(text));
+    if (label && visible(el) && !popupTargets.includes(el)) {
+        popupTargets.push(el);
+        popupLabels.push(label);
+    }
+}
+
+let cardSelector = '';
+let cardNodes = [];
+for (const selector of opts.cardSelectors) {
+    cardNodes = query(document, selector);
+    if (cardNodes.length) {
+        cardSelector = selector;
+        break;
+    }
+}
+const cards = cardNodes.slice(opts.cardOffset, opts.cardOffset + opts.maxCards).map(card => {
+    const link = query(card, 'a').map(a => a.href || '').find(
+        href => href.includes('job-details') || href.includes('Job-View') || href.includes('/job/')
+    ) || '';
+    return {texts: textsFor(card, opts.cardFieldSelectors), link: link};
+});
+
+const firstVisible = selectors => {
+    for (const selector of selectors) {
+        const el = query(document, selector).find(visible);
+        if (el) return el;
+    }
+    return null;
+};
+const nextLink = firstVisible(opts.nextPageSelectors);
+
+return {
+    title: document.title,
+    url: window.location.href,
+    jobCountText: jobCountText,
+    jobCountSelector: jobCountSelector,
+    popupTargets: popupTargets,
+    popupLabels: popupLabels,
+    cardSelector: cardSelector,
+    cardCount: cardNodes.length,
+    cards: cards,
+    nextPage: nextLink ? (nextLink.href || '') : '',
+    loadMore: firstVisible(opts.loadMoreSelectors),
+    heapBytes: performance.memory ? performance.memory.usedJSHeapSize : null,
+    texts: textsFor(document, opts.pageSelectors)
+};
+"""
+
+# Searches the page source for the first matching pattern inside the browser,
+# so only the match crosses the WebDriver connection instead of the whole page
+PAGE_SEARCH_SCRIPT = """
+const html = document.documentElement ? document.documentElement.outerHTML : '';
+for (const pattern of arguments[0]) {
+    const match = new RegExp(pattern, 'i').exec(html);
+    if (match) return match[1] === undefined ? match[0] : match[1];
+}
+return null;
+"""
+
+# Installed once per browser with Page.addScriptToEvaluateOnNewDocument. Closes
+# the popups handle_popups() looks for as soon as they appear and counts them
+# in window.__scraperPopups, so Python never has to poll for them. Mutations
+# come in bursts, so sweeps are throttled to one per 100ms. Only elements
+# inside a known overlay are clicked, each at most once, and never pagination
+# controls, job cards or job links.
+POPUP_DISMISS_SCRIPT = """
+(() => {
+    const selectors = %(selectors)s;
+    const texts = %(texts)s;
+    const containerSelector = %(containers)s.join(',');
+    const protectedSelector = %(protected)s.join(',');
+    const state = window.__scraperPopups = {dismissed: 0, reported: 0};
+    const visible = el => {
+        if (!el.getClientRects().length) return false;
+        const style = window.getComputedStyle(el);
+        return style.visibility !== 'hidden' && style.display !== 'none';
+    };
+    const dismiss = el => {
+        if (el.__scraperDismissed || !el.closest(containerSelector) || !visible(el)) return;
+        if (el.closest(protectedSelector) || el.querySelector(protectedSelector)) return;
+        el.__scraperDismissed = true;
+        try {
+            el.click();
+            state.dismissed++;
+        } catch (e) {}
+    };
+    const sweep = () => {
+        for (const selector of selectors) {
+            try { document.querySelectorAll(selector).forEach(dismiss); } catch (e) {}
+        }
+        for (const button of document.querySelectorAll('button')) {
+            if (texts.some(text => (button.textContent || '').includes(text))) dismiss(button);
+        }
+    };
+    let pending = false;
+    const schedule = () => {
+        if (pending) return;
+        pending = true;
+        setTimeout(() => { pending = false; sweep(); }, 100);
+    };
+    const start = () => {
+        sweep();
+        new MutationObserver(schedule).observe(document.documentElement, {childList: true, subtree: true});
+    };
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', start);
+    } else {
+        start();
+    }
+})();
+"""
+
+# Popups closed by the dismisser since the last call, or null where it is not running
+DISMISSED_POPUPS_SCRIPT = """
+const state = window.__scraperPopups;
+if (!state) return null;
+const count = state.dismissed - state.reported;
+state.reported = state.dismissed;
+return count;
+"""
+
+# Whether a fully loaded page is a search without results, by marker element or text
+NO_RESULTS_SCRIPT = """
+if (document.readyState !== 'complete') return false;
+for (const selector of arguments[0]) {
+    try {
+        if (document.querySelector(selector)) return true;
+    } catch (e) {}
+}
+const text = document.body ? (document.body.innerText || '').toLowerCase() : '';
+return arguments[1].some(marker => text.includes(marker));
+"""
+
+# Number of job cards on the page, for the first card selector that matches
+CARD_COUNT_SCRIPT = """
+for (const selector of arguments[0]) {
+    try {
+        const count = document.querySelectorAll(selector).length;
+        if (count) return count;
+    } catch (e) {}
+}
+return 0;
+"""
+
+# Job count patterns searched for in the page source when no element shows the
+# count, after the "123 <role> jobs" pattern of the role being scraped
+JOB_COUNT_PATTERNS = [
+    r'(\d+,?\d*)\s+jobs\s+available',
+    r'found\s+(\d+,?\d*)\s+jobs',
+    r'showing\s+(\d+,?\d*)\s+jobs'
+]
+
+# Longest time to wait for a page to render before reading it anyway (seconds)
+PAGE_READY_TIMEOUT = float(os.environ.get('SCRAPER_READY_TIMEOUT', '20'))
+
+# Optional human-like pauses per page (seconds), on top of readiness waits.
+# These never gate correctness, so 0 disables them entirely.
+HUMANIZE_BUDGET = float(os.environ.get('SCRAPER_HUMANIZE_BUDGET', '2'))
+
+# Expected idle time of the fixed sleeps the readiness waits replaced:
+# 3-5s + 1-3s after each navigation and 2-4s before reading the job count
+FIXED_SLEEP_SECONDS = 9.0
+
+# How long a scraped count may be reused within a run before the page is
+# loaded again (seconds). Failed (-1) results are never cached.
+RESULT_CACHE_TTL = float(os.environ.get('SCRAPER_CACHE_TTL', '3600'))
+
+# Try a plain HTTP request before loading a page in the browser ("0" disables)
+HTTP_FIRST = os.environ.get('SCRAPER_HTTP_FIRST', '1') != '0'
+
+# Job listings read per country, walking as many result pages as it takes
+MAX_LISTINGS = int(os.environ.get('SCRAPER_MAX_LISTINGS', '100'))
+
+# Job cards read from the browser per round trip. Only one batch is held in
+# Python at a time, so memory does not grow with MAX_LISTINGS.
+LISTING_BATCH_SIZE = int(os.environ.get('SCRAPER_LISTING_BATCH', '20'))
+
+# Result pages (or "load more" clicks) walked per search at most
+MAX_RESULT_PAGES = 10
+
+# Job detail pages visited per country when cards carry no descriptions.
+# Pages are fetched over HTTP concurrently, so this can be raised to hundreds.
+MAX_DETAIL_PAGES = int(os.environ.get('SCRAPER_MAX_DETAIL_PAGES', '100'))
+
+# Job detail pages fetched at the same time
+DETAIL_CONCURRENCY = int(os.environ.get('SCRAPER_DETAIL_CONCURRENCY', '8'))
+
+# Detail pages the HTTP tier could not read are loaded one by one in the
+# browser, up to this many per country (the old sequential limit)
+MAX_BROWSER_DETAIL_PAGES = 10
+
+# Reuse skills of jobs seen in earlier runs instead of parsing them again ("0" disables)
+INCREMENTAL = os.environ.get('SCRAPER_INCREMENTAL', '1') != '0'
+
+# Keep every parsed job description in the compressed archive, so skills can be
+# re-extracted offline after the skill lists change ("0" discards them)
+ARCHIVE_DESCRIPTIONS = os.environ.get('SCRAPER_ARCHIVE_DESCRIPTIONS', '1') != '0'
+
+# Group reposted and multi-location listings into postings, count each posting
+# once in the skill rankings and skip detail pages of known postings ("0" disables)
+NEAR_DUPLICATES = os.environ.get('SCRAPER_NEAR_DUPLICATES', '1') != '0'
+
+# Attempts per page load before a navigation is given up
+NAV_ATTEMPTS = int(os.environ.get('SCRAPER_NAV_ATTEMPTS', '3'))
+
+# Seconds per run that failed page loads and retry backoff may take in total
+RETRY_BUDGET = float(os.environ.get('SCRAPER_RETRY_BUDGET', '600'))
+
+# Resume a run that was interrupted earlier the same day from its checkpoint,
+# instead of scraping finished countries again ("0" always starts over)
+RESUME = os.environ.get('SCRAPER_RESUME', '1') != '0'
+
+# Skip slow-moving counts whose trigger count barely changed since the last
+# run and carry them forward from the history ("0" scrapes every count)
+ADAPTIVE = os.environ.get('SCRAPER_ADAPTIVE', '1') != '0'
+
+# Try the selectors that matched in recent runs first ("0" keeps the order of page_selectors)
+ADAPTIVE_SELECTORS = os.environ.get('SCRAPER_ADAPTIVE_SELECTORS', '1') != '0'
+
+# Close popups with a script injected once per browser instead of polling for
+# them after every page load ("0" polls with handle_popups)
+AUTO_DISMISS = os.environ.get('SCRAPER_AUTO_DISMISS', '1') != '0'
+
+# Browser state kept between runs: the cookie jar and, if enabled, Chrome profiles
+BROWSER_STATE_DIR = Path(os.environ.get('SCRAPER_STATE_DIR', Path(__file__).parent / ".browser_state"))
+COOKIE_JAR_FILE = BROWSER_STATE_DIR / "cookies.json"
+
+# Save Cloudflare clearance and consent cookies after a run and restore them
+# on startup, so challenges and consent popups are not repeated ("0" disables)
+PERSIST_COOKIES = os.environ.get('SCRAPER_PERSIST_COOKIES', '1') != '0'
+
+# Give every browser a persistent Chrome profile under BROWSER_STATE_DIR
+PERSIST_PROFILE = os.environ.get('SCRAPER_PERSIST_PROFILE', '0') == '1'
+
+# Keep browsers open after run_scraper so later runs in the same process
+# reuse them instead of relaunching Chrome; close them with shutdown_browsers().
+# Only for callers that import this module and call run_scraper repeatedly:
+# main() is a single run and always closes them before the process exits
+KEEP_BROWSERS = os.environ.get('SCRAPER_KEEP_BROWSERS', '0') == '1'
+
+# Only cookies of these domains are persisted
+COOKIE_DOMAINS = ("glassdoor", "cloudflare")
+
+# Lean mode: block images, media, fonts and trackers and switch off Chrome
+# features the scraper never uses; we only read counts and card text
+LEAN_MODE = os.environ.get('SCRAPER_LEAN', '0') == '1'
+
+# Record the bytes of every page load from Chrome's performance log. Logging
+# every network event costs time and memory, so it is off unless asked for or
+# in lean mode, whose savings it measures
+MEASURE_PAGES = LEAN_MODE or os.environ.get('SCRAPER_MEASURE_PAGES', '0') == '1'
+
+# Run Chrome without a window; easier to detect, so off by default
+HEADLESS = os.environ.get('SCRAPER_HEADLESS', '0') == '1'
+
+# Requests blocked in lean mode (Network.setBlockedURLs wildcard patterns).
+# Cloudflare's challenge scripts are never blocked.
+BLOCKED_URL_PATTERNS = [
+    "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*",
+    "*.woff*", "*.ttf*", "*.otf*", "*.eot*",
+    "*.mp4*", "*.webm*", "*.mp3*", "*.m3u8*",
+    "*doubleclick.net*", "*googlesyndication.com*", "*google-analytics.com*",
+    "*googletagmanager.com*", "*googleadservices.com*", "*facebook.net*", "*facebook.com/tr*",
+    "*hotjar.com*", "*scorecardresearch.com*", "*quantserve.com*", "*adsrvr.org*",
+    "*criteo.com*", "*criteo.net*", "*bat.bing.com*", "*clarity.ms*", "*taboola.com*",
+    "*outbrain.com*", "*amazon-adsystem.com*", "*newrelic.com*", "*nr-data.net*",
+    "*optimizely.com*", "*segment.io*", "*segment.com*", "*onetrust.com*", "*cookielaw.org*"
+]
+
+# Chrome features and background services the scraper does not need
+LEAN_CHROME_ARGUMENTS = [
+    "--blink-settings=imagesEnabled=false",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--mute-audio",
+    "--no-first-run",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication,InterestFeedContentSuggestions"
+]
+
+# Save the HTML of every visited page here so the run can be replayed offline
+RECORD_DIR = os.environ.get('SCRAPER_RECORD_DIR')
+
+# Serve pages recorded in this directory instead of visiting Glassdoor
+REPLAY_DIR = os.environ.get('SCRAPER_REPLAY_DIR')
+
+# Number of independent browser workers used by run_scraper (1 = sequential)
+MAX_WORKERS = int(os.environ.get('SCRAPER_WORKERS', '1'))
+
+# undetected-chromedriver patches a shared chromedriver binary on startup,
+# so browsers must be launched one at a time even when scraping in parallel
+_driver_init_lock = threading.Lock()
+
+# Workers of one run may save the cookie jar at the same time
+_cookie_jar_lock = threading.Lock()
+
+# Scrapers with an open browser waiting for the next run (KEEP_BROWSERS)
+_idle_scrapers: "queue.Queue[GlassdoorScraper]" = queue.Queue()
+
+# Numbers Chrome profiles so concurrent browsers never share one
+_profile_counter = itertools.count()
+
+
+def new_browser_stats() -> Dict[str, float]:
+    """Counters for browser startup, Cloudflare waits and page loads."""
+    return {
+        "page_loads": 0,
+        "page_load_seconds": 0.0,
+        "bytes_transferred": 0,
+        "startups": 0,
+        "startup_seconds": 0.0,
+        "cloudflare_challenges": 0,
+        "cloudflare_wait_seconds": 0.0,
+        "popups_dismissed": 0
+    }
+
+
+def empty_country_data(country: str) -> Dict[str, Any]:
+    """Country data with every value set to the "Can't find data" indicator (-1)."""
+    return {
+        "country": country,
+        "last_24h": -1,
+        "last_7d": -1,
+        "last_30d": -1,
+        "remote": -1,
+        "on_site": -1,
+        "job_listings": []
+    }
+
+
+class ResultCache:
+    """
+    Per-run cache of scrape results keyed by (country, URL, filter).
+    
+    Entries expire RESULT_CACHE_TTL seconds after they were stored, so a
+    long-lived scraper never serves a count from an earlier run. Expiry is
+    the only eviction; counts and listings of challenged pages are never
+    stored in the first place. The cache is shared by all browser workers
+    of a run and is safe to use from several threads.
+    """
+    
+    def __init__(self, ttl: float = RESULT_CACHE_TTL):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: tuple) -> Any:
+        """Return the cached value for the key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] <= self.ttl:
+                self.hits += 1
+                return entry[1]
+            
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+    
+    def put(self, key: tuple, value: Any) -> None:
+        """Store a value for the key."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+    
+    def summary(self) -> Dict[str, int]:
+        """Hit and miss counts; every hit is a page load that was avoided."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
 
 class GlassdoorScraper:
     """Scraper for Glassdoor job data using undetected-chromedriver."""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[ResultCache] = None, job_index: Optional[JobIndex] = None,
+                 profile: Optional[RunProfile] = None, scheduler: Optional[Scheduler] = None,
+                 retry_budget: Optional[RetryBudget] = None, selectors: Optional[SelectorRegistry] = None,
+                 archive: Optional[DescriptionArchive] = None,
+                 near_duplicates: Optional[NearDuplicateIndex] = None, http_first: bool = HTTP_FIRST):
         self.driver = None
+        self.cache = cache if cache is not None else ResultCache()
+        self.job_index = job_index
+        self.archive = archive
+        self.near_duplicates = near_duplicates
+        self.scheduler = scheduler
+        self.retry_budget = retry_budget if retry_budget is not None else RetryBudget(RETRY_BUDGET)
+        self.profile = profile if profile is not None else RunProfile()
+        self.selectors = selectors if selectors is not None else SelectorRegistry(reorder=ADAPTIVE_SELECTORS)
+        # Country being scraped, attached to profile events
+        self.country: Optional[str] = None
+        # Role being scraped; selects the search URLs in QUERY_CONFIGS
+        self.role = JOB_TITLE
+        self.profile_dir = BROWSER_STATE_DIR / f"profile-{next(_profile_counter)}" if PERSIST_PROFILE else None
+        self.stats = new_browser_stats()
+        # Without the HTTP tier every page goes through the browser
+        self.http = HttpFetcher(pool_size=max(4, DETAIL_CONCURRENCY), record_dir=RECORD_DIR) if http_first else None
+        # Which tier ("http", "browser" or "cache") served the last scraped value
+        self.last_source = "browser"
+        # Pages of the current country (URL -> fields read from it), from plan_pages()
+        self.pages: Dict[str, List[str]] = {}
+        # Listings read in the browser while a page was loaded for its count, by URL
+        self.page_listings: Dict[str, List[Dict[str, Any]]] = {}
+        self.humanize_remaining = HUMANIZE_BUDGET
+        # Whether the injected popup dismisser runs in the current browser
+        self.auto_dismiss = False
+        # Peak memory seen while scraping the current country (MB)
+        self.peak_rss_mb = 0.0
+        self.peak_heap_mb = 0.0
     
     def initialize(self) -> None:
-        """Initialize the browser."""
+        """Initialize the browser and restore persisted cookies."""
+        start = time.monotonic()
+        with _driver_init_lock:
+            self._initialize()
+        if PERSIST_COOKIES:
+            self.restore_cookies()
+        
+        startup_seconds = time.monotonic() - start
+        self.stats["startups"] += 1
+        self.stats["startup_seconds"] += startup_seconds
+        logger.info(f"Browser ready in {startup_seconds:.1f}s")
+    
+    def _initialize(self) -> None:
         logger.info("Initializing browser...")
+        load_browser_modules()
         
         # Configure Chrome options
         options = uc.ChromeOptions()
@@ -119,24 +617,356 @@ class GlassdoorScraper:
         options.add_argument("--disable-popup-blocking")
         options.add_argument("--lang=en-US")
         
+        if LEAN_MODE:
+            logger.info("Lean mode: blocking images, media, fonts and trackers")
+            for argument in LEAN_CHROME_ARGUMENTS:
+                options.add_argument(argument)
+        
+        # Network events in the performance log give the bytes of every page load
+        if MEASURE_PAGES:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        
         # Initialize undetected-chromedriver
-        self.driver = uc.Chrome(options=options)
+        if self.profile_dir:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            self.driver = uc.Chrome(options=options, user_data_dir=str(self.profile_dir), headless=HEADLESS)
+        else:
+            self.driver = uc.Chrome(options=options, headless=HEADLESS)
         self.driver.set_page_load_timeout(60)
         
+        if LEAN_MODE:
+            try:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            except Exception as e:
+                logger.warning(f"Could not block resources, continuing without: {str(e)}")
+        
+        self.auto_dismiss = AUTO_DISMISS and self.install_popup_dismisser()
+        
         # Set window size
         self.driver.set_window_size(1920, 1080)
         
         logger.info("Browser initialized successfully")
     
+    def install_popup_dismisser(self) -> bool:
+        """
+        Inject POPUP_DISMISS_SCRIPT into every page the browser opens from now on.
+        
+        Returns:
+            True if installed, False if pages have to be polled with handle_popups
+        """
+        script = POPUP_DISMISS_SCRIPT % {
+            "selectors": json.dumps(POPUP_SELECTORS),
+            "texts": json.dumps(POPUP_BUTTON_TEXTS),
+            "containers": json.dumps(POPUP_CONTAINER_SELECTORS),
+            "protected": json.dumps(NEXT_PAGE_SELECTORS + LOAD_MORE_SELECTORS + JOB_CARD_SELECTORS +
+                                    POPUP_PROTECTED_SELECTORS)
+        }
+        try:
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": script})
+            return True
+        except Exception as e:
+            logger.warning(f"Could not install popup dismisser, polling for popups instead: {str(e)}")
+            return False
+    
     def close(self) -> None:
         """Close the browser."""
         if self.driver:
-            self.driver.quit()
+            try:
+                self.driver.quit()
+            except Exception as e:
+                logger.warning(f"Error closing browser: {str(e)}")
+            self.driver = None
+    
+    def restart(self) -> None:
+        """Replace a crashed browser with a fresh one."""
+        logger.warning("Restarting browser")
+        self.close()
+        self.initialize()
+    
+    def is_alive(self) -> bool:
+        """Return True if the browser is open and still responding."""
+        if not self.driver:
+            return False
+        try:
+            self.driver.title
+            return True
+        except Exception:
+            return False
+    
+    def restore_cookies(self) -> None:
+        """Load the persisted cookie jar into the browser before the first navigation."""
+        try:
+            with _cookie_jar_lock, open(COOKIE_JAR_FILE, encoding='utf-8') as f:
+                cookies = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read cookie jar {COOKIE_JAR_FILE}: {str(e)}")
+            return
+        
+        now = time.time()
+        cookies = [cookie for cookie in cookies if cookie.get("expires", -1) < 0 or cookie["expires"] > now]
+        try:
+            # CDP sets cookies for any domain without navigating there first
+            self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+            logger.info(f"Restored {len(cookies)} cookies from {COOKIE_JAR_FILE}")
+        except Exception as e:
+            logger.warning(f"Could not restore cookies: {str(e)}")
+    
+    def save_cookies(self) -> None:
+        """Merge the browser's Glassdoor and Cloudflare cookies into the persisted cookie jar."""
+        try:
+            browser_cookies = self.driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        except Exception as e:
+            logger.warning(f"Could not read browser cookies: {str(e)}")
+            return
+        
+        # Keep only the fields Network.setCookies accepts
+        fields = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+        cookies = [
+            {field: cookie[field] for field in fields if field in cookie}
+            for cookie in browser_cookies
+            if any(domain in cookie.get("domain", "") for domain in COOKIE_DOMAINS)
+        ]
+        
+        with _cookie_jar_lock:
+            try:
+                with open(COOKIE_JAR_FILE, encoding='utf-8') as f:
+                    jar = {(c["name"], c["domain"], c.get("path", "/")): c for c in json.load(f)}
+            except (OSError, ValueError):
+                jar = {}
+            
+            for cookie in cookies:
+                jar[(cookie["name"], cookie["domain"], cookie.get("path", "/"))] = cookie
+            
+            os.makedirs(COOKIE_JAR_FILE.parent, exist_ok=True)
+            with open(COOKIE_JAR_FILE, 'w', encoding='utf-8') as f:
+                json.dump(list(jar.values()), f, indent=2)
+        
+        logger.info(f"Saved {len(cookies)} cookies to {COOKIE_JAR_FILE}")
+    
+    def transferred_bytes(self) -> Optional[int]:
+        """
+        Bytes received over the network since the last call.
+        
+        Sums the encoded size of every finished request in the browser's
+        performance log; reading the log also empties it.
+        
+        Returns:
+            The byte count, or None if MEASURE_PAGES is off or the
+            performance log is unavailable
+        """
+        if not MEASURE_PAGES:
+            return None
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            return None
+        
+        total = 0
+        for entry in entries:
+            # Cheap check before parsing; the log also holds unrelated events
+            if "Network.loadingFinished" not in entry["message"]:
+                continue
+            message = json.loads(entry["message"])["message"]
+            if message["method"] == "Network.loadingFinished":
+                total += int(message["params"].get("encodedDataLength", 0))
+        return total
     
     def random_sleep(self, min_seconds=1, max_seconds=3):
         """Sleep for a random amount of time to appear more human-like."""
-        time.sleep(random.uniform(min_seconds, max_seconds))
+        delay = random.uniform(min_seconds, max_seconds)
+        time.sleep(delay)
+        self.profile.record("random_sleep", delay, country=self.country)
+    
+    def humanize(self, min_seconds=0.5, max_seconds=1.5) -> float:
+        """
+        Pause like a human would, drawing from the current page's HUMANIZE_BUDGET.
+        
+        Returns:
+            The number of seconds actually slept
+        """
+        delay = min(random.uniform(min_seconds, max_seconds), self.humanize_remaining)
+        if delay <= 0:
+            return 0.0
+        
+        self.humanize_remaining -= delay
+        time.sleep(delay)
+        self.profile.record("humanize", delay, country=self.country)
+        return delay
+    
+    @profiled("wait_for_page_ready")
+    def wait_for_page_ready(self, selectors: Optional[List[str]] = None, timeout: float = PAGE_READY_TIMEOUT) -> bool:
+        """
+        Wait until the page shows any of the given selectors or a Cloudflare challenge.
+        
+        Args:
+            selectors: CSS selectors that mark the page as rendered (defaults to READY_SELECTORS)
+            timeout: Maximum number of seconds to wait
+            
+        Returns:
+            True if a selector appeared, False on timeout or challenge page
+        """
+        locator = (By.CSS_SELECTOR, ", ".join(selectors or READY_SELECTORS))
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(EC.any_of(
+                EC.presence_of_element_located(locator),
+                EC.title_contains("Just a moment")
+            ))
+        except TimeoutException:
+            logger.warning(f"Page not ready after {timeout:.0f}s: {self.driver.current_url}")
+            return False
+        
+        return "Just a moment" not in self.driver.title
+    
+    @profiled("driver.get")
+    def open_url(self, url: str) -> None:
+        """Navigate the browser to a URL."""
+        # Count the popups closed on the page we are leaving before it is gone
+        if self.auto_dismiss:
+            self.collect_dismissed_popups()
+        self.driver.get(url)
+    
+    def navigate(self, url: str, selectors: Optional[List[str]] = None, timeout: float = PAGE_READY_TIMEOUT) -> bool:
+        """
+        Open a URL and wait for it to render, retrying failed loads.
+        
+        Failures are classified as Cloudflare challenge, page-load timeout,
+        selector miss or driver crash and retried up to NAV_ATTEMPTS times
+        with jittered exponential backoff, while the run's retry budget lasts.
+        A crashed browser is restarted before the retry. A search page that
+        loaded completely but has no results is final, not a selector miss.
+        
+        Args:
+            url: URL to open
+            selectors: CSS selectors that mark the page as rendered (defaults to READY_SELECTORS)
+            timeout: Maximum number of seconds to wait for a selector
+            
+        Returns:
+            True if the page rendered, False if the last attempt still hit a
+            challenge page or no selector appeared
+            
+        Raises:
+            The error of the last attempt if it timed out or the browser crashed
+        """
+        error: Optional[Exception] = None
+        for attempt in range(NAV_ATTEMPTS):
+            start = time.monotonic()
+            try:
+                self.open_url(url)
+                ready = self.wait_for_page_ready(selectors, timeout)
+                
+                # A challenge that clears while we wait needs no reload
+                if not ready and "Just a moment" in self.driver.title and self.handle_cloudflare():
+                    ready = self.wait_for_page_ready(selectors, timeout)
+                
+                if ready:
+                    if attempt:
+                        self.retry_budget.record_recovery()
+                    self.record_page_load(time.monotonic() - start)
+                    return True
+                
+                if "Just a moment" in self.driver.title:
+                    kind = CLOUDFLARE
+                elif selectors is None and self.is_no_results_page():
+                    # Reloading an empty search only shows the same empty page
+                    logger.info(f"No results on {url}, not retrying")
+                    self.record_page_load(time.monotonic() - start)
+                    return True
+                else:
+                    kind = SELECTOR_MISS
+                error = None
+            except Exception as e:
+                kind = classify_exception(e)
+                if kind is None:
+                    raise
+                error = e
+            
+            self.retry_budget.record_failure(kind, time.monotonic() - start)
+            logger.warning(f"Navigation to {url} failed: {kind} (attempt {attempt + 1} of {NAV_ATTEMPTS})")
+            
+            if attempt + 1 == NAV_ATTEMPTS:
+                break
+            
+            delay = backoff_delay(attempt)
+            if not self.retry_budget.spend(delay):
+                logger.warning(f"Retry budget exhausted, giving up on {url}")
+                break
+            
+            with self.profile.stage("retry_backoff", country=self.country, failure=kind):
+                time.sleep(delay)
+            
+            if kind == DRIVER_CRASH or not self.is_alive():
+                self.restart()
+        
+        if error is not None:
+            raise error
+        return False
+    
+    def is_no_results_page(self) -> bool:
+        """Whether the current page has finished loading and is a search without results."""
+        try:
+            return bool(self.driver.execute_script(NO_RESULTS_SCRIPT, NO_RESULTS_SELECTORS, NO_RESULTS_TEXTS))
+        except Exception:
+            return False
+    
+    def record_page_load(self, seconds: float) -> None:
+        """
+        Record the load time and bytes of a page that rendered, to compare lean and full mode.
+        
+        The performance log is read once per page load, so the bytes include
+        failed attempts and anything the previous page fetched after it was
+        recorded.
+        """
+        page_bytes = self.transferred_bytes()
+        self.profile.record("page_load", seconds, country=self.country, bytes=page_bytes,
+                            mode="lean" if LEAN_MODE else "full")
+        self.stats["page_loads"] += 1
+        self.stats["page_load_seconds"] += seconds
+        self.stats["bytes_transferred"] += page_bytes or 0
+        self.sample_memory()
+    
+    def load_search_page(self, url: str, fixed_sleep: float = FIXED_SLEEP_SECONDS) -> bool:
+        """
+        Navigate to a page and return as soon as its content has rendered.
+        
+        Args:
+            url: URL to open
+            fixed_sleep: Seconds the old fixed sleeps would have idled on this page
+            
+        Returns:
+            True if the page rendered, False on timeout or challenge page
+        """
+        logger.info(f"Navigating to: {url}")
+        self.humanize_remaining = HUMANIZE_BUDGET
+        
+        start = time.monotonic()
+        ready = self.navigate(url)
+        waited = time.monotonic() - start
+        self.record_current_page()
+        
+        # Handle any popups
+        self.dismiss_popups()
+        humanized = self.humanize(0.5, 1.5)
+        
+        logger.info(
+            f"Page {'ready' if ready else 'not ready'} {time.monotonic() - start:.1f}s after navigation "
+            f"(loaded in {waited:.1f}s, {humanized:.1f}s humanization; "
+            f"saved ~{max(0.0, fixed_sleep - waited - humanized):.1f}s vs fixed sleeps)"
+        )
+        return ready
     
+    def record_current_page(self) -> None:
+        """Save the current page to RECORD_DIR when recording is enabled."""
+        if not RECORD_DIR:
+            return
+        try:
+            record_page(Path(RECORD_DIR), self.driver.current_url, self.driver.page_source)
+        except Exception as e:
+            logger.warning(f"Could not record page {self.driver.current_url}: {str(e)}")
+    
+    @profiled("handle_cloudflare")
     def handle_cloudflare(self) -> bool:
         """
         Handle Cloudflare protection if detected.
@@ -146,47 +976,15 @@ class GlassdoorScraper:
         """
         try:
             # Check for Cloudflare challenge
-            if "Just a moment" in self.driver.title or "cloudflare" in self.driver.page_source.lower():
+            if "Just a moment" in self.driver.title or self.search_page_source(["cloudflare"]):
                 logger.warning("Cloudflare challenge detected. Waiting for it to resolve...")
                 
-                # Wait longer for Cloudflare to clear automatically (undetected_chromedriver should handle this)
-                for i in range(5):
-                    logger.info(f"Waiting for Cloudflare challenge to resolve (attempt {i+1})...")
-                    time.sleep(6)  # Wait 6 seconds between checks
-                    if "Just a moment" not in self.driver.title:
-                        logger.info("Successfully bypassed Cloudflare challenge!")
-                        return True
-                
-                # If still on Cloudflare, try to find interactive elements
+                start = time.monotonic()
                 try:
-                    # Try to find checkbox or verification button
-                    checkboxes = self.driver.find_elements(By.CSS_SELECTOR, 
-                                                          "input[type='checkbox'], .recaptcha-checkbox")
-                    for checkbox in checkboxes:
-                        if checkbox.is_displayed():
-                            checkbox.click()
-                            logger.info("Clicked on checkbox")
-                            time.sleep(5)
-                    
-                    # Try to find any button that might help bypass
-                    buttons = self.driver.find_elements(By.TAG_NAME, "button")
-                    for button in buttons:
-                        if button.is_displayed() and ("verify" in button.text.lower() or 
-                                                     "continue" in button.text.lower() or 
-                                                     "human" in button.text.lower()):
-                            button.click()
-                            logger.info(f"Clicked button: {button.text}")
-                            time.sleep(5)
-                except Exception as e:
-                    logger.warning(f"Error while trying to interact with Cloudflare elements: {str(e)}")
-                
-                # Final check
-                if "Just a moment" not in self.driver.title:
-                    logger.info("Successfully bypassed Cloudflare challenge!")
-                    return True
-                    
-                logger.warning("Failed to bypass Cloudflare challenge.")
-                return False
+                    return self.wait_out_cloudflare()
+                finally:
+                    self.stats["cloudflare_challenges"] += 1
+                    self.stats["cloudflare_wait_seconds"] += time.monotonic() - start
             
             return True  # No Cloudflare challenge detected
             
@@ -194,68 +992,169 @@ class GlassdoorScraper:
             logger.error(f"Error handling Cloudflare challenge: {str(e)}")
             return False
     
+    def wait_out_cloudflare(self) -> bool:
+        """Wait for a detected Cloudflare challenge to clear, clicking through it if needed."""
+        # Wait longer for Cloudflare to clear automatically (undetected_chromedriver should handle this)
+        for i in range(5):
+            logger.info(f"Waiting for Cloudflare challenge to resolve (attempt {i+1})...")
+            with self.profile.stage("cloudflare_wait", country=self.country):
+                time.sleep(6)  # Wait 6 seconds between checks
+            if "Just a moment" not in self.driver.title:
+                logger.info("Successfully bypassed Cloudflare challenge!")
+                return True
+        
+        # If still on Cloudflare, try to find interactive elements
+        try:
+            # Try to find checkbox or verification button
+            checkboxes = self.driver.find_elements(By.CSS_SELECTOR, 
+                                                  "input[type='checkbox'], .recaptcha-checkbox")
+            for checkbox in checkboxes:
+                if checkbox.is_displayed():
+                    checkbox.click()
+                    logger.info("Clicked on checkbox")
+                    time.sleep(5)
+            
+            # Try to find any button that might help bypass
+            buttons = self.driver.find_elements(By.TAG_NAME, "button")
+            for button in buttons:
+                if button.is_displayed() and ("verify" in button.text.lower() or 
+                                             "continue" in button.text.lower() or 
+                                             "human" in button.text.lower()):
+                    button.click()
+                    logger.info(f"Clicked button: {button.text}")
+                    time.sleep(5)
+        except Exception as e:
+            logger.warning(f"Error while trying to interact with Cloudflare elements: {str(e)}")
+        
+        # Final check
+        if "Just a moment" not in self.driver.title:
+            logger.info("Successfully bypassed Cloudflare challenge!")
+            return True
+            
+        logger.warning("Failed to bypass Cloudflare challenge.")
+        return False
+    
+    def probe_page(self, max_cards: int = 20, card_offset: int = 0,
+                   popups: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        """
+        Read the current page in a single WebDriver round trip.
+        
+        Args:
+            max_cards: Maximum number of job cards to include
+            card_offset: Index of the first job card to include
+            popups: Look for popup-close targets; by default only when the
+                injected popup dismisser is not running
+            
+        Returns:
+            Snapshot with the page title and URL, the visible job-count text,
+            visible popup-close targets, job cards (field texts per selector
+            plus link), the next result page's URL, the "load more" button,
+            the browser's JS heap size and page-level texts per selector, or
+            None if the script could not run
+        """
+        if popups is None:
+            popups = not self.auto_dismiss
+        options = {
+            "countSelectors": self.selectors.order("search", "job_count", JOB_COUNT_SELECTORS),
+            "jobCountPattern": job_count_pattern(self.role),
+            "popupSelectors": POPUP_SELECTORS if popups else [],
+            "popupTexts": POPUP_BUTTON_TEXTS if popups else [],
+            "cardSelectors": self.selectors.order("search", "job_card", JOB_CARD_SELECTORS),
+            "cardFieldSelectors": CARD_TITLE_SELECTORS + CARD_COMPANY_SELECTORS + CARD_DESCRIPTION_SELECTORS,
+            "pageSelectors": (EXPANDED_DESCRIPTION_SELECTORS + JOB_TITLE_SELECTORS +
+                              JOB_COMPANY_SELECTORS + JOB_DESCRIPTION_SELECTORS),
+            "maxCards": max_cards,
+            "cardOffset": card_offset,
+            "nextPageSelectors": NEXT_PAGE_SELECTORS,
+            "loadMoreSelectors": LOAD_MORE_SELECTORS
+        }
+        
+        try:
+            return self.driver.execute_script(PAGE_PROBE_SCRIPT, options)
+        except Exception as e:
+            logger.warning(f"Page probe failed, falling back to element lookups: {str(e)}")
+            return None
+    
+    def search_page_source(self, patterns: List[str]) -> Optional[str]:
+        """
+        Search the current page source for the first matching regex, inside the browser.
+        
+        The page source is often several MB; only the match is sent back.
+        
+        Args:
+            patterns: Case-insensitive JavaScript-compatible regexes, tried in order
+            
+        Returns:
+            The first group of the first pattern that matches (the whole match
+            if it has no group), or None
+        """
+        return self.driver.execute_script(PAGE_SEARCH_SCRIPT, patterns)
+    
     def extract_job_count(self) -> int:
-        """Extract the job count from the page."""
+        """Extract the job count from the page, profiling which strategy found it."""
+        with self.profile.stage("extract_job_count", country=self.country) as fields:
+            count, fields["strategy"] = self.find_job_count()
+        return count
+    
+    def find_job_count(self) -> Tuple[int, str]:
+        """
+        Find the job count on the current page.
+        
+        Returns:
+            The count (0 if none was found) and the strategy that found it:
+            "selector", "title", "page_source", "no_results", "cloudflare", "none" or "error"
+        """
         try:
-            # Wait a bit for the page to fully load
-            self.random_sleep(2, 4)
+            # Make sure the page has rendered; returns at once if it already has,
+            # and never waits longer than the 2-4s fixed sleep this replaced
+            self.wait_for_page_ready(timeout=3)
             
             # Check if we're facing Cloudflare challenge
             if not self.handle_cloudflare():
-                return 0
+                return 0, "cloudflare"
                 
             # Try multiple approaches to find the job count
             
+            # "123 jobs" or "123 <role> jobs" for the role being scraped
+            count_pattern = job_count_pattern(self.role)
+            
             # 1. Look for specific selectors that typically contain job counts
-            count_selectors = [
-                '[data-test="jobCount"]', 
-                '.jobsCount', 
-                '.count',
-                'header h1',
-                '[data-heading]',
-                '.hiddenJobs',
-                '.jobHeader',
-                '.jobsCount',
-                '.css-rfi9y',  # Common Glassdoor class
-                '.common__EIRcO',  # Another common Glassdoor class
-                'h1', 
-                'h2', 
-                'span.text'
-            ]
-            
-            for selector in count_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            text = element.text
-                            # Look for patterns like "123 jobs" or "123 Data Analyst jobs"
-                            if re.search(r'\d+\s+(?:Data Analyst\s+)?jobs', text, re.IGNORECASE):
-                                count_str = re.sub(r'[^\d]', '', re.search(r'\d+', text).group())
-                                return int(count_str)
-                except Exception:
-                    continue
+            snapshot = self.probe_page(max_cards=0) if PROBE_MODE else None
+            if snapshot is not None:
+                # The probe already applied the "123 jobs" pattern in selector order
+                if snapshot["jobCountText"]:
+                    self.selectors.record_hit("search", "job_count", snapshot["jobCountSelector"])
+                    count_str = re.search(count_pattern, snapshot["jobCountText"], re.IGNORECASE).group(1)
+                    return int(count_str.replace(',', '')), "selector"
+            else:
+                for selector in self.selectors.order("search", "job_count", JOB_COUNT_SELECTORS):
+                    try:
+                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                        for element in elements:
+                            if element.is_displayed():
+                                text = element.text
+                                match = re.search(count_pattern, text, re.IGNORECASE)
+                                if match:
+                                    self.selectors.record_hit("search", "job_count", selector)
+                                    return int(match.group(1).replace(',', '')), "selector"
+                    except Exception:
+                        continue
             
-            # 2. Try to extract from page title
-            if "jobs" in self.driver.title.lower():
-                title_numbers = re.findall(r'\d+', self.driver.title)
-                if title_numbers:
-                    return int(title_numbers[0])
+            # 2. Try to extract from page title; only a number right before "jobs"
+            # is a count, not e.g. a year in the title
+            page_title = snapshot["title"] if snapshot is not None else self.driver.title
+            match = re.search(count_pattern, page_title, re.IGNORECASE)
+            if match:
+                return int(match.group(1).replace(',', '')), "title"
             
             # 3. Extract from the entire page content
-            page_text = self.driver.page_source
-            job_count_patterns = [
-                r'(\d+,?\d*)\s+(?:Data Analyst\s+)?jobs',
-                r'(\d+,?\d*)\s+jobs\s+available',
-                r'found\s+(\d+,?\d*)\s+jobs',
-                r'showing\s+(\d+,?\d*)\s+jobs'
-            ]
-            
-            for pattern in job_count_patterns:
-                matches = re.search(pattern, page_text, re.IGNORECASE)
-                if matches:
-                    count_str = matches.group(1).replace(',', '')
-                    return int(count_str)
+            count_str = self.search_page_source([count_pattern] + JOB_COUNT_PATTERNS)
+            if count_str:
+                return int(count_str.replace(',', '')), "page_source"
+            
+            # A search without results legitimately shows no count
+            if self.is_no_results_page():
+                return 0, "no_results"
             
             # 4. Take a screenshot for debugging in local development
             if not is_github_actions:
@@ -265,11 +1164,12 @@ class GlassdoorScraper:
             logger.warning(f"Could not parse job count from the page with URL: {self.driver.current_url}")
             logger.warning(f"Page title: {self.driver.title}")
                 
-            return 0
+            return 0, "none"
         except Exception as e:
             logger.error(f"Error extracting job count: {str(e)}")
-            return 0
+            return 0, "error"
     
+    @profiled("scroll_page")
     def scroll_page(self):
         """Scroll down the page to ensure all content is loaded."""
         try:
@@ -288,38 +1188,54 @@ class GlassdoorScraper:
                 # Scroll down in chunks
                 target_position = (i + 1) * (total_height / num_steps)
                 self.driver.execute_script(f"window.scrollTo(0, {target_position})")
-                self.random_sleep(0.5, 1.5)
+                self.humanize(0.2, 0.6)
             
             # Scroll back up a bit (human behavior)
             self.driver.execute_script("window.scrollBy(0, -300)")
-            self.random_sleep(0.5, 1)
+            self.humanize(0.2, 0.5)
             
         except Exception as e:
             logger.warning(f"Error during page scrolling: {str(e)}")
     
+    def dismiss_popups(self) -> None:
+        """
+        Close popups on the current page.
+        
+        With the injected dismisser running they are already closed and only
+        counted; otherwise the page is polled with handle_popups.
+        """
+        if self.auto_dismiss and self.collect_dismissed_popups() is not None:
+            return
+        self.handle_popups()
+    
+    def collect_dismissed_popups(self) -> Optional[int]:
+        """
+        Add the popups the injected dismisser closed on the current page to the browser stats.
+        
+        Returns:
+            Popups closed since the last call, or None if the dismisser is not
+            running on this page
+        """
+        try:
+            dismissed = self.driver.execute_script(DISMISSED_POPUPS_SCRIPT)
+        except Exception:
+            return None
+        if dismissed:
+            logger.info(f"Popup dismisser closed {dismissed} popups")
+            self.stats["popups_dismissed"] += dismissed
+        return dismissed
+    
+    @profiled("handle_popups")
     def handle_popups(self):
         """Handle common popups on Glassdoor."""
         try:
-            # List of common popup selectors to close
-            popup_selectors = [
-                'button[aria-label="Close"]', 
-                '.modal-close', 
-                '.close',
-                '[data-test="modal-close"]',
-                '.ReactModal__Close',
-                '.emailAlertPopup button',
-                '.UserAlert button',
-                'button.fc-button',
-                '.fc-close',
-                '#onetrust-accept-btn-handler',
-                '.gdCookieConsentButton',
-                '.modal button',
-                'button.btn',
-                '[aria-label="Close this dialog"]',
-                '.closeIcon'
-            ]
-            
-            for selector in popup_selectors:
+            if PROBE_MODE:
+                snapshot = self.probe_page(max_cards=0, popups=True)
+                if snapshot is not None:
+                    self.close_probed_popups(snapshot)
+                    return
+            
+            for selector in POPUP_SELECTORS:
                 try:
                     elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
                     for element in elements:
@@ -331,10 +1247,7 @@ class GlassdoorScraper:
                     pass
             
             # Handle text-based buttons
-            text_buttons = ["Accept", "Accept All", "Reject", "Skip", "Continue", 
-                           "No Thanks", "Maybe Later", "Not Now", "I Accept"]
-            
-            for button_text in text_buttons:
+            for button_text in POPUP_BUTTON_TEXTS:
                 try:
                     xpath = f"//button[contains(text(),'{button_text}')]"
                     buttons = self.driver.find_elements(By.XPATH, xpath)
@@ -349,6 +1262,62 @@ class GlassdoorScraper:
         except Exception as e:
             logger.warning(f"Error handling popups: {str(e)}")
     
+    def close_probed_popups(self, snapshot: Dict[str, Any]) -> None:
+        """Click the popup-close targets found by probe_page."""
+        for element, label in zip(snapshot["popupTargets"], snapshot["popupLabels"]):
+            try:
+                element.click()
+                logger.info(f"Closed popup with: {label}")
+                self.random_sleep(0.5, 1.5)
+            except Exception:
+                # Closing an earlier popup often removes or hides later targets
+                pass
+    
+    def http_search_results(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch and parse a search page over HTTP, once per run.
+        
+        The 24-hour count and the job listings are read from the same page,
+        as are queries of different roles that share a URL, so the parsed
+        page is kept in the result cache. The HTML itself is dropped as soon
+        as it is parsed.
+        
+        Returns:
+            The parsed page (see parse_search_page), or None if it could not
+            be fetched or was challenged
+        """
+        cache_key = (self.country, url, "page")
+        results = self.cache.get(cache_key)
+        if results is None:
+            html = self.http.fetch(url)
+            if html is None:
+                return None
+            results = parse_search_page(html, base_url=url, limit=MAX_LISTINGS, role=self.role)
+            del html
+            self.sample_memory()
+            self.cache.put(cache_key, results)
+        return results
+    
+    def http_job_count(self, url: str) -> Optional[int]:
+        """
+        Try to read the job count of a search page without the browser.
+        
+        Returns:
+            The job count, or None if the HTTP tier is disabled, was challenged
+            or the page did not show a count
+        """
+        if self.http is None:
+            return None
+        
+        results = self.http_search_results(url)
+        if results is None:
+            return None
+        
+        count = results["count"]
+        if count is None:
+            logger.info(f"No job count in HTTP response, falling back to browser: {url}")
+        return count
+    
     def scrape_jobs_by_period(self, country: str, period_days: int) -> int:
         """
         Scrape job count for a specific country and time period.
@@ -360,29 +1329,36 @@ class GlassdoorScraper:
         Returns:
             The number of jobs found or -1 if data cannot be found
         """
-        logger.info(f"Scraping {JOB_TITLE} jobs in {country} for last {period_days} days")
+        logger.info(f"Scraping {self.role} jobs in {country} for last {period_days} days")
         
-        country_config = COUNTRY_CONFIGS.get(country)
+        country_config = QUERY_CONFIGS.get(self.role, {}).get(country)
         if not country_config:
-            logger.error(f"No configuration found for country: {country}")
+            logger.error(f"No configuration found for {self.role} in {country}")
             return -1
         
+        cache_key = (country, country_config['base_url'], f"fromAge={period_days}")
+        cached_count = self.cache.get(cache_key)
+        if cached_count is not None:
+            logger.info(f"Using cached count of {cached_count} jobs in {country} for last {period_days} days")
+            self.last_source = "cache"
+            return cached_count
+        
         try:
             # Construct the URL with filters
             url = f"{country_config['base_url']}?fromAge={period_days}"
             
-            # Navigate to the page
-            logger.info(f"Navigating to: {url}")
-            self.driver.get(url)
+            # Fast path: plain HTTP request, no browser
+            job_count = self.http_job_count(url)
+            if job_count is not None:
+                logger.info(f"Found {job_count} jobs in {country} for last {period_days} days (HTTP)")
+                self.last_source = "http"
+                self.cache.put(cache_key, job_count)
+                return job_count
             
-            # Wait for page to load
-            self.random_sleep(3, 5)
+            self.last_source = "browser"
             
-            # Handle any popups
-            self.handle_popups()
-            
-            # Wait a bit more
-            self.random_sleep(1, 3)
+            # Navigate to the page and wait for it to render
+            self.load_search_page(url)
             
             # Scroll to load all content
             self.scroll_page()
@@ -396,27 +1372,37 @@ class GlassdoorScraper:
                 return -1
             
             logger.info(f"Found {job_count} jobs in {country} for last {period_days} days")
+            self.cache.put(cache_key, job_count)
+            
+            # The listings are planned on this page too; read them now rather than loading it again
+            if "job_listings" in self.pages.get(url, []):
+                self.page_listings[url] = self.read_job_listings(country)
+                if self.page_listings[url]:
+                    self.cache.put((country, url, "listings"), self.page_listings[url])
             return job_count
         
         except Exception as e:
             logger.error(f"Error scraping {country} for {period_days} days: {str(e)}")
             return -1
     
-    def scrape_remote_vs_onsite(self, country: str) -> Dict[str, int]:
+    def scrape_remote_vs_onsite(self, country: str, total_jobs: Optional[int] = None) -> Dict[str, int]:
         """
         Scrape job counts for remote and on-site jobs.
         
         Args:
             country: Country name to search in
+            total_jobs: 30-day count reported for the country, scraped or
+                carried forward; on-site is derived from it so that remote and
+                on-site add up to it. Scraped here when not given.
             
         Returns:
             Dictionary with remote and on-site job counts or -1 values if data cannot be found
         """
-        logger.info(f"Scraping remote vs on-site {JOB_TITLE} jobs in {country}")
+        logger.info(f"Scraping remote vs on-site {self.role} jobs in {country}")
         
-        country_config = COUNTRY_CONFIGS.get(country)
+        country_config = QUERY_CONFIGS.get(self.role, {}).get(country)
         if not country_config:
-            logger.error(f"No configuration found for country: {country}")
+            logger.error(f"No configuration found for {self.role} in {country}")
             return {"remote": -1, "on_site": -1}
         
         results = {"remote": -1, "on_site": -1}
@@ -425,39 +1411,47 @@ class GlassdoorScraper:
             # Use the remote URL from the config
             url = country_config['remote_url']
             
-            logger.info(f"Navigating to remote jobs: {url}")
-            self.driver.get(url)
-            
-            # Wait for page to load
-            self.random_sleep(3, 5)
-            
-            # Handle any popups
-            self.handle_popups()
-            
-            # Wait a bit more
-            self.random_sleep(1, 3)
-            
-            # Scroll to load all content
-            self.scroll_page()
+            cache_key = (country, url, "remote")
+            remote_count = self.cache.get(cache_key)
+            remote_source = "cache"
             
-            # Extract the job count
-            remote_count = self.extract_job_count()
+            if remote_count is None:
+                # Fast path: plain HTTP request, no browser
+                remote_count = self.http_job_count(url)
+                remote_source = "http"
             
-            # Check if we couldn't find data
-            if remote_count == 0 and ("Just a moment" in self.driver.title or "challenge" in self.driver.current_url):
-                logger.warning(f"Could not retrieve remote job data for {country} (Cloudflare challenge)")
-                return {"remote": -1, "on_site": -1}
+            if remote_count is None:
+                remote_source = "browser"
+                logger.info(f"Loading remote jobs for {country}")
+                self.load_search_page(url)
+                
+                # Scroll to load all content
+                self.scroll_page()
+                
+                # Extract the job count
+                remote_count = self.extract_job_count()
+                
+                # Check if we couldn't find data
+                if remote_count == 0 and ("Just a moment" in self.driver.title or "challenge" in self.driver.current_url):
+                    logger.warning(f"Could not retrieve remote job data for {country} (Cloudflare challenge)")
+                    self.last_source = remote_source
+                    return {"remote": -1, "on_site": -1}
             
-            logger.info(f"Found {remote_count} remote jobs in {country}")
+            if remote_source != "cache":
+                self.cache.put(cache_key, remote_count)
+            logger.info(f"Found {remote_count} remote jobs in {country} ({remote_source})")
             results["remote"] = remote_count
             
             # Get total jobs for on-site calculation
-            total_jobs = self.scrape_jobs_by_period(country, 30)
+            if total_jobs is None:
+                total_jobs = self.scrape_jobs_by_period(country, 30)
             if total_jobs < 0:
                 results["on_site"] = -1
             else:
                 results["on_site"] = max(0, total_jobs - results["remote"])
             
+            # The 30-day lookup above must not mask where the remote count came from
+            self.last_source = remote_source
             return results
             
         except Exception as e:
@@ -474,75 +1468,7 @@ class GlassdoorScraper:
         Returns:
             List of identified skills
         """
-        # Technical skills for data analyst roles
-        technical_skills = [
-            "SQL", "Python", "R", "Excel", "Tableau", "Power BI", "SPSS", "SAS",
-            "D3.js", "Java", "Scala", "MATLAB", "Hadoop", "Spark", "AWS", "Azure",
-            "Google Cloud", "MongoDB", "PostgreSQL", "MySQL", "Oracle", "ETL",
-            "Machine Learning", "Deep Learning", "AI", "Statistics", "Pandas",
-            "NumPy", "Scikit-learn", "TensorFlow", "PyTorch", "Jupyter",
-            "Data Visualization", "Data Modeling", "Business Intelligence",
-            "Data Mining", "A/B Testing", "Data Warehousing", "Looker",
-            "Snowflake", "Redshift", "BigQuery", "Alteryx", "SSRS", "SSIS",
-            "DAX", "Power Query", "VBA", "Qlik", "Cognos", "Teradata",
-            "Informatica", "DataOps", "MLOps", "PowerPoint", "Word", "Outlook",
-            "SharePoint", "Teams", "Jira", "Confluence", "Git", "GitHub", "GitLab",
-            "NoSQL", "Airflow", "dbt", "Data Quality", "JSON", "XML", "API",
-            "REST", "SOAP", "Flask", "Django", "FastAPI", "Data Pipelines",
-            "Google Analytics", "Power Platform", "Databricks", "Talend"
-        ]
-        
-        # Education requirements
-        education_requirements = [
-            "Bachelor's Degree", "Master's Degree", "PhD", "MBA",
-            "Bachelor", "Master", "Doctorate", "BSc", "MSc",
-            "BS", "MS", "Computer Science", "Statistics", "Mathematics",
-            "Information Technology", "Data Science", "Economics", "Business",
-            "Engineering", "Quantitative Field", "Degree"
-        ]
-        
-        # Soft skills and other qualifications
-        soft_skills = [
-            "Communication", "Teamwork", "Problem Solving", "Analytical Thinking",
-            "Critical Thinking", "Attention to Detail", "Time Management",
-            "Project Management", "Leadership", "Collaboration", "Presentation",
-            "Storytelling", "Decision Making", "Self-motivated", "Adaptability",
-            "Creativity", "Organization", "Multitasking", "Prioritization",
-            "Verbal Communication", "Written Communication", "Customer Service",
-            "Business Acumen", "Domain Knowledge", "Industry Experience",
-            "Agile", "Scrum", "Stakeholder Management", "Requirements Gathering"
-        ]
-        
-        # Combine all skills lists
-        all_skills = technical_skills + education_requirements + soft_skills
-        
-        # Case-insensitive skill detection (whole words only)
-        found_skills = []
-        for skill in all_skills:
-            # Using word boundary regex to find whole words
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text, re.IGNORECASE):
-                # Always add the skill with its original case
-                found_skills.append(skill)
-                
-        # Special cases for education requirements with variations
-        degree_patterns = [
-            r"\b[Bb]achelor'?s?\s+[Dd]egree\b",
-            r"\b[Bb][Ss][Cc]\b",
-            r"\b[Mm]aster'?s?\s+[Dd]egree\b",
-            r"\b[Mm][Ss][Cc]\b",
-            r"\b[Pp][Hh][Dd]\b",
-            r"\b[Dd]octoral\s+[Dd]egree\b",
-            r"\b[Dd]egree\s+in\s+[A-Za-z\s]+\b"
-        ]
-        
-        for pattern in degree_patterns:
-            if re.search(pattern, text):
-                match = re.search(pattern, text)
-                if match and match.group(0) not in found_skills:
-                    found_skills.append(match.group(0))
-                    
-        return found_skills
+        return extract_skills(text)
 
     def scrape_job_listings(self, country: str, days: int = 1) -> List[Dict[str, Any]]:
         """
@@ -556,11 +1482,11 @@ class GlassdoorScraper:
         Returns:
             List of job listings with minimal data and skills
         """
-        logger.info(f"Scraping job listings in {country} for the last {days} days")
+        logger.info(f"Scraping {self.role} job listings in {country} for the last {days} days")
         
-        country_config = COUNTRY_CONFIGS.get(country)
+        country_config = QUERY_CONFIGS.get(self.role, {}).get(country)
         if not country_config:
-            logger.error(f"No configuration found for country: {country}")
+            logger.error(f"No configuration found for {self.role} in {country}")
             return []
         
         job_listings = []
@@ -569,22 +1495,58 @@ class GlassdoorScraper:
             # Construct the URL with filters for the last X days
             url = f"{country_config['base_url']}?fromAge={days}"
             
-            # Navigate to the page
-            logger.info(f"Navigating to: {url}")
-            self.driver.get(url)
+            # The listings were read when the page was loaded for its count
+            if url in self.page_listings:
+                logger.info(f"Using {len(self.page_listings[url])} job listings read with the count for {country}")
+                self.last_source = "browser"
+                return self.page_listings[url]
             
-            # Wait for page to load
-            self.random_sleep(3, 5)
+            # Another query of the run may already have read this page
+            cache_key = (country, url, "listings")
+            cached_listings = self.cache.get(cache_key)
+            if cached_listings is not None:
+                logger.info(f"Using {len(cached_listings)} cached job listings for {country}")
+                self.last_source = "cache"
+                return [dict(job_listing) for job_listing in cached_listings]
             
-            # Handle any popups
-            self.handle_popups()
+            # Fast path: cards with descriptions in the plain HTTP response
+            job_listings = self.http_job_listings(url)
+            if job_listings:
+                logger.info(f"Extracted {len(job_listings)} job listings for {country} over HTTP")
+                self.last_source = "http"
+                self.cache.put(cache_key, job_listings)
+                return job_listings
             
-            # Wait a bit more and handle Cloudflare
-            self.random_sleep(1, 3)
+            self.last_source = "browser"
+            
+            # Navigate to the page (no count is read here, so only 3-5s + 1-3s of fixed sleeps were saved)
+            self.load_search_page(url, fixed_sleep=6.0)
+            
+            # Handle Cloudflare
             if not self.handle_cloudflare():
                 logger.warning(f"Could not bypass Cloudflare protection when scraping job listings for {country}")
                 return []
             
+            job_listings_with_skills = self.read_job_listings(country)
+            if job_listings_with_skills:
+                self.cache.put(cache_key, job_listings_with_skills)
+            return job_listings_with_skills
+            
+        except Exception as e:
+            logger.error(f"Error scraping job listings for {country}: {str(e)}")
+            return []
+    
+    def read_job_listings(self, country: str) -> List[Dict[str, Any]]:
+        """
+        Read the job listings of the search page loaded in the browser.
+        
+        Args:
+            country: Country being scraped
+            
+        Returns:
+            List of job listings with minimal data and skills
+        """
+        try:
             # Attempt to extract skills directly from the page without clicking
             # First, try to get job description from the current view
             job_listings_with_skills = self.extract_skills_from_page(country)
@@ -596,7 +1558,7 @@ class GlassdoorScraper:
                 # Scroll gradually to load all content
                 for _ in range(5):
                     self.driver.execute_script("window.scrollBy(0, 500)")
-                    self.random_sleep(1, 2)
+                    self.humanize(0.3, 0.8)
                 
                 # Alternative method: directly navigate to job detail pages
                 job_listings_with_skills = self.extract_skills_using_direct_urls(country)
@@ -605,107 +1567,153 @@ class GlassdoorScraper:
             return job_listings_with_skills
             
         except Exception as e:
-            logger.error(f"Error scraping job listings for {country}: {str(e)}")
+            logger.error(f"Error reading job listings for {country}: {str(e)}")
+            return []
+    
+    def http_job_listings(self, url: str) -> List[Dict[str, Any]]:
+        """
+        Try to build job listings from the result pages of a search without the browser.
+        
+        Result pages are followed until MAX_LISTINGS cards were read, a page
+        has no cards with descriptions or there is no next page.
+        
+        Returns:
+            Job listings, or an empty list if the HTTP tier is disabled, was
+            challenged or the first page's cards carry no descriptions to
+            extract skills from
+        """
+        if self.http is None:
             return []
+        
+        job_listings = []
+        cards_read = 0
+        seen_links = set()
+        page_url = url
+        for _ in range(MAX_RESULT_PAGES):
+            results = self.http_search_results(page_url)
+            cards = results["cards"] if results else []
+            if not any(card["description"] for card in cards):
+                break
+            
+            for card in cards[:MAX_LISTINGS - cards_read]:
+                cards_read += 1
+                # Pages can overlap when new jobs are posted while walking them
+                if card["link"] and card["link"] in seen_links:
+                    continue
+                seen_links.add(card["link"])
+                job_listing = self.http_listing(card)
+                if job_listing:
+                    job_listings.append(job_listing)
+            
+            if cards_read >= MAX_LISTINGS or not results["next"]:
+                break
+            page_url = results["next"]
+        return job_listings
+    
+    def http_listing(self, card: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """Turn a job card parsed over HTTP into a job listing; None for cards without a title or skills."""
+        # Cards without a title get the role as a placeholder
+        placeholder_title = not card["title"]
+        title = card["title"] or self.role
+        company = card["company"] or "Unknown Company"
+        
+        known_listing = self.known_listing(title, company, card["link"], placeholder_title)
+        if known_listing:
+            return known_listing
+        
+        skills = self.extract_skills_from_text(card["description"]) if card["description"] else []
+        
+        # Same rule as the browser path: only keep non-default titles or cards with skills
+        if title == self.role and not skills:
+            return None
+        
+        job_listing = {
+            "title": title,
+            "company": company,
+            "skills": skills,
+            "link": card["link"]
+        }
+        self.remember_listing(job_listing, card["description"], placeholder_title)
+        return job_listing
+    
+    def known_listing(self, title: str, company: str, link: str = "",
+                      placeholder_title: bool = False) -> Optional[Dict[str, Any]]:
+        """Return the stored listing of a job parsed in an earlier run, if any."""
+        if self.job_index is None:
+            return None
+        return self.job_index.lookup(title, company, link, placeholder_title)
+    
+    def remember_listing(self, job_listing: Dict[str, Any], description: str = "",
+                         placeholder_title: bool = False) -> None:
+        """
+        Store a freshly parsed listing in the seen-jobs index.
+        
+        Its description is archived first, and the listing is assigned to
+        its near-duplicate posting unless it was taken from one. A listing
+        whose title is the role standing in for a missing one
+        (placeholder_title) is not indexed without a job link.
+        """
+        if description and self.archive is not None:
+            job_listing["description_id"] = self.archive.add(description)
+        if self.near_duplicates is not None and "posting_id" not in job_listing:
+            self.near_duplicates.assign(job_listing, description)
+        if self.job_index is not None:
+            self.job_index.record(job_listing, placeholder_title)
     
-    def extract_skills_from_page(self, country: str) -> List[Dict[str, Any]]:
+    def extract_skills_from_page(self, country: str, max_listings: int = MAX_LISTINGS) -> List[Dict[str, Any]]:
         """
-        Extract skills directly from job descriptions visible on the page.
+        Extract skills directly from job descriptions visible on the result pages.
+        
+        Cards are read in batches while walking the result pages, so memory
+        stays flat however many listings are read.
+        
+        Args:
+            country: Country being scraped
+            max_listings: Maximum number of job cards to read
         """
         job_listings = []
-        job_count = 0
+        seen_jobs = set()
         
         try:
-            # Updated selectors for the new Glassdoor UI
-            job_card_selectors = [
-                ".jobCard",
-                ".JobCard",
-                "[data-test='jobCard']",
-                ".css-bkasv9",
-                ".JobsList_jobListItem__8HcYA",
-                ".JobsList_normJobListItem__eCZRH", 
-                "[data-test='job-list-item']",
-                "li[id^='job_']"
-            ]
-            
-            # Try each selector to find job cards
-            job_cards = []
-            for selector in job_card_selectors:
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if job_cards:
-                    logger.info(f"Found {len(job_cards)} job cards using selector: {selector}")
-                    break
-            
-            # Process job cards (limit to 20)
-            for card in job_cards[:20]:
-                try:
-                    # Extract basic info with fallbacks
-                    title = self.get_text_from_element(card, [
-                        ".jobTitle", "[data-test='job-title']", ".heading_Heading__BqX5J",
-                        "h2", "h3", "a[data-test='job-link']", ".JobCard_jobTitle__TrVlK"
-                    ], "Data Analyst")
-                    
-                    company = self.get_text_from_element(card, [
-                        ".company", "[data-test='employer-name']", 
-                        ".EmployerProfile_employerNameHeading__bXBYr h4",
-                        ".JobCard_companyName__lwjW4"
-                    ], "Unknown Company")
-                    
-                    # Try to find job description without clicking
-                    description = self.get_text_from_element(card, [
-                        ".jobDescriptionContent", 
-                        "[data-test='jobDescriptionText']",
-                        ".JobDetails_jobDescription__uW_fK",
-                        ".css-w3wpmi"
-                    ], "")
-                    
-                    # If description not found in card, look for expanded details
-                    if not description:
-                        # Check if there's an expanded job detail section
-                        detail_selectors = [
-                            ".JobDetails_jobDescription__uW_fK",
-                            "div[data-test='job-description']",
-                            "[data-test='jobDescriptionText']",
-                            ".jobDescriptionContent"
-                        ]
-                        
-                        for selector in detail_selectors:
-                            elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                            for element in elements:
-                                if element.is_displayed() and element.text.strip():
-                                    description = element.text.strip()
-                                    break
-                            
-                            if description:
-                                break
-                    
-                    # Get URL if available
-                    job_url = ""
+            for job_cards, snapshot in self.iter_card_batches(max_listings):
+                for card in job_cards:
                     try:
-                        links = card.find_elements(By.TAG_NAME, "a")
-                        for link in links:
-                            href = link.get_attribute("href")
-                            if href and ("job-details" in href or "Job-View" in href or "/job/" in href):
-                                job_url = href
-                                break
-                    except:
-                        pass
-                    
-                    # Extract skills from the description
-                    skills = []
-                    if description:
-                        skills = self.extract_skills_from_text(description)
-                    
-                    # If no description on page, create minimal job listing
-                    if not skills and not description:
-                        # Minimal job listing with just title and company
-                        job_listing = {
-                            "title": title,
-                            "company": company,
-                            "skills": [],
-                            "link": job_url
-                        }
-                    else:
+                        # Extract basic info with fallbacks
+                        title = self.get_text_from_element(card, CARD_TITLE_SELECTORS, "", ("search", "card_title"))
+                        placeholder_title = not title
+                        title = title or self.role
+                        company = self.get_text_from_element(card, CARD_COMPANY_SELECTORS, "Unknown Company",
+                                                             ("search", "card_company"))
+                        
+                        # Get URL if available
+                        job_url = self.get_link_from_card(card)
+                        
+                        # Pages can overlap when new jobs are posted while walking them
+                        job_key = job_url or (title, company)
+                        if job_key in seen_jobs:
+                            continue
+                        seen_jobs.add(job_key)
+                        
+                        # Jobs parsed in an earlier run keep their skills
+                        known_listing = self.known_listing(title, company, job_url, placeholder_title)
+                        if known_listing:
+                            job_listings.append(known_listing)
+                            continue
+                        
+                        # Try to find job description without clicking
+                        description = self.get_text_from_element(card, CARD_DESCRIPTION_SELECTORS, "",
+                                                                 ("search", "card_description"))
+                        
+                        # If description not found in card, look for expanded details
+                        if not description:
+                            description = self.get_text_from_page(EXPANDED_DESCRIPTION_SELECTORS, "", snapshot,
+                                                              ("search", "expanded_description"))
+                        
+                        # Extract skills from the description
+                        skills = []
+                        if description:
+                            skills = self.extract_skills_from_text(description)
+                        
                         # Create job listing object with minimal data
                         job_listing = {
                             "title": title,
@@ -713,28 +1721,140 @@ class GlassdoorScraper:
                             "skills": skills,
                             "link": job_url
                         }
-                    
-                    # Add to list if we found a title
-                    if title and title != "Data Analyst" or skills:  # Only add if title is non-default or we found skills
-                        job_listings.append(job_listing)
-                        job_count += 1
-                        logger.info(f"Successfully extracted data for {title} at {company} - Found {len(skills)} skills")
-                    
-                except Exception as e:
-                    logger.warning(f"Error processing job card: {str(e)}")
+                        
+                        # Add to list if we found a title
+                        if title and title != self.role or skills:  # Only add if title is non-default or we found skills
+                            job_listings.append(job_listing)
+                            self.remember_listing(job_listing, description, placeholder_title)
+                            logger.info(f"Successfully extracted data for {title} at {company} - Found {len(skills)} skills")
+                        
+                    except Exception as e:
+                        logger.warning(f"Error processing job card: {str(e)}")
             
             return job_listings
             
         except Exception as e:
             logger.warning(f"Error extracting skills from page: {str(e)}")
-            return []
+            return job_listings
+    
+    def iter_card_batches(self, max_cards: int) -> Iterator[Tuple[List[Any], Optional[Dict[str, Any]]]]:
+        """
+        Walk the result pages of a search and yield its job cards in batches.
+        
+        Starts on the result page the browser is on. Cards are read
+        LISTING_BATCH_SIZE at a time; once the page's cards are used up, the
+        list is extended with the "load more" button, or the next result page
+        is opened, for at most MAX_RESULT_PAGES pages.
+        
+        Args:
+            max_cards: Number of cards after which to stop
+            
+        Yields:
+            A batch of cards (probed dicts, or WebElements without PROBE_MODE)
+            and the snapshot they were read with (None without PROBE_MODE)
+        """
+        cards_read = 0
+        offset = 0
+        pages = 1
+        while cards_read < max_cards:
+            batch, snapshot, next_page, load_more = self.read_card_batch(
+                offset, min(LISTING_BATCH_SIZE, max_cards - cards_read))
+            self.sample_memory(snapshot)
+            if batch:
+                if offset == 0:
+                    logger.info(f"Reading job cards from result page {pages}")
+                cards_read += len(batch)
+                offset += len(batch)
+                yield batch, snapshot
+                continue
+            
+            # The cards loaded so far are used up
+            if pages >= MAX_RESULT_PAGES:
+                break
+            if load_more is not None and self.load_more_cards(load_more, offset):
+                pages += 1
+            elif next_page and self.load_search_page(next_page, fixed_sleep=6.0):
+                pages += 1
+                offset = 0
+            else:
+                break
+        
+        logger.info(f"Read {cards_read} job cards from {pages} result pages")
+    
+    def read_card_batch(self, offset: int, count: int) -> Tuple[List[Any], Optional[Dict[str, Any]], str, Any]:
+        """
+        Read up to count job cards of the current page, starting at offset.
+        
+        Returns:
+            The cards, the probe snapshot (None without PROBE_MODE), the next
+            result page's URL ("" if there is none) and the "load more"
+            button (None if there is none)
+        """
+        snapshot = self.probe_page(max_cards=count, card_offset=offset) if PROBE_MODE else None
+        if snapshot is not None:
+            if snapshot["cards"] and offset == 0:
+                logger.info(f"Found {snapshot['cardCount']} job cards using selector: {snapshot['cardSelector']}")
+                self.selectors.record_hit("search", "job_card", snapshot["cardSelector"])
+            return snapshot["cards"], snapshot, snapshot["nextPage"], snapshot["loadMore"]
+        
+        job_cards = []
+        for selector in self.selectors.order("search", "job_card", JOB_CARD_SELECTORS):
+            job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
+            if job_cards:
+                if offset == 0:
+                    logger.info(f"Found {len(job_cards)} job cards using selector: {selector}")
+                    self.selectors.record_hit("search", "job_card", selector)
+                break
+        
+        next_page = ""
+        next_link = self.first_visible_element(NEXT_PAGE_SELECTORS)
+        if next_link is not None:
+            next_page = next_link.get_attribute("href") or ""
+        return job_cards[offset:offset + count], None, next_page, self.first_visible_element(LOAD_MORE_SELECTORS)
+    
+    def first_visible_element(self, selectors: List[str]) -> Any:
+        """Return the first visible element matched by the selectors, or None."""
+        for selector in selectors:
+            try:
+                for element in self.driver.find_elements(By.CSS_SELECTOR, selector):
+                    if element.is_displayed():
+                        return element
+            except Exception:
+                continue
+        return None
+    
+    def load_more_cards(self, button: Any, cards_loaded: int) -> bool:
+        """
+        Click a "load more" button and wait for more job cards to appear.
+        
+        Returns:
+            True once the page has more than cards_loaded cards, False if
+            none appeared within PAGE_READY_TIMEOUT
+        """
+        try:
+            button.click()
+            WebDriverWait(self.driver, PAGE_READY_TIMEOUT).until(
+                lambda driver: driver.execute_script(CARD_COUNT_SCRIPT, JOB_CARD_SELECTORS) > cards_loaded
+            )
+            self.humanize(0.3, 0.8)
+            return True
+        except Exception as e:
+            logger.info(f"No more job cards after {cards_loaded}: {str(e)}")
+            return False
+    
+    def sample_memory(self, snapshot: Optional[Dict[str, Any]] = None) -> None:
+        """Update the peak RSS of this process, and of the browser's JS heap if probed, for the current country."""
+        self.peak_rss_mb = max(self.peak_rss_mb, rss_mb())
+        if snapshot is not None and snapshot.get("heapBytes"):
+            self.peak_heap_mb = max(self.peak_heap_mb, snapshot["heapBytes"] / 2 ** 20)
     
     def extract_skills_using_direct_urls(self, country: str) -> List[Dict[str, Any]]:
         """
         Alternative approach: Find job URLs and load each directly to extract skills.
-        """
-        job_listings = []
         
+        Detail pages are fetched concurrently over HTTP; pages that fail there
+        are loaded in the browser one after another.
+        """
         try:
             # Try to find direct job links
             link_elements = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='job-details'], a[href*='Job-View'], a[href*='/job/']")
@@ -747,179 +1867,659 @@ class GlassdoorScraper:
                     job_urls.append(href)
             
             logger.info(f"Found {len(job_urls)} unique job URLs")
+            job_urls = job_urls[:MAX_DETAIL_PAGES]
             
-            # Visit each URL directly (limit to 10)
-            for i, url in enumerate(job_urls[:10]):
-                try:
-                    # Navigate to job details page
-                    self.driver.get(url)
-                    self.random_sleep(2, 3)
-                    
-                    # Handle popups
-                    self.handle_popups()
-                    
-                    # Extract title
-                    title = self.get_text_from_page([
-                        "#jd-job-title", 
-                        "h1.heading_Heading__BqX5J",
-                        "[data-test='job-title']"
-                    ], "Data Analyst")
-                    
-                    # Extract company
-                    company = self.get_text_from_page([
-                        ".EmployerProfile_employerNameHeading__bXBYr h4",
-                        "[data-test='employer-name']"
-                    ], "Unknown Company")
-                    
-                    # Extract job description
-                    description = self.get_text_from_page([
-                        ".JobDetails_jobDescription__uW_fK",
-                        "[data-test='jobDescriptionText']",
-                        ".jobDescriptionContent"
-                    ], "")
-                    
-                    # Extract skills
-                    skills = []
-                    if description:
-                        skills = self.extract_skills_from_text(description)
-                    
-                    # Create job listing with minimal info
-                    job_listing = {
-                        "title": title,
-                        "company": company,
-                        "skills": skills,
-                        "link": url
-                    }
-                    
-                    job_listings.append(job_listing)
-                    logger.info(f"Successfully extracted skills for {title} at {company} - Found {len(skills)} skills")
-                    
-                except Exception as e:
-                    logger.warning(f"Error processing job URL {url}: {str(e)}")
+            # Only fetch jobs that were not parsed in an earlier run
+            listings_by_url = {}
+            for url in job_urls:
+                known_listing = self.known_listing("", "", url)
+                if known_listing:
+                    listings_by_url[url] = known_listing
+            if listings_by_url:
+                logger.info(f"Skipping {len(listings_by_url)} job detail pages already parsed in earlier runs")
             
-            return job_listings
+            # Reposts of a known posting under a new link would only repeat its
+            # skills; the card's snippet has to back up the title and company
+            if self.near_duplicates is not None:
+                reposts = 0
+                headers = self.card_headers()
+                for url in job_urls:
+                    if url in listings_by_url or url not in headers:
+                        continue
+                    repost = self.near_duplicates.match_header(*headers[url], url)
+                    if repost:
+                        listings_by_url[url] = repost
+                        self.remember_listing(repost)
+                        reposts += 1
+                if reposts:
+                    logger.info(f"Skipping {reposts} job detail pages of reposted jobs")
+            new_urls = [url for url in job_urls if url not in listings_by_url]
+            
+            if self.http is not None and new_urls:
+                start = time.monotonic()
+                fetched = asyncio.run(self.fetch_job_details(new_urls))
+                logger.info(f"Fetched {len(fetched)} of {len(new_urls)} job detail pages over HTTP "
+                            f"in {time.monotonic() - start:.1f}s")
+                listings_by_url.update(fetched)
+            
+            # Visit the rest directly in the browser
+            remaining = [url for url in job_urls if url not in listings_by_url]
+            for url in remaining[:MAX_BROWSER_DETAIL_PAGES]:
+                job_listing = self.browser_job_detail(url)
+                if job_listing:
+                    listings_by_url[url] = job_listing
+            
+            # Keep the order the links appeared in on the results page
+            return [listings_by_url[url] for url in job_urls if url in listings_by_url]
             
         except Exception as e:
             logger.warning(f"Error in direct URL extraction: {str(e)}")
             return []
     
-    def get_text_from_element(self, element, selectors, default=""):
-        """Helper to try multiple selectors for getting text from an element."""
+    def card_headers(self) -> Dict[str, Tuple[str, str, str]]:
+        """Title, company and description snippet of the job cards on the current page, by job link."""
+        headers = {}
+        try:
+            cards, _, _, _ = self.read_card_batch(0, MAX_DETAIL_PAGES)
+            for card in cards:
+                link = self.get_link_from_card(card)
+                title = self.get_text_from_element(card, CARD_TITLE_SELECTORS)
+                company = self.get_text_from_element(card, CARD_COMPANY_SELECTORS)
+                snippet = self.get_text_from_element(card, CARD_DESCRIPTION_SELECTORS)
+                if link and title and company and snippet:
+                    headers[link] = (title, company, snippet)
+        except Exception as e:
+            logger.warning(f"Could not read job card titles: {str(e)}")
+        return headers
+    
+    async def fetch_job_details(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch job detail pages concurrently and extract skills as each one arrives.
+        
+        Args:
+            urls: Job detail URLs
+            
+        Returns:
+            Job listings keyed by URL, for the pages that had a description
+        """
+        semaphore = asyncio.Semaphore(DETAIL_CONCURRENCY)
+        
+        async def fetch(url: str):
+            async with semaphore:
+                return url, await asyncio.to_thread(self.http.fetch, url)
+        
+        listings_by_url = {}
+        for next_page in asyncio.as_completed([fetch(url) for url in urls]):
+            url, html = await next_page
+            if not html:
+                continue
+            
+            detail = parse_job_detail(html)
+            if not detail["description"]:
+                continue
+            
+            placeholder_title = not detail["title"]
+            title = detail["title"] or self.role
+            company = detail["company"] or "Unknown Company"
+            skills = self.extract_skills_from_text(detail["description"])
+            listings_by_url[url] = {
+                "title": title,
+                "company": company,
+                "skills": skills,
+                "link": url
+            }
+            self.remember_listing(listings_by_url[url], detail["description"], placeholder_title)
+            logger.info(f"Successfully extracted skills for {title} at {company} - Found {len(skills)} skills")
+        
+        return listings_by_url
+    
+    def browser_job_detail(self, url: str) -> Optional[Dict[str, Any]]:
+        """Load a job detail page in the browser and extract its skills."""
+        try:
+            # Navigate to job details page and wait for the description
+            self.humanize_remaining = HUMANIZE_BUDGET
+            self.navigate(url, JOB_DESCRIPTION_SELECTORS, timeout=10)
+            self.record_current_page()
+            
+            # Handle popups
+            self.dismiss_popups()
+            self.humanize(0.5, 1.0)
+            
+            # Read title, company and description in one round trip when probing
+            snapshot = self.probe_page(max_cards=0) if PROBE_MODE else None
+            
+            # Extract title
+            title = self.get_text_from_page(JOB_TITLE_SELECTORS, "", snapshot, ("detail", "title"))
+            placeholder_title = not title
+            title = title or self.role
+            
+            # Extract company
+            company = self.get_text_from_page(JOB_COMPANY_SELECTORS, "Unknown Company", snapshot, ("detail", "company"))
+            
+            # Extract job description
+            description = self.get_text_from_page(JOB_DESCRIPTION_SELECTORS, "", snapshot, ("detail", "description"))
+            
+            # Extract skills
+            skills = []
+            if description:
+                skills = self.extract_skills_from_text(description)
+            
+            logger.info(f"Successfully extracted skills for {title} at {company} - Found {len(skills)} skills")
+            
+            # Create job listing with minimal info
+            job_listing = {
+                "title": title,
+                "company": company,
+                "skills": skills,
+                "link": url
+            }
+            self.remember_listing(job_listing, description, placeholder_title)
+            return job_listing
+            
+        except Exception as e:
+            logger.warning(f"Error processing job URL {url}: {str(e)}")
+            return None
+    
+    def get_text_from_element(self, element, selectors, default="", field=None):
+        """
+        Helper to try multiple selectors for getting text from an element.
+        
+        The element may be a WebElement or a job card from probe_page. If a
+        (page type, field) is given, the selectors are tried in the order of
+        the selector registry and the one that finds the text is recorded.
+        """
+        if field:
+            selectors = self.selectors.order(*field, selectors)
+        
+        if isinstance(element, dict):
+            return self.first_probed_text(element["texts"], selectors, default, field)
+        
         for selector in selectors:
             try:
                 elements = element.find_elements(By.CSS_SELECTOR, selector)
                 for el in elements:
                     if el.is_displayed() and el.text.strip():
+                        if field:
+                            self.selectors.record_hit(*field, selector)
                         return el.text.strip()
             except:
                 continue
         return default
     
-    def get_text_from_page(self, selectors, default=""):
-        """Helper to try multiple selectors for getting text from the page."""
+    def get_text_from_page(self, selectors, default="", snapshot=None, field=None):
+        """
+        Helper to try multiple selectors for getting text from the page.
+        
+        If a probe_page snapshot is given, its texts are used instead of the
+        live page. A (page type, field) orders the selectors and records hits
+        as in get_text_from_element.
+        """
+        if field:
+            selectors = self.selectors.order(*field, selectors)
+        
+        if snapshot is not None:
+            return self.first_probed_text(snapshot["texts"], selectors, default, field)
+        
         for selector in selectors:
             try:
                 elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
                 for el in elements:
                     if el.is_displayed() and el.text.strip():
+                        if field:
+                            self.selectors.record_hit(*field, selector)
                         return el.text.strip()
             except:
                 continue
         return default
+    
+    def first_probed_text(self, texts: Dict[str, str], selectors: List[str], default: str, field=None) -> str:
+        """Return the first non-empty probed text of the selectors, recording the selector that had it."""
+        for selector in selectors:
+            if texts.get(selector):
+                if field:
+                    self.selectors.record_hit(*field, selector)
+                return texts[selector]
+        return default
+    
+    def get_link_from_card(self, card) -> str:
+        """Return the job detail link of a job card (WebElement or probe_page card)."""
+        if isinstance(card, dict):
+            return card["link"]
+        
+        try:
+            links = card.find_elements(By.TAG_NAME, "a")
+            for link in links:
+                href = link.get_attribute("href")
+                if href and ("job-details" in href or "Job-View" in href or "/job/" in href):
+                    return href
+        except:
+            pass
+        return ""
 
-    def scrape_country(self, country: str) -> Dict[str, Any]:
+    def scrape_country(self, country: str, role: str = JOB_TITLE) -> Dict[str, Any]:
         """
         Scrape all job data for a specific country.
         
         Args:
             country: Country name to scrape
+            role: Role to search for, a key of QUERY_CONFIGS
             
         Returns:
             Dictionary with all job data for the country
         """
-        logger.info(f"Starting scrape for {country}")
+        logger.info(f"Starting scrape for {role} in {country}")
+        self.country = country
+        self.role = role
+        # Each planned page is loaded once; every field planned for it is read from that load
+        country_config = QUERY_CONFIGS.get(role, {}).get(country)
+        self.pages = plan_pages(plan_queries({role: {country: country_config}}, TIME_PERIODS)).get(
+            (role, country), {}) if country_config else {}
+        self.page_listings = {}
+        self.peak_rss_mb = rss_mb()
+        self.peak_heap_mb = 0.0
+        
+        # The count history only covers JOB_TITLE, so other roles scrape every count
+        scheduler = self.scheduler if role == JOB_TITLE else None
         
         # Initialize country data with "Can't find data" indicator (-1)
-        country_data = {
-            "country": country,
-            "last_24h": -1,
-            "last_7d": -1,
-            "last_30d": -1,
-            "remote": -1,
-            "on_site": -1,
-            "job_listings": []
-        }
+        country_data = empty_country_data(country)
+        
+        # Which tier served each value
+        sources = {}
+        
+        # Date each carried-forward count was observed
+        stale = {}
         
         # Scrape job counts for different time periods
         for period_name, days in TIME_PERIODS.items():
+            carried = scheduler.carry_forward(country, period_name, country_data, stale) if scheduler else None
+            if carried:
+                country_data[period_name], stale[period_name] = carried
+                sources[period_name] = "carried"
+                continue
+            
             count = self.scrape_jobs_by_period(country, days)
             country_data[period_name] = count
+            sources[period_name] = self.last_source
         
-        # Scrape remote vs on-site counts
-        remote_onsite = self.scrape_remote_vs_onsite(country)
-        country_data["remote"] = remote_onsite["remote"]
-        country_data["on_site"] = remote_onsite["on_site"]
+        # Remote and on-site are scraped together, so both must be carried to skip the page
+        carried_remote = scheduler.carry_forward(country, "remote", country_data, stale) if scheduler else None
+        carried_on_site = scheduler.carry_forward(country, "on_site", country_data, stale) if scheduler else None
+        if carried_remote and carried_on_site:
+            country_data["remote"], stale["remote"] = carried_remote
+            country_data["on_site"], stale["on_site"] = carried_on_site
+            sources["remote"] = "carried"
+        else:
+            # Scrape remote vs on-site counts; on-site is split off the 30-day count
+            # reported above, even when that was carried forward
+            remote_onsite = self.scrape_remote_vs_onsite(country, country_data["last_30d"])
+            country_data["remote"] = remote_onsite["remote"]
+            country_data["on_site"] = remote_onsite["on_site"]
+            sources["remote"] = self.last_source
         
         # Scrape job listings for the last 24 hours
         job_listings = self.scrape_job_listings(country, days=1)
         country_data["job_listings"] = job_listings
+        sources["job_listings"] = self.last_source
+        
+        country_data["sources"] = sources
+        country_data["stale"] = stale
         
-        logger.info(f"Completed scrape for {country}: {country_data}")
+        # With several workers the process is shared, so this includes what the others hold
+        self.sample_memory()
+        country_data["memory"] = {"peak_rss_mb": round(self.peak_rss_mb, 1)}
+        if self.peak_heap_mb:
+            country_data["memory"]["peak_browser_heap_mb"] = round(self.peak_heap_mb, 1)
+        logger.info(f"Peak memory for {role} in {country}: {country_data['memory']}")
+        
+        logger.info(f"Completed scrape for {role} in {country}: {country_data}")
         return country_data
 
 
-def run_scraper() -> Dict[str, Any]:
+def scrape_worker(worker_id: int, task_queue: "queue.Queue[Tuple[str, str]]", results: Dict[Tuple[str, str], Any],
+                  cache: Optional[ResultCache] = None, job_index: Optional[JobIndex] = None,
+                  browser_stats: Optional[List[Dict[str, float]]] = None,
+                  profile: Optional[RunProfile] = None, scheduler: Optional[Scheduler] = None,
+                  retry_budget: Optional[RetryBudget] = None, checkpoint: Optional[Checkpoint] = None,
+                  selectors: Optional[SelectorRegistry] = None,
+                  archive: Optional[DescriptionArchive] = None,
+                  near_duplicates: Optional[NearDuplicateIndex] = None) -> None:
     """
-    Run the scraper for all countries.
+    Pull (role, country) tasks from the shared queue and scrape them with a dedicated browser.
     
-    Returns:
-        Dictionary with all job data
+    A country that raises is recorded with "Can't find data" values and the
+    browser is restarted before the next task, so one dead driver only
+    costs the country it was working on.
+    
+    Args:
+        worker_id: Index of the worker, used in log messages
+        task_queue: Queue of (role, country) tasks still to scrape
+        results: Shared dictionary the worker writes country data into, keyed by task
+        cache: Result cache shared by all workers of the run
+        job_index: Seen-jobs index shared by all workers of the run
+        browser_stats: List the worker appends its browser counters to
+        profile: Stage timings shared by all workers of the run
+        scheduler: Decides which counts are carried forward instead of scraped
+        retry_budget: Navigation retry budget and failure counts shared by all workers of the run
+        checkpoint: Checkpoint each completed country is written to
+        selectors: Selector hit stats shared by all workers of the run
+        archive: Description archive shared by all workers of the run
+        near_duplicates: Near-duplicate postings index shared by all workers of the run
     """
-    scraper = GlassdoorScraper()
+    # Reuse a browser left open by an earlier run when there is one
+    try:
+        scraper = _idle_scrapers.get_nowait()
+        scraper.cache = cache if cache is not None else ResultCache()
+        scraper.job_index = job_index
+        scraper.profile = profile if profile is not None else RunProfile()
+        scraper.scheduler = scheduler
+        scraper.retry_budget = retry_budget if retry_budget is not None else RetryBudget(RETRY_BUDGET)
+        scraper.selectors = selectors if selectors is not None else SelectorRegistry(reorder=ADAPTIVE_SELECTORS)
+        scraper.archive = archive
+        scraper.near_duplicates = near_duplicates
+        scraper.stats = new_browser_stats()
+        logger.info(f"[worker {worker_id}] Reusing browser from an earlier run")
+    except queue.Empty:
+        scraper = GlassdoorScraper(cache=cache, job_index=job_index, profile=profile, scheduler=scheduler,
+                                   retry_budget=retry_budget, selectors=selectors, archive=archive,
+                                   near_duplicates=near_duplicates)
+    
+    scraped_any = False
     
     try:
-        scraper.initialize()
-        
-        all_data = {"countries": {}}
-        
-        for country in COUNTRIES:
-            logger.info(f"Processing country: {country}")
-            country_data = scraper.scrape_country(country)
-            all_data["countries"][country] = country_data
-        
-        # Add timestamp in UTC for consistency
-        all_data["last_updated"] = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-        
-        return all_data
+        while True:
+            try:
+                task = task_queue.get_nowait()
+            except queue.Empty:
+                return
+            role, country = task
+            
+            if not scraper.is_alive():
+                scraper.close()
+                try:
+                    scraper.initialize()
+                except Exception as e:
+                    # Hand the task back so a healthy worker can pick it up
+                    logger.error(f"[worker {worker_id}] Could not start browser, stopping worker: {str(e)}")
+                    task_queue.put(task)
+                    return
+            
+            logger.info(f"[worker {worker_id}] Processing {role} in {country}")
+            try:
+                results[task] = scraper.scrape_country(country, role)
+                got_data = results[task]["last_30d"] >= 0 or results[task]["remote"] >= 0
+                scraped_any = scraped_any or got_data
+                
+                # Countries without any data are left for a resumed run to try again
+                if checkpoint is not None and got_data:
+                    checkpoint.save(role, country, results[task])
+            except Exception as e:
+                logger.error(f"[worker {worker_id}] Browser failed while scraping {role} in {country}: {str(e)}")
+                results[task] = empty_country_data(country)
+                scraper.close()
     
     finally:
-        scraper.close()
+        # Cookies are only worth keeping from a browser that actually got data
+        if PERSIST_COOKIES and scraped_any and scraper.is_alive():
+            scraper.save_cookies()
+        
+        if browser_stats is not None:
+            browser_stats.append(scraper.stats)
+        
+        if KEEP_BROWSERS and scraper.is_alive():
+            _idle_scrapers.put(scraper)
+        else:
+            scraper.close()
+
+
+def shutdown_browsers() -> None:
+    """Close the browsers kept open between runs by KEEP_BROWSERS."""
+    while True:
+        try:
+            _idle_scrapers.get_nowait().close()
+        except queue.Empty:
+            return
 
 
-def save_data(data: Dict[str, Any], output_path: Path) -> None:
-    """Save the scraped data to a JSON file."""
-    logger.info(f"Saving data to {output_path}")
+def run_scraper(countries: Optional[List[str]] = None, roles: Optional[List[str]] = None,
+                workers: int = MAX_WORKERS,
+                job_index_file: Path = JOB_INDEX_FILE, profile_file: Path = PROFILE_FILE,
+                adaptive: bool = ADAPTIVE, checkpoint_file: Path = CHECKPOINT_FILE,
+                resume: bool = RESUME, selector_file: Path = SELECTOR_STATS_FILE,
+                archive_dir: Path = ARCHIVE_DIR,
+                near_duplicates_file: Path = NEAR_DUPLICATES_FILE) -> Dict[str, Any]:
+    """
+    Run the scraper for every role in every country.
+    
+    The roles x countries x time windows matrix is planned up front. Each
+    scraper loads the pages planned for its country once (see plan_pages),
+    and roles that read the same page share it through the run's result cache.
     
-    # Create output directory if it doesn't exist
-    os.makedirs(output_path.parent, exist_ok=True)
+    Args:
+        countries: Countries to scrape (defaults to COUNTRIES)
+        roles: Roles to scrape, keys of QUERY_CONFIGS (defaults to all of them)
+        workers: Maximum number of browsers running at the same time
+        job_index_file: Seen-jobs index used when INCREMENTAL is on
+        profile_file: JSON-lines file the run's stage timings are appended to
+        adaptive: Carry slow-moving counts forward from the history when they
+            are unlikely to have changed
+        checkpoint_file: File every completed country is checkpointed to
+        resume: Take countries already completed today from the checkpoint
+        selector_file: Selector hit stats, read at the start and updated at the end
+        archive_dir: Description archive used when ARCHIVE_DESCRIPTIONS is on
+        near_duplicates_file: Near-duplicate postings used when NEAR_DUPLICATES is on
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    Returns:
+        Dictionary with all job data; "countries" and "skill_counts" hold
+        JOB_TITLE, "roles" holds the same for every other role
+    """
+    countries = list(countries or COUNTRIES)
+    roles = [role for role in (roles or QUERY_CONFIGS) if role in QUERY_CONFIGS]
+    
+    queries = plan_queries({role: {country: QUERY_CONFIGS[role][country] for country in countries} for role in roles},
+                           TIME_PERIODS)
+    logger.info(f"Planned {len(queries)} queries for {len(roles)} roles over "
+                f"{sum(len(pages) for pages in plan_pages(queries).values())} page loads, "
+                f"{len({query['url'] for query in queries})} unique pages")
+    
+    # Countries finished by an interrupted run earlier today are not scraped again
+    checkpoint = Checkpoint(checkpoint_file)
+    results: Dict[Tuple[str, str], Any] = {
+        (role, country): country_data
+        for role, role_countries in (checkpoint.load() if resume else {}).items() if role in roles
+        for country, country_data in role_countries.items() if country in countries
+    }
+    if results:
+        logger.info(f"Resuming from checkpoint: {', '.join(f'{role} in {country}' for role, country in results)} already done")
+    
+    remaining = [task for task in plan_tasks(queries) if task not in results]
+    workers = max(1, min(workers, len(remaining)))
+    
+    task_queue: "queue.Queue[Tuple[str, str]]" = queue.Queue()
+    for task in remaining:
+        task_queue.put(task)
+    
+    cache = ResultCache()
+    job_index = JobIndex.load(job_index_file) if INCREMENTAL else None
+    browser_stats: List[Dict[str, float]] = []
+    profile = RunProfile()
+    scheduler = Scheduler.load(countries) if adaptive else None
+    retry_budget = RetryBudget(RETRY_BUDGET)
+    selectors = SelectorRegistry.load(selector_file, reorder=ADAPTIVE_SELECTORS)
+    archive = DescriptionArchive.load(archive_dir) if ARCHIVE_DESCRIPTIONS else None
+    near_duplicates = NearDuplicateIndex.load(near_duplicates_file) if NEAR_DUPLICATES else None
+    
+    worker_args = (task_queue, results, cache, job_index, browser_stats, profile, scheduler, retry_budget, checkpoint,
+                   selectors, archive, near_duplicates)
+    # With nothing left to scrape, the worker returns before starting a browser
+    if workers == 1:
+        scrape_worker(0, *worker_args)
+    else:
+        logger.info(f"Scraping {len(remaining)} role and country pairs with {workers} browser workers")
+        threads = [
+            threading.Thread(target=scrape_worker, args=(i,) + worker_args, name=f"scraper-worker-{i}")
+            for i in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    
+    if remaining and not any(task in results for task in remaining):
+        raise RuntimeError("No browser worker could be started")
+    
+    # Merge in the configured role and country order, whichever worker finished first,
+    # and rank skills per country and overall so the dashboard only has to render them
+    all_data = build_output({
+        role: {country: results.get((role, country), empty_country_data(country)) for country in countries}
+        for role in roles
+    }, JOB_TITLE)
+    
+    # Report how many page loads the result cache saved
+    cache_summary = cache.summary()
+    logger.info(f"Result cache: {cache_summary['hits']} hits, {cache_summary['misses']} misses "
+                f"({cache_summary['hits']} navigations avoided)")
+    # Count how many values each tier served, to see how much browser time was saved
+    source_counts: Dict[str, int] = {}
+    for country_data in results.values():
+        for source in country_data.get("sources", {}).values():
+            source_counts[source] = source_counts.get(source, 0) + 1
+    logger.info(f"Values served per tier: {source_counts}")
+    
+    # Browser startup and Cloudflare wait time, to measure what warm starts save
+    browser_summary = new_browser_stats()
+    for stats in browser_stats:
+        for key, value in stats.items():
+            browser_summary[key] += value
+    browser_summary = {key: round(value, 1) for key, value in browser_summary.items()}
+    browser_summary["mode"] = "lean" if LEAN_MODE else "full"
+    logger.info(f"Browsers: {browser_summary['startups']} started in {browser_summary['startup_seconds']}s, "
+                f"{browser_summary['cloudflare_challenges']} Cloudflare challenges "
+                f"waited out in {browser_summary['cloudflare_wait_seconds']}s, "
+                f"{browser_summary['popups_dismissed']} popups closed by the dismisser")
+    if MEASURE_PAGES:
+        logger.info(f"Page loads ({browser_summary['mode']} mode): {browser_summary['page_loads']} pages, "
+                    f"{browser_summary['page_load_seconds']}s, {browser_summary['bytes_transferred'] / 1e6:.1f} MB")
+    else:
+        # Not measured, rather than nothing transferred
+        del browser_summary["bytes_transferred"]
+        logger.info(f"Page loads ({browser_summary['mode']} mode): {browser_summary['page_loads']} pages, "
+                    f"{browser_summary['page_load_seconds']}s")
+    
+    all_data["run_summary"] = {"cache": cache_summary, "sources": source_counts, "browser": browser_summary}
+    
+    # Failed navigations per class, and how many retries recovered them
+    all_data["run_summary"]["failures"] = retry_budget.summary()
+    logger.info(f"Navigation failures: {all_data['run_summary']['failures']}")
     
-    logger.info(f"Data saved successfully to {output_path}")
+    # Which selectors found their fields, and which have stopped matching the markup
+    all_data["run_summary"]["selectors"] = selectors.summary()
+    for entry in all_data["run_summary"]["selectors"]["stale"]:
+        since = "never matched" if entry["runs_since_hit"] is None else f"no match in {entry['runs_since_hit']} runs"
+        logger.warning(f"Stale selector for {entry['field']}: {entry['selector']} ({since})")
+    selectors.save()
+    
+    # Peak memory per role and country, to check that deeper listings still fit small runners.
+    # Kept in the run summary only: it changes every run, unlike the country data
+    peak_memory = {
+        f"{role} / {country}": country_data.pop("memory")["peak_rss_mb"]
+        for (role, country), country_data in results.items() if "memory" in country_data
+    }
+    all_data["run_summary"]["memory"] = {
+        "peak_rss_mb": max(peak_memory.values(), default=0.0),
+        "countries": peak_memory
+    }
+    logger.info(f"Peak RSS: {all_data['run_summary']['memory']['peak_rss_mb']} MB")
+    
+    # Where the run's time went; per-call timings go to the profile file
+    all_data["run_summary"]["stages"] = profile.summary()
+    profile.save(profile_file)
+    logger.info(f"Stage timings appended to {profile_file}: {all_data['run_summary']['stages']}")
+    
+    if job_index is not None:
+        pruned = job_index.prune()
+        job_index.save()
+        index_summary = job_index.summary()
+        logger.info(f"Job index: {index_summary['known']} known jobs reused, {index_summary['new']} new, "
+                    f"{pruned} expired, {index_summary['indexed']} indexed")
+        all_data["run_summary"]["job_index"] = index_summary
+    
+    if archive is not None:
+        archive_summary = archive.summary()
+        segment = archive.save()
+        logger.info(f"Description archive: {archive_summary['new']} new descriptions"
+                    f"{f' written to {segment.name}' if segment else ''}, {archive_summary['known']} already archived, "
+                    f"{archive_summary['archived']} archived")
+        all_data["run_summary"]["descriptions"] = archive_summary
+    
+    if near_duplicates is not None:
+        pruned = near_duplicates.prune()
+        near_duplicates.save()
+        duplicates_summary = near_duplicates.summary()
+        logger.info(f"Near duplicates: {duplicates_summary['duplicates']} listings matched a known posting, "
+                    f"{duplicates_summary['skipped_fetches']} detail pages skipped, {duplicates_summary['new']} new "
+                    f"postings, {pruned} expired, {duplicates_summary['indexed']} indexed")
+        all_data["run_summary"]["near_duplicates"] = duplicates_summary
+    
+    # Add timestamp in UTC for consistency
+    all_data["last_updated"] = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    
+    return all_data
 
 
 def main():
     """Main entry point for the scraper."""
+    setup_logging()
     logger.info("Starting Glassdoor Job Scraper")
     
+    replay_server = None
     try:
-        data = run_scraper()
-        save_data(data, OUTPUT_FILE)
+        if REPLAY_DIR:
+            replay_server = ReplayServer(Path(REPLAY_DIR)).start()
+            for role_configs in QUERY_CONFIGS.values():
+                role_configs.update(replay_country_configs(role_configs, replay_server.origin))
+            logger.info(f"Replaying recorded pages from {REPLAY_DIR} at {replay_server.origin}")
+        
+        # Never overwrite the published data with results from recorded pages
+        output_file = OUTPUT_FILE.with_name("replay_data.json") if REPLAY_DIR else OUTPUT_FILE
+        job_index_file = OUTPUT_FILE.with_name("replay_job_index.json") if REPLAY_DIR else JOB_INDEX_FILE
+        profile_file = OUTPUT_FILE.with_name("replay_run_profile.jsonl") if REPLAY_DIR else PROFILE_FILE
+        checkpoint_file = OUTPUT_FILE.with_name("replay_checkpoint.json") if REPLAY_DIR else CHECKPOINT_FILE
+        selector_file = OUTPUT_FILE.with_name("replay_selector_stats.json") if REPLAY_DIR else SELECTOR_STATS_FILE
+        archive_dir = OUTPUT_FILE.with_name("replay_descriptions") if REPLAY_DIR else ARCHIVE_DIR
+        near_duplicates_file = OUTPUT_FILE.with_name("replay_near_duplicates.json") if REPLAY_DIR else NEAR_DUPLICATES_FILE
+        
+        # The history holds live counts only, so replays scrape every count
+        data = run_scraper(job_index_file=job_index_file, profile_file=profile_file,
+                           adaptive=ADAPTIVE and not REPLAY_DIR, checkpoint_file=checkpoint_file,
+                           selector_file=selector_file, archive_dir=archive_dir,
+                           near_duplicates_file=near_duplicates_file)
+        save_data(data, output_file)
+        
+        # The run is complete; the next run starts from scratch
+        Checkpoint(checkpoint_file).clear()
+        
+        # Recorded pages say nothing about the job market, so replays stay out
+        # of the history and the dashboard files
+        if not REPLAY_DIR:
+            write_artifacts(data, OUTPUT_FILE.parent)
+            with CountHistory() as history:
+                history.record_run(data)
+                history.export_trends()
+        
         logger.info("Scraping completed successfully")
     
     except Exception as e:
         logger.error(f"Error during scraping: {str(e)}", exc_info=True)
+    
+    finally:
+        # A script run ends here, so there is no later run to keep browsers for
+        if KEEP_BROWSERS:
+            logger.info("SCRAPER_KEEP_BROWSERS only applies when run_scraper is called as a library; "
+                        "closing browsers")
+        shutdown_browsers()
+        if replay_server:
+            replay_server.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Failure classification and retry budget for browser navigations
+
+GlassdoorScraper.navigate() sorts every failed page load into one of
+FAILURE_KINDS and retries it with jittered exponential backoff. All workers of
+a run charge failed attempts and backoff to one RetryBudget, so a bad day on
+Glassdoor costs at most a fixed amount of extra time instead of stalling the
+run.
+"""
+
+import random
+import threading
+from typing import Dict, Optional
+
+# Failure classes counted in run_summary.failures
+CLOUDFLARE = "cloudflare"
+TIMEOUT = "timeout"
+SELECTOR_MISS = "selector_miss"
+DRIVER_CRASH = "driver_crash"
+FAILURE_KINDS = [CLOUDFLARE, TIMEOUT, SELECTOR_MISS, DRIVER_CRASH]
+
+# Backoff before retry n (from 0) is BACKOFF_BASE * 2**n seconds, capped and jittered by +-50%
+BACKOFF_BASE = 2.0
+BACKOFF_CAP = 30.0
+
+# WebDriver error messages of a browser or chromedriver that is gone
+_CRASH_MARKERS = [
+    "invalid session id", "chrome not reachable", "disconnected", "no such window",
+    "session deleted", "target window already closed", "connection refused", "max retries exceeded",
+    "connection aborted", "connection reset", "remote end closed connection"
+]
+
+
+def classify_exception(error: Exception) -> Optional[str]:
+    """
+    Return the failure class of an exception raised by a navigation.
+
+    Returns:
+        TIMEOUT, DRIVER_CRASH, or None for errors that are not navigation failures
+    """
+    # Imported here so the module loads without the browser stack, which is
+    # always loaded by the time a navigation fails
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+    # A dead chromedriver surfaces as urllib3's MaxRetryError or ProtocolError,
+    # which are not WebDriverExceptions
+    from urllib3.exceptions import HTTPError
+
+    if isinstance(error, TimeoutException):
+        return TIMEOUT
+    message = str(error).lower()
+    if isinstance(error, (WebDriverException, HTTPError, ConnectionError, OSError)) and any(
+            marker in message for marker in _CRASH_MARKERS):
+        return DRIVER_CRASH
+    return None
+
+
+def backoff_delay(attempt: int) -> float:
+    """Jittered exponential backoff before retry number attempt (counting from 0)."""
+    return min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+class RetryBudget:
+    """
+    Seconds a run may lose to failed navigations and backoff, and its failure counts.
+
+    Shared by all browser workers of a run; safe to use from several threads.
+    """
+
+    def __init__(self, seconds: float):
+        self.remaining = seconds
+        self.failures: Dict[str, int] = {kind: 0 for kind in FAILURE_KINDS}
+        self.retries = 0
+        self.recovered = 0
+        self.exhausted = 0
+        self._lock = threading.Lock()
+
+    def record_failure(self, kind: str, seconds: float) -> None:
+        """Count a failed navigation and charge the time it took to the budget."""
+        with self._lock:
+            self.failures[kind] += 1
+            self.remaining -= seconds
+
+    def record_recovery(self) -> None:
+        """Count a navigation that succeeded after failing at least once."""
+        with self._lock:
+            self.recovered += 1
+
+    def spend(self, seconds: float) -> bool:
+        """Reserve seconds of backoff for a retry; False if the budget cannot cover it."""
+        with self._lock:
+            if seconds > self.remaining:
+                self.exhausted += 1
+                return False
+            self.remaining -= seconds
+            self.retries += 1
+            return True
+
+    def summary(self) -> Dict[str, int]:
+        """Failures per class, retries made, navigations recovered and retries refused for lack of budget."""
+        with self._lock:
+            return dict(self.failures, retries=self.retries, recovered=self.recovered,
+                        budget_exhausted=self.exhausted)
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate job postings across countries and runs
+
+Reposted and multi-location jobs show up as separate listings with their own
+links, so neither the seen-jobs index nor the skill rankings recognise them
+as one posting. Every parsed listing is fingerprinted with a MinHash
+signature of the word shingles of its title, company and description, and
+looked up in an LSH index of the postings seen in earlier runs. Listings
+whose estimated similarity to a known posting reaches SIMILARITY get that
+posting's ID as "posting_id", and skill rankings count each posting once.
+Postings are kept in a JSON file next to data.json; the LSH buckets are
+rebuilt from the stored signatures on load.
+
+A job card can be taken for a repost before its detail page is fetched, but
+only on a header match backed by the card's description snippet: the first
+LEAD_WORDS words of the snippet have to match those of the known posting's
+description.
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from checkpoint import write_json_atomic
+from job_index import DEFAULT_COMPANY, RETENTION_DAYS
+
+logger = logging.getLogger("glassdoor_scraper")
+
+# Postings file, committed next to data.json so it survives between CI runs
+NEAR_DUPLICATES_FILE = Path(__file__).parent.parent / "data" / "near_duplicates.json"
+
+# Words per shingle
+SHINGLE_WORDS = 3
+
+# MinHash signature length, split into BANDS bands of NUM_PERM // BANDS rows for LSH.
+# Postings share a bucket with probability 1 - (1 - s**4)**16 at similarity s:
+# 0.99 at s = 0.8, 0.4 at s = 0.5
+NUM_PERM = 64
+BANDS = 16
+
+# Estimated Jaccard similarity from which two listings are the same posting
+SIMILARITY = 0.8
+
+# Leading description words a card snippet must share with a known posting
+# for its detail page to be skipped
+LEAD_WORDS = 12
+
+# Hash permutations (a * h + b) mod _PRIME, fixed so stored signatures stay comparable
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20240501)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+_WORD = re.compile(r'[a-z0-9+#]+')
+
+
+def _utc_now() -> str:
+    return datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def header_key(title: str, company: str) -> Optional[str]:
+    """
+    Normalized title and company of a listing, or None without a known company.
+
+    Unlike job IDs, a title that is only the role scraped for is allowed: it
+    is also the most common real title, and the company has to match as well.
+    """
+    if not title or not company or company == DEFAULT_COMPANY:
+        return None
+    return f"{' '.join(_WORD.findall(title.lower()))}|{' '.join(_WORD.findall(company.lower()))}"
+
+
+def lead_key(description: str) -> Optional[str]:
+    """Hash of the first LEAD_WORDS normalized words of a description, or None if it has none."""
+    words = _WORD.findall(description.lower())[:LEAD_WORDS]
+    if not words:
+        return None
+    return hashlib.sha1(" ".join(words).encode('utf-8')).hexdigest()[:16]
+
+
+def shingles(text: str) -> Set[str]:
+    """Word shingles of a text; texts shorter than a shingle are one shingle."""
+    words = _WORD.findall(text.lower())
+    if len(words) <= SHINGLE_WORDS:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)}
+
+
+def signature(title: str, company: str, description: str = "") -> Optional[List[int]]:
+    """
+    MinHash signature of a listing.
+
+    Returns:
+        NUM_PERM 32-bit values, or None for a listing with neither a
+        description nor a known company, which identifies nothing
+    """
+    if not description and header_key(title, company) is None:
+        return None
+    hashes = [zlib.crc32(shingle.encode('utf-8')) for shingle in shingles(f"{title} {company} {description}")]
+    if not hashes:
+        return None
+    return [min((a * h + b) % _PRIME for h in hashes) & 0xFFFFFFFF for a, b in _PERMUTATIONS]
+
+
+def similarity(first: List[int], second: List[int]) -> float:
+    """Estimated Jaccard similarity of the listings behind two signatures."""
+    return sum(1 for x, y in zip(first, second) if x == y) / NUM_PERM
+
+
+def _encode(values: List[int]) -> str:
+    return "".join(f"{value:08x}" for value in values)
+
+
+def _decode(text: str) -> List[int]:
+    return [int(text[i:i + 8], 16) for i in range(0, len(text), 8)]
+
+
+def _bands(values: List[int]) -> List[str]:
+    rows = NUM_PERM // BANDS
+    return [f"{band}:{_encode(values[band * rows:(band + 1) * rows])}" for band in range(BANDS)]
+
+
+class NearDuplicateIndex:
+    """
+    Postings seen in the current and earlier runs, with an LSH index of their signatures.
+
+    Each posting holds its signature, title / company header, the lead_key
+    of its description, skills, description_id (if archived) and
+    first_seen / last_seen timestamps.
+    Shared by all browser workers of a run; safe to use from several threads.
+    """
+
+    def __init__(self, path: Path = NEAR_DUPLICATES_FILE):
+        self.path = Path(path)
+        self.postings: Dict[str, Dict[str, Any]] = {}
+        # LSH bucket -> IDs of the postings in it
+        self._buckets: Dict[str, Set[str]] = {}
+        # Header -> IDs of the postings with it
+        self._headers: Dict[str, Set[str]] = {}
+        self.new = 0
+        self.duplicates = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path = NEAR_DUPLICATES_FILE) -> "NearDuplicateIndex":
+        """Load the postings from disk, starting empty if they are missing or unreadable."""
+        index = cls(path)
+        try:
+            with open(index.path, encoding='utf-8') as f:
+                postings = json.load(f).get("postings", {})
+        except FileNotFoundError:
+            postings = {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read near-duplicate index {index.path}, starting empty: {str(e)}")
+            postings = {}
+        for posting_id, posting in postings.items():
+            index._add(posting_id, posting)
+        return index
+
+    def _add(self, posting_id: str, posting: Dict[str, Any]) -> None:
+        self.postings[posting_id] = posting
+        for bucket in _bands(_decode(posting["signature"])):
+            self._buckets.setdefault(bucket, set()).add(posting_id)
+        if posting.get("header"):
+            self._headers.setdefault(posting["header"], set()).add(posting_id)
+
+    def assign(self, listing: Dict[str, Any], description: str = "") -> Optional[str]:
+        """
+        Find the posting a freshly parsed listing belongs to, or start a new one.
+
+        Sets the listing's "posting_id".
+
+        Returns:
+            The posting ID, or None for listings that identify nothing
+        """
+        values = signature(listing["title"], listing["company"], description)
+        if values is None:
+            return None
+
+        now = _utc_now()
+        with self._lock:
+            candidates = set()
+            for bucket in _bands(values):
+                candidates.update(self._buckets.get(bucket, ()))
+            best, best_similarity = None, 0.0
+            for candidate in candidates:
+                candidate_similarity = similarity(values, _decode(self.postings[candidate]["signature"]))
+                if candidate_similarity > best_similarity:
+                    best, best_similarity = candidate, candidate_similarity
+
+            if best is not None and best_similarity >= SIMILARITY:
+                self.duplicates += 1
+                posting = self.postings[best]
+                posting["last_seen"] = now
+                # A posting first seen without a description gets the skills of a later copy
+                if listing["skills"] and not posting["skills"]:
+                    posting["skills"] = listing["skills"]
+                if description and not posting.get("lead"):
+                    posting["lead"] = lead_key(description)
+                listing["posting_id"] = best
+                return best
+
+            self.new += 1
+            encoded = _encode(values)
+            posting_id = f"p:{hashlib.sha1(encoded.encode('utf-8')).hexdigest()[:16]}"
+            posting = {
+                "signature": encoded,
+                "header": header_key(listing["title"], listing["company"]),
+                "lead": lead_key(description),
+                "skills": listing["skills"],
+                "first_seen": now,
+                "last_seen": now
+            }
+            if listing.get("description_id"):
+                posting["description_id"] = listing["description_id"]
+            self._add(posting_id, posting)
+            listing["posting_id"] = posting_id
+            return posting_id
+
+    def match_header(self, title: str, company: str, snippet: str, link: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Return a listing for a job whose detail page would only repeat a known posting.
+
+        Used before a detail page is fetched, when only the card is known: a
+        job is taken for a repost if exactly one known posting with skills
+        has the same title and company and a description that starts like
+        the card's snippet. A header match alone is not enough evidence.
+
+        Returns:
+            A job listing with the posting's skills, or None if the detail
+            page has to be fetched
+        """
+        key = header_key(title, company)
+        lead = lead_key(snippet)
+        if key is None or lead is None:
+            return None
+
+        with self._lock:
+            matches = [posting_id for posting_id in self._headers.get(key, ())
+                       if self.postings[posting_id]["skills"] and self.postings[posting_id].get("lead") == lead]
+            if len(matches) != 1:
+                return None
+            posting = self.postings[matches[0]]
+            posting["last_seen"] = _utc_now()
+            self.skipped += 1
+            listing = {"title": title, "company": company, "skills": posting["skills"], "link": link,
+                       "posting_id": matches[0]}
+            if posting.get("description_id"):
+                listing["description_id"] = posting["description_id"]
+            return listing
+
+    def update_skills(self, skills_by_description: Dict[str, List[str]]) -> int:
+        """Replace the skills of postings whose description was re-extracted; returns how many changed."""
+        updated = 0
+        with self._lock:
+            for posting in self.postings.values():
+                skills = skills_by_description.get(posting.get("description_id", ""))
+                if skills is not None and skills != posting["skills"]:
+                    posting["skills"] = skills
+                    updated += 1
+        return updated
+
+    def prune(self, retention_days: int = RETENTION_DAYS) -> int:
+        """Drop postings not seen for retention_days; returns how many were removed."""
+        cutoff = (datetime.datetime.utcnow() - datetime.timedelta(days=retention_days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        with self._lock:
+            kept = {posting_id: posting for posting_id, posting in self.postings.items()
+                    if posting["last_seen"] >= cutoff}
+            removed = len(self.postings) - len(kept)
+            self.postings, self._buckets, self._headers = {}, {}, {}
+            for posting_id, posting in kept.items():
+                self._add(posting_id, posting)
+        return removed
+
+    def save(self) -> None:
+        """Write the postings to disk."""
+        with self._lock:
+            write_json_atomic(self.path, {"postings": self.postings}, separators=(',', ':'), sort_keys=True)
+
+    def summary(self) -> Dict[str, int]:
+        """New postings, near-duplicate listings and skipped detail fetches this run, and the size of the index."""
+        with self._lock:
+            return {"new": self.new, "duplicates": self.duplicates, "skipped_fetches": self.skipped,
+                    "indexed": len(self.postings)}
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Glassdoor page selectors
+
+CSS selectors and button texts the scraper uses to read search results and
+job detail pages. Kept free of browser imports so the HTTP tier can parse
+pages with the same selectors as the browser.
+"""
+
+# Selectors that typically contain the job count on a search results page
+JOB_COUNT_SELECTORS = [
+    '[data-test="jobCount"]', 
+    '.jobsCount', 
+    '.count',
+    'header h1',
+    '[data-heading]',
+    '.hiddenJobs',
+    '.jobHeader',
+    '.jobsCount',
+    '.css-rfi9y',  # Common Glassdoor class
+    '.common__EIRcO',  # Another common Glassdoor class
+    'h1', 
+    'h2', 
+    'span.text'
+]
+
+# Selectors for job cards in the search results list (new Glassdoor UI first)
+JOB_CARD_SELECTORS = [
+    ".jobCard",
+    ".JobCard",
+    "[data-test='jobCard']",
+    ".css-bkasv9",
+    ".JobsList_jobListItem__8HcYA",
+    ".JobsList_normJobListItem__eCZRH", 
+    "[data-test='job-list-item']",
+    "li[id^='job_']"
+]
+
+# Pagination of a search results page: links to the next result page, and
+# buttons that append more cards to the current list (new Glassdoor UI)
+NEXT_PAGE_SELECTORS = [
+    "a[data-test='pagination-next']",
+    "button[data-test='pagination-next'] a",
+    ".nextButton a",
+    "li.next a",
+    "a[rel='next']"
+]
+LOAD_MORE_SELECTORS = [
+    "button[data-test='load-more']",
+    "[data-test='load-more'] button"
+]
+
+# Selectors for fields inside a job card
+CARD_TITLE_SELECTORS = [
+    ".jobTitle", "[data-test='job-title']", ".heading_Heading__BqX5J",
+    "h2", "h3", "a[data-test='job-link']", ".JobCard_jobTitle__TrVlK"
+]
+CARD_COMPANY_SELECTORS = [
+    ".company", "[data-test='employer-name']", 
+    ".EmployerProfile_employerNameHeading__bXBYr h4",
+    ".JobCard_companyName__lwjW4"
+]
+CARD_DESCRIPTION_SELECTORS = [
+    ".jobDescriptionContent", 
+    "[data-test='jobDescriptionText']",
+    ".JobDetails_jobDescription__uW_fK",
+    ".css-w3wpmi"
+]
+
+# Selectors for an expanded job detail section next to the results list
+EXPANDED_DESCRIPTION_SELECTORS = [
+    ".JobDetails_jobDescription__uW_fK",
+    "div[data-test='job-description']",
+    "[data-test='jobDescriptionText']",
+    ".jobDescriptionContent"
+]
+
+# Selectors for the title, company and description on a job detail page
+JOB_TITLE_SELECTORS = [
+    "#jd-job-title", 
+    "h1.heading_Heading__BqX5J",
+    "[data-test='job-title']"
+]
+JOB_COMPANY_SELECTORS = [
+    ".EmployerProfile_employerNameHeading__bXBYr h4",
+    "[data-test='employer-name']"
+]
+JOB_DESCRIPTION_SELECTORS = [
+    ".JobDetails_jobDescription__uW_fK",
+    "[data-test='jobDescriptionText']",
+    ".jobDescriptionContent"
+]
+
+# List of common popup selectors to close
+POPUP_SELECTORS = [
+    'button[aria-label="Close"]', 
+    '.modal-close', 
+    '.close',
+    '[data-test="modal-close"]',
+    '.ReactModal__Close',
+    '.emailAlertPopup button',
+    '.UserAlert button',
+    'button.fc-button',
+    '.fc-close',
+    '#onetrust-accept-btn-handler',
+    '.gdCookieConsentButton',
+    '.modal button',
+    'button.btn',
+    '[aria-label="Close this dialog"]',
+    '.closeIcon'
+]
+
+# Text of popup buttons to click
+POPUP_BUTTON_TEXTS = ["Accept", "Accept All", "Reject", "Skip", "Continue", 
+                      "No Thanks", "Maybe Later", "Not Now", "I Accept"]
+
+# Overlays the injected popup dismisser may click inside; it leaves controls
+# anywhere else on the page alone
+POPUP_CONTAINER_SELECTORS = [
+    "[role='dialog']",
+    "[role='alertdialog']",
+    "[aria-modal='true']",
+    ".modal",
+    ".ReactModal__Overlay",
+    ".emailAlertPopup",
+    ".UserAlert",
+    "#onetrust-consent-sdk",
+    ".fc-consent-root",
+    ".gdCookieConsent",
+    ".gdCookieConsentButton"
+]
+
+# Never clicked by the injected popup dismisser, nor anything inside or
+# containing them, on top of the pagination and job card selectors above
+POPUP_PROTECTED_SELECTORS = [
+    "button[data-test='pagination-next']",
+    "[data-test='pagination-prev']",
+    "a[href*='job-details']",
+    "a[href*='Job-View']",
+    "a[href*='/job/']"
+]
+
+# Shown instead of job cards when a search has no results
+NO_RESULTS_SELECTORS = [
+    "[data-test='no-results']",
+    "[data-test='zero-results']",
+    ".noResults",
+    "[class*='NoResults']"
+]
+
+# Lowercase page text of a search without results, for pages without a marker element
+NO_RESULTS_TEXTS = ["no jobs found", "did not match any jobs", "there are currently no jobs",
+                    "no results found"]
+
+# A search page counts as rendered once any of these is present. The generic
+# headings used as count fallbacks are left out because they also appear on
+# Cloudflare and error pages. A search without results renders too.
+READY_SELECTORS = ([s for s in JOB_COUNT_SELECTORS if s not in ('h1', 'h2', 'span.text')] + JOB_CARD_SELECTORS +
+                   NO_RESULTS_SELECTORS)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Search queries: roles x countries x time windows
+
+Builds Glassdoor search URLs for any role in any configured country, and
+plans a run as a matrix of queries. plan_pages() groups the queries of a
+(role, country) by URL, and the scraper loads each of those pages once and
+reads every field planned for it from that load. Roles sharing a URL share
+the parsed page through the run's result cache.
+"""
+
+import re
+from typing import Any, Dict, List
+
+# Origin of the live site
+GLASSDOOR_ORIGIN = "https://www.glassdoor.com"
+
+# Glassdoor location of each country: (URL slug, location ID)
+COUNTRY_LOCATIONS = {
+    "Canada": ("canada", 3),
+    "Ireland": ("ireland", 70),
+    "Portugal": ("portugal", 195),
+    "United Arab Emirates": ("united-arab-emirates", 6),
+    "Germany": ("germany", 96),
+}
+
+
+def role_slug(role: str) -> str:
+    """URL slug of a role, e.g. "BI Analyst" -> "bi-analyst"."""
+    return re.sub(r'[^a-z0-9]+', '-', role.lower()).strip('-')
+
+
+def search_url(role: str, country: str, remote: bool = False, origin: str = GLASSDOOR_ORIGIN) -> str:
+    """
+    Build the search results URL of a role in a country.
+
+    The "SRCH" suffix holds the character ranges of the location (IL) and the
+    keyword (KO) in the slug, plus the location ID (IN). Remote searches put
+    "remote" in front of the keyword.
+
+    Args:
+        role: Job title to search for, e.g. "Data Analyst"
+        country: A country in COUNTRY_LOCATIONS
+        remote: Search remote jobs only
+        origin: Site origin, replaced when replaying recorded pages
+
+    Returns:
+        URL without query string; time windows are added as "?fromAge=N"
+    """
+    location, location_id = COUNTRY_LOCATIONS[country]
+    keyword = f"remote-{role_slug(role)}" if remote else role_slug(role)
+    keyword_start = len(location) + 1
+    # Glassdoor counts one more character for the remote keyword
+    keyword_end = keyword_start + len(keyword) + (1 if remote else 0)
+    return (f"{origin}/Job/{location}-{keyword}-jobs-"
+            f"SRCH_IL.0,{len(location)}_IN{location_id}_KO{keyword_start},{keyword_end}.htm")
+
+
+def query_configs(roles: List[str], countries: List[str]) -> Dict[str, Dict[str, Dict[str, str]]]:
+    """
+    Search URLs of every role in every country.
+
+    Roles with the same URL slug as an earlier role are dropped, since they
+    would only search the same pages again.
+
+    Returns:
+        Role -> country -> {"base_url", "remote_url"}, in the COUNTRY_CONFIGS format
+    """
+    configs: Dict[str, Dict[str, Dict[str, str]]] = {}
+    slugs = set()
+    for role in roles:
+        if role_slug(role) in slugs:
+            continue
+        slugs.add(role_slug(role))
+        configs[role] = {
+            country: {"base_url": search_url(role, country), "remote_url": search_url(role, country, remote=True)}
+            for country in countries
+        }
+    return configs
+
+
+def plan_queries(configs: Dict[str, Dict[str, Dict[str, Any]]], windows: Dict[str, int]) -> List[Dict[str, str]]:
+    """
+    Expand the roles x countries x windows matrix into queries.
+
+    Args:
+        configs: Country configs per role
+        windows: Output field -> days, as in TIME_PERIODS
+
+    Returns:
+        One query per role, country and field (every window, "remote" and
+        "job_listings"), each with the URL it reads
+    """
+    queries = []
+    for role, role_configs in configs.items():
+        for country, config in role_configs.items():
+            for field, days in windows.items():
+                queries.append({"role": role, "country": country, "field": field,
+                                "url": f"{config['base_url']}?fromAge={days}"})
+            queries.append({"role": role, "country": country, "field": "remote", "url": config['remote_url']})
+            # Listings are read from the 24-hour results page
+            queries.append({"role": role, "country": country, "field": "job_listings",
+                            "url": f"{config['base_url']}?fromAge=1"})
+    return queries
+
+
+def plan_pages(queries: List[Dict[str, str]]) -> Dict[tuple, Dict[str, List[str]]]:
+    """
+    Group queries into the pages each (role, country) task loads.
+
+    Queries reading the same URL, like the 24-hour count and the job
+    listings, collapse into one page.
+
+    Returns:
+        (role, country) -> URL -> fields read from that page, in query order
+    """
+    pages: Dict[tuple, Dict[str, List[str]]] = {}
+    for query in queries:
+        task_pages = pages.setdefault((query["role"], query["country"]), {})
+        task_pages.setdefault(query["url"], []).append(query["field"])
+    return pages
+
+
+def plan_tasks(queries: List[Dict[str, str]]) -> List[tuple]:
+    """
+    Group queries into (role, country) scraping tasks.
+
+    Tasks are ordered so that tasks sharing pages with an earlier task come
+    right after it, while the shared pages are still fresh in the cache.
+
+    Returns:
+        (role, country) pairs in scraping order
+    """
+    tasks: List[tuple] = []
+    task_urls: Dict[tuple, set] = {}
+    for query in queries:
+        task = (query["role"], query["country"])
+        if task not in task_urls:
+            tasks.append(task)
+            task_urls[task] = set()
+        task_urls[task].add(query["url"])
+
+    ordered: List[tuple] = []
+    for task in tasks:
+        if task in ordered:
+            continue
+        ordered.append(task)
+        ordered.extend(other for other in tasks
+                       if other not in ordered and task_urls[other] & task_urls[task])
+    return ordered
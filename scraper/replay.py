@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Record and replay Glassdoor pages
+
+During a real run with SCRAPER_RECORD_DIR set, the scraper saves the HTML of
+every page it visits with record_page(), whether the browser or the HTTP tier
+loaded it. ReplayServer then serves
+those snapshots from a local HTTP server, and replay_country_configs() points
+COUNTRY_CONFIGS at it, so GlassdoorScraper can run without reaching Glassdoor.
+"""
+
+import hashlib
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+# Hand-written synthetic pages shipped with the repository, in the recorded format
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Index file mapping each recorded URL to its snapshot file
+INDEX_FILE = "index.json"
+
+# Origin of the live site; rewritten to the replay server when serving
+LIVE_ORIGIN = "https://www.glassdoor.com"
+
+# Scripts would try to reach the live site and mutate the recorded DOM
+_SCRIPT_TAG = re.compile(r'<script\b[^>]*>.*?</script\s*>', re.IGNORECASE | re.DOTALL)
+
+_index_lock = threading.Lock()
+
+
+def url_key(url: str) -> str:
+    """Key a URL by path and query so live and replay origins map to the same page."""
+    parts = urlsplit(url)
+    return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+def load_index(directory: Path) -> Dict[str, str]:
+    """Load the URL key -> snapshot file index of a fixtures directory."""
+    index_path = Path(directory) / INDEX_FILE
+    if not index_path.exists():
+        return {}
+    with open(index_path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def record_page(directory: Path, url: str, html: str) -> Path:
+    """
+    Save a rendered page so it can be replayed later.
+
+    Args:
+        directory: Fixtures directory to record into
+        url: URL the page was loaded from
+        html: Rendered page source
+
+    Returns:
+        Path of the snapshot file
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    key = url_key(url)
+    filename = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16] + ".html"
+    snapshot_path = directory / filename
+
+    with open(snapshot_path, 'w', encoding='utf-8') as f:
+        f.write(_SCRIPT_TAG.sub('', html))
+
+    # Several browser workers may record into the same directory
+    with _index_lock:
+        index = load_index(directory)
+        index[key] = filename
+        with open(directory / INDEX_FILE, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+
+    return snapshot_path
+
+
+def replay_country_configs(configs: Dict[str, Dict[str, Any]], origin: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Return copies of country configs whose URLs point at a replay server.
+
+    Args:
+        configs: Country configs in the COUNTRY_CONFIGS format
+        origin: Replay server origin, e.g. "http://127.0.0.1:8765"
+
+    Returns:
+        Overrides suitable for COUNTRY_CONFIGS.update()
+    """
+    overrides = {}
+    for country, config in configs.items():
+        overrides[country] = dict(config)
+        for field in ("base_url", "remote_url"):
+            if field in config:
+                overrides[country][field] = config[field].replace(LIVE_ORIGIN, origin)
+    return overrides
+
+
+class ReplayServer:
+    """
+    Serve recorded pages over HTTP on localhost.
+
+    Unknown URLs get a 404 page, and links to the live site inside snapshots
+    are rewritten to the server so job detail pages are replayed too.
+
+    Usage:
+        with ReplayServer(FIXTURES_DIR) as server:
+            COUNTRY_CONFIGS.update(replay_country_configs(COUNTRY_CONFIGS, server.origin))
+    """
+
+    def __init__(self, directory: Path = FIXTURES_DIR, port: int = 0):
+        self.directory = Path(directory)
+        self.port = port
+        self.httpd: Optional[ThreadingHTTPServer] = None
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def origin(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def start(self) -> "ReplayServer":
+        index = load_index(self.directory)
+        directory = self.directory
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                filename = index.get(url_key(self.path))
+                if filename is None:
+                    self.send_response(404)
+                    body = b"<html><head><title>Not recorded</title></head><body></body></html>"
+                else:
+                    self.send_response(200)
+                    html = (directory / filename).read_text(encoding='utf-8')
+                    body = html.replace(LIVE_ORIGIN, server.origin).encode('utf-8')
+
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", self.port), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="replay-server", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
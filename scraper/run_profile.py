@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Per-stage timings of scraper runs
+
+GlassdoorScraper records the wall time of its hot paths (page loads,
+Cloudflare waits, popups, scrolling, job count parsing, sleeps) in a
+RunProfile. At the end of a run the events are appended to a JSON-lines file
+next to data.json, one event per line, keeping the most recent runs.
+
+Run this module to summarize the recorded runs per stage:
+    python scraper/run_profile.py [--file data/run_profile.jsonl] [--runs 10]
+"""
+
+import argparse
+import datetime
+import functools
+import json
+import math
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Profile of the recent runs, next to data.json (not committed)
+PROFILE_FILE = Path(__file__).parent.parent / "data" / "run_profile.jsonl"
+
+# Runs kept in the profile file; older runs are dropped when a run is saved
+PROFILE_RUNS_KEPT = 30
+
+
+class RunProfile:
+    """
+    Timed events of one run, shared by all browser workers.
+
+    Each event is a dict with the run ID, the stage name, the wall time in
+    seconds and any extra fields (country, strategy, ...).
+    """
+
+    def __init__(self, run_id: Optional[str] = None):
+        self.run_id = run_id or datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        self.events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float, **fields: Any) -> None:
+        """Add one timed event; fields that are None are left out."""
+        event = {"run": self.run_id, "stage": stage, "seconds": round(seconds, 3)}
+        event.update({key: value for key, value in fields.items() if value is not None})
+        with self._lock:
+            self.events.append(event)
+
+    @contextmanager
+    def stage(self, name: str, **fields: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Time the enclosed block as one event.
+
+        Yields the event's extra fields, so the block can add to them, e.g.
+        which strategy found a value.
+        """
+        start = time.perf_counter()
+        try:
+            yield fields
+        finally:
+            self.record(name, time.perf_counter() - start, **fields)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Number of events and total seconds per stage."""
+        totals: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            for event in self.events:
+                stage = totals.setdefault(event["stage"], {"count": 0, "seconds": 0.0})
+                stage["count"] += 1
+                stage["seconds"] += event["seconds"]
+        return {name: {"count": stage["count"], "seconds": round(stage["seconds"], 1)} for name, stage in totals.items()}
+
+    def save(self, path: Path = PROFILE_FILE, runs_kept: int = PROFILE_RUNS_KEPT) -> None:
+        """Append this run's events to the profile file, dropping runs beyond runs_kept."""
+        path = Path(path)
+        previous = [event for event in load_events(path) if event.get("run") != self.run_id]
+        kept_runs = set(sorted({event["run"] for event in previous})[-(runs_kept - 1):]) if runs_kept > 1 else set()
+
+        os.makedirs(path.parent, exist_ok=True)
+        temp_path = path.with_suffix(".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for event in previous:
+                if event["run"] in kept_runs:
+                    f.write(json.dumps(event, separators=(',', ':')) + "\n")
+            with self._lock:
+                for event in self.events:
+                    f.write(json.dumps(event, separators=(',', ':')) + "\n")
+        os.replace(temp_path, path)
+
+
+def profiled(stage: str) -> Callable:
+    """Decorator for GlassdoorScraper methods: time every call as a stage of self.profile."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.profile.stage(stage, country=self.country):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def rss_mb() -> float:
+    """
+    Resident set size of this process in MB.
+
+    Read from /proc on Linux (the CI runners); elsewhere the peak so far is
+    returned instead, or 0 where neither is available.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    # ru_maxrss is in bytes on macOS and in KB elsewhere
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def load_events(path: Path = PROFILE_FILE) -> List[Dict[str, Any]]:
+    """Read the events of a profile file, skipping unreadable lines."""
+    events = []
+    try:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return events
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def summarize(events: List[Dict[str, Any]], last_runs: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Summarize events per stage across runs.
+
+    Args:
+        events: Events as stored in the profile file
+        last_runs: Only use the most recent runs (all runs if None)
+
+    Returns:
+        Per stage: calls, p50 and p95 of a single call, and the mean total
+        seconds per run
+    """
+    runs = sorted({event["run"] for event in events})
+    if last_runs:
+        runs = runs[-last_runs:]
+    selected = set(runs)
+
+    durations: Dict[str, List[float]] = {}
+    for event in events:
+        if event["run"] in selected:
+            durations.setdefault(event["stage"], []).append(event["seconds"])
+
+    return {
+        stage: {
+            "calls": len(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "per_run": sum(values) / len(runs)
+        }
+        for stage, values in sorted(durations.items(), key=lambda item: -sum(item[1]))
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Summarize scraper run profiles per stage")
+    parser.add_argument("--file", default=str(PROFILE_FILE), help="profile file to read")
+    parser.add_argument("--runs", type=int, help="only summarize the most recent runs")
+    args = parser.parse_args()
+
+    events = load_events(Path(args.file))
+    if not events:
+        print(f"No profile events in {args.file}")
+        return 1
+
+    runs = len({event["run"] for event in events})
+    print(f"{min(args.runs or runs, runs)} of {runs} runs in {args.file}")
+    print(f"{'stage':24s} {'calls':>7s} {'p50':>9s} {'p95':>9s} {'s/run':>9s}")
+    for stage, row in summarize(events, args.runs).items():
+        print(f"{stage:24s} {row['calls']:7d} {row['p50']:9.3f} {row['p95']:9.3f} {row['per_run']:9.1f}")
+
+    # Which strategy extract_job_count succeeded with, across the same runs
+    recent = sorted({event["run"] for event in events})[-(args.runs or runs):]
+    strategies: Dict[str, int] = {}
+    for event in events:
+        if event["stage"] == "extract_job_count" and event["run"] in recent:
+            strategies[event.get("strategy", "unknown")] = strategies.get(event.get("strategy", "unknown"), 0) + 1
+    if strategies:
+        print("extract_job_count strategies: " + ", ".join(f"{name} {count}" for name, count in sorted(strategies.items())))
+
+    # Page loads per browser mode, to compare lean mode against full pages
+    loads: Dict[str, List[Dict[str, Any]]] = {}
+    for event in events:
+        if event["stage"] == "page_load" and event["run"] in recent:
+            loads.setdefault(event.get("mode", "full"), []).append(event)
+    for mode, mode_events in sorted(loads.items()):
+        seconds = [event["seconds"] for event in mode_events]
+        sizes = [event["bytes"] for event in mode_events if "bytes" in event]
+        size_text = f", {sum(sizes) / len(sizes) / 1024:.0f} KB mean" if sizes else ""
+        print(f"page loads ({mode}): {len(seconds)}, p50 {percentile(seconds, 50):.2f}s, "
+              f"p95 {percentile(seconds, 95):.2f}s{size_text}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
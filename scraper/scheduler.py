@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Adaptive refresh of job counts
+
+Most counts move slowly: a country whose 7-day count barely changed since
+the last run will not have a very different 30-day count either. The
+Scheduler decides per (country, field) whether a count needs a fresh scrape,
+based on the last observed values in the count history. Counts that are
+skipped are carried forward together with the date they were observed. A
+carried count says nothing about this run, so it never lets the counts that
+depend on it be carried too.
+"""
+
+import datetime
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from history import CountHistory, HISTORY_DB
+
+logger = logging.getLogger("glassdoor_scraper")
+
+# Field -> (field whose change triggers a refresh, days after which it is refreshed anyway).
+# Fields not listed here ("last_24h") are scraped on every run.
+REFRESH_RULES = {
+    "last_7d": ("last_24h", 2),
+    "last_30d": ("last_7d", 7),
+    "remote": ("last_30d", 7),
+    "on_site": ("last_30d", 7),
+}
+
+# Relative change of the trigger field since its last observation that forces a refresh
+CHANGE_THRESHOLD = 0.15
+
+
+class Scheduler:
+    """
+    Decide which counts of a run can be carried forward.
+
+    Holds the last observed value and date of every (country, field), read
+    from the history once at startup, so it can be shared by all workers.
+    """
+
+    def __init__(self, latest: Dict[str, Dict[str, Tuple[str, int]]], today: Optional[str] = None):
+        self.latest = latest
+        self.today = datetime.date.fromisoformat(today) if today else datetime.datetime.utcnow().date()
+
+    @classmethod
+    def load(cls, countries: Iterable[str], path: Path = HISTORY_DB) -> "Scheduler":
+        """Read the last observation of every field of the countries from the history."""
+        if not Path(path).exists():
+            return cls({})
+        with CountHistory(path) as history:
+            return cls({country: history.latest(country) for country in countries})
+
+    def carry_forward(self, country: str, field: str, current: Dict[str, int],
+                      carried: Iterable[str] = ()) -> Optional[Tuple[int, str]]:
+        """
+        Decide whether a count can be skipped this run.
+
+        Args:
+            country: Country being scraped
+            field: Count to decide on
+            current: Counts already settled for the country in this run
+            carried: Fields of current that were carried forward rather than scraped
+
+        Returns:
+            The last observed value and its date (YYYY-MM-DD) to carry forward,
+            or None if the count should be scraped
+        """
+        if field not in REFRESH_RULES:
+            return None
+
+        previous = self.latest.get(country, {}).get(field)
+        if previous is None:
+            return None
+
+        trigger, max_age_days = REFRESH_RULES[field]
+        as_of, value = previous
+        if (self.today - datetime.date.fromisoformat(as_of)).days >= max_age_days:
+            return None
+
+        # A carried trigger shows no change only because it was not looked at
+        if trigger in carried:
+            logger.info(f"{country} {trigger} was carried forward, refreshing {field}")
+            return None
+
+        # Without a trigger value on both sides there is nothing to judge the change by
+        trigger_before = self.latest[country].get(trigger)
+        trigger_now = current.get(trigger, -1)
+        if trigger_before is None or trigger_now < 0:
+            return None
+
+        change = abs(trigger_now - trigger_before[1]) / max(trigger_before[1], 1)
+        if change > CHANGE_THRESHOLD:
+            logger.info(f"{country} {trigger} changed {change:.0%}, refreshing {field}")
+            return None
+
+        logger.info(f"{country} {trigger} changed {change:.0%}, carrying {field} = {value} forward from {as_of}")
+        return value, as_of
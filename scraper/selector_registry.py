@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Self-tuning order of page selectors
+
+Most fields are read with a list of fallback selectors (page_selectors.py),
+because Glassdoor's markup changes from time to time. The SelectorRegistry
+records which selector found each (page type, field) and keeps a decaying
+hit score per selector between runs, so the selectors that match today's
+markup are tried first. Selectors that have not matched in STALE_RUNS runs of
+their field are reported as stale, a sign that the markup has drifted.
+
+Run this module to print the recorded stats:
+    python scraper/selector_registry.py [--file data/selector_stats.json]
+"""
+
+import argparse
+import json
+import logging
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from checkpoint import write_json_atomic
+
+logger = logging.getLogger("glassdoor_scraper")
+
+# Selector stats, committed next to data.json so they survive between CI runs
+SELECTOR_STATS_FILE = Path(__file__).parent.parent / "data" / "selector_stats.json"
+
+# Weight of a run's hits after each later run; older runs count for less
+SCORE_DECAY = 0.8
+
+# Runs of a field without a hit after which a selector is reported as stale
+STALE_RUNS = 10
+
+
+class SelectorRegistry:
+    """
+    Hit stats of the selectors of every (page type, field).
+
+    Stats are kept per field as {"runs": runs in which the field was looked
+    up, "selectors": {selector: {"score", "hits", "last_hit"}}}, where
+    last_hit is the field's run number of the selector's last hit. Shared by
+    all browser workers of a run; safe to use from several threads.
+    """
+
+    def __init__(self, path: Optional[Path] = None, fields: Optional[Dict[str, Any]] = None,
+                 reorder: bool = True):
+        self.path = Path(path) if path else None
+        self.fields: Dict[str, Any] = fields or {}
+        self.reorder = reorder
+        # Hits of this run per field and selector; a field is only in here once looked up
+        self._run_hits: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path = SELECTOR_STATS_FILE, reorder: bool = True) -> "SelectorRegistry":
+        """Load the stats from disk, starting empty if they are missing or unreadable."""
+        try:
+            with open(path, encoding='utf-8') as f:
+                fields = json.load(f)
+        except FileNotFoundError:
+            fields = {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read selector stats {path}, starting empty: {str(e)}")
+            fields = {}
+        return cls(path, fields, reorder)
+
+    def order(self, page_type: str, field: str, selectors: List[str]) -> List[str]:
+        """
+        Return the selectors of a field, best first.
+
+        Selectors are ordered by hit score; selectors without hits keep their
+        order from page_selectors.py, after the ones that hit.
+        """
+        key = f"{page_type}/{field}"
+        with self._lock:
+            run_hits = self._run_hits.setdefault(key, {})
+            for selector in selectors:
+                run_hits.setdefault(selector, 0)
+            stats = self.fields.get(key, {}).get("selectors", {})
+            scores = {selector: stats.get(selector, {}).get("score", 0.0) for selector in selectors}
+
+        if not self.reorder:
+            return list(selectors)
+        # sorted() is stable, so ties keep their configured order
+        return sorted(selectors, key=lambda selector: -scores[selector])
+
+    def record_hit(self, page_type: str, field: str, selector: str) -> None:
+        """Count a selector that found its field."""
+        key = f"{page_type}/{field}"
+        with self._lock:
+            run_hits = self._run_hits.setdefault(key, {})
+            run_hits[selector] = run_hits.get(selector, 0) + 1
+
+    def stale(self, runs: int = STALE_RUNS) -> List[Dict[str, Any]]:
+        """
+        Selectors looked up in this run that have not hit in the last runs runs of their field.
+
+        Returns:
+            One entry per stale selector with its field, selector and the
+            number of runs since its last hit (None if it never hit)
+        """
+        stale = []
+        with self._lock:
+            for key, run_hits in sorted(self._run_hits.items()):
+                field_stats = self.fields.get(key, {"runs": 0, "selectors": {}})
+                # Count this run, which is not saved yet
+                field_runs = field_stats["runs"] + 1
+                if field_runs < runs:
+                    continue
+                for selector, hits in run_hits.items():
+                    if hits:
+                        continue
+                    last_hit = field_stats["selectors"].get(selector, {}).get("last_hit")
+                    since = field_runs - last_hit if last_hit else None
+                    if since is None or since >= runs:
+                        stale.append({"field": key, "selector": selector, "runs_since_hit": since})
+        return stale
+
+    def summary(self) -> Dict[str, Any]:
+        """Hits of this run per field and the stale selectors."""
+        with self._lock:
+            hits = {key: sum(run_hits.values()) for key, run_hits in sorted(self._run_hits.items())}
+        return {"hits": hits, "stale": self.stale()}
+
+    def save(self, path: Optional[Path] = None) -> None:
+        """Fold this run's hits into the stats and write them to disk."""
+        path = Path(path) if path else self.path
+        with self._lock:
+            for key, run_hits in self._run_hits.items():
+                field_stats = self.fields.setdefault(key, {"runs": 0, "selectors": {}})
+                field_stats["runs"] += 1
+                for selector in set(field_stats["selectors"]) | set(run_hits):
+                    entry = field_stats["selectors"].setdefault(selector, {"score": 0.0, "hits": 0, "last_hit": None})
+                    hits = run_hits.get(selector, 0)
+                    entry["score"] = round(entry["score"] * SCORE_DECAY + hits, 3)
+                    entry["hits"] += hits
+                    if hits:
+                        entry["last_hit"] = field_stats["runs"]
+            self._run_hits = {}
+            if path:
+                write_json_atomic(path, self.fields, indent=2, sort_keys=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Show selector hit stats per page type and field")
+    parser.add_argument("--file", default=str(SELECTOR_STATS_FILE), help="selector stats file to read")
+    args = parser.parse_args()
+
+    registry = SelectorRegistry.load(Path(args.file))
+    if not registry.fields:
+        print(f"No selector stats in {args.file}")
+        return 1
+
+    for key, field_stats in sorted(registry.fields.items()):
+        print(f"{key} ({field_stats['runs']} runs)")
+        ordered = sorted(field_stats["selectors"].items(), key=lambda item: -item[1]["score"])
+        for selector, entry in ordered:
+            since = field_stats["runs"] - entry["last_hit"] if entry["last_hit"] else None
+            flag = "  STALE" if field_stats["runs"] >= STALE_RUNS and (since is None or since >= STALE_RUNS) else ""
+            last = "never" if since is None else f"{since} runs ago"
+            print(f"  {entry['score']:8.1f} {entry['hits']:7d}  last hit {last:12s} {selector}{flag}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
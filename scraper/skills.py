@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Skill matching for job descriptions
+
+Finds data analyst skills, education requirements and soft skills in free text.
+The skill lists are compiled once at import into a single trie-shaped regex,
+so every description is matched in one scan instead of one search per skill.
+This module has no browser dependencies and can be used on its own.
+"""
+
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Pattern
+
+# Technical skills for data analyst roles
+TECHNICAL_SKILLS = [
+    "SQL", "Python", "R", "Excel", "Tableau", "Power BI", "SPSS", "SAS",
+    "D3.js", "Java", "Scala", "MATLAB", "Hadoop", "Spark", "AWS", "Azure",
+    "Google Cloud", "MongoDB", "PostgreSQL", "MySQL", "Oracle", "ETL",
+    "Machine Learning", "Deep Learning", "AI", "Statistics", "Pandas",
+    "NumPy", "Scikit-learn", "TensorFlow", "PyTorch", "Jupyter",
+    "Data Visualization", "Data Modeling", "Business Intelligence",
+    "Data Mining", "A/B Testing", "Data Warehousing", "Looker",
+    "Snowflake", "Redshift", "BigQuery", "Alteryx", "SSRS", "SSIS",
+    "DAX", "Power Query", "VBA", "Qlik", "Cognos", "Teradata",
+    "Informatica", "DataOps", "MLOps", "PowerPoint", "Word", "Outlook",
+    "SharePoint", "Teams", "Jira", "Confluence", "Git", "GitHub", "GitLab",
+    "NoSQL", "Airflow", "dbt", "Data Quality", "JSON", "XML", "API",
+    "REST", "SOAP", "Flask", "Django", "FastAPI", "Data Pipelines",
+    "Google Analytics", "Power Platform", "Databricks", "Talend"
+]
+
+# Education requirements
+EDUCATION_REQUIREMENTS = [
+    "Bachelor's Degree", "Master's Degree", "PhD", "MBA",
+    "Bachelor", "Master", "Doctorate", "BSc", "MSc",
+    "BS", "MS", "Computer Science", "Statistics", "Mathematics",
+    "Information Technology", "Data Science", "Economics", "Business",
+    "Engineering", "Quantitative Field", "Degree"
+]
+
+# Soft skills and other qualifications
+SOFT_SKILLS = [
+    "Communication", "Teamwork", "Problem Solving", "Analytical Thinking",
+    "Critical Thinking", "Attention to Detail", "Time Management",
+    "Project Management", "Leadership", "Collaboration", "Presentation",
+    "Storytelling", "Decision Making", "Self-motivated", "Adaptability",
+    "Creativity", "Organization", "Multitasking", "Prioritization",
+    "Verbal Communication", "Written Communication", "Customer Service",
+    "Business Acumen", "Domain Knowledge", "Industry Experience",
+    "Agile", "Scrum", "Stakeholder Management", "Requirements Gathering"
+]
+
+# Combined list; the order here is the order skills are reported in
+ALL_SKILLS = TECHNICAL_SKILLS + EDUCATION_REQUIREMENTS + SOFT_SKILLS
+
+# Categories of the skill aggregates, in display order
+SKILL_CATEGORIES = ["technical", "education", "soft"]
+
+# Degree phrases found by DEGREE_PATTERNS count as education requirements
+_DEGREE_WORDS = re.compile(r'degree|bachelor|master|phd|msc|bsc', re.IGNORECASE)
+
+# Special cases for education requirements with variations
+DEGREE_PATTERNS = [
+    re.compile(pattern) for pattern in [
+        r"\b[Bb]achelor'?s?\s+[Dd]egree\b",
+        r"\b[Bb][Ss][Cc]\b",
+        r"\b[Mm]aster'?s?\s+[Dd]egree\b",
+        r"\b[Mm][Ss][Cc]\b",
+        r"\b[Pp][Hh][Dd]\b",
+        r"\b[Dd]octoral\s+[Dd]egree\b",
+        r"\b[Dd]egree\s+in\s+[A-Za-z\s]+\b"
+    ]
+]
+
+
+def _trie_pattern(node: Dict[str, Any]) -> str:
+    """Render a character trie as a regex, longest continuation first."""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+
+    if not branches:
+        return ''
+
+    group = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        # A skill ends here; the greedy optional still tries the longer skill first
+        return ('(?:' + group + ')' if len(branches) == 1 else group) + '?'
+    return group
+
+
+def _build_matcher(skills: List[str]) -> Pattern:
+    """
+    Compile all skills into one case-insensitive pattern.
+
+    Skills are merged into a character trie so the regex engine branches on
+    the next character instead of retrying every skill at every word. The
+    pattern sits inside a lookahead so matches never consume text, which lets
+    skills that overlap at different offsets (e.g. "Communication" inside
+    "Verbal Communication") all be found in the same scan. The longest skill
+    starting at each offset wins.
+    """
+    trie: Dict[str, Any] = {}
+    for skill in skills:
+        node = trie
+        for char in skill.casefold():
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    return re.compile(r'(?=\b(' + _trie_pattern(trie) + r')\b)', re.IGNORECASE)
+
+
+def _build_prefix_map(skills: List[str]) -> Dict[str, List[str]]:
+    """
+    Map each skill to the shorter skills that match whenever it matches.
+
+    A lookahead only reports one skill per offset, so "Bachelor" is hidden
+    whenever "Bachelor's Degree" matches at the same position. Because the
+    word boundary after the shorter skill falls inside the longer one, it can
+    be decided once here rather than on every description.
+    """
+    folded = sorted({skill.casefold() for skill in skills})
+    word_boundary = re.compile(r'\b')
+    prefix_map: Dict[str, List[str]] = {}
+
+    for longer in folded:
+        boundaries = {match.start() for match in word_boundary.finditer(longer)}
+        prefix_map[longer] = [
+            shorter for shorter in folded
+            if len(shorter) < len(longer) and longer.startswith(shorter) and len(shorter) in boundaries
+        ]
+
+    return prefix_map
+
+
+_SKILL_MATCHER = _build_matcher(ALL_SKILLS)
+_SKILL_PREFIXES = _build_prefix_map(ALL_SKILLS)
+
+
+def find_skill_keys(text: str) -> set:
+    """Return the case-folded skills found in the text in a single regex scan."""
+    found = set()
+    for match in _SKILL_MATCHER.finditer(text):
+        skill = match.group(1).casefold()
+        if skill not in found:
+            found.add(skill)
+            found.update(_SKILL_PREFIXES.get(skill, ()))
+    return found
+
+
+def extract_skills(text: str) -> List[str]:
+    """
+    Extract relevant data analyst skills from a text (requirements or job description).
+
+    Args:
+        text: The text to extract skills from
+
+    Returns:
+        List of identified skills, in ALL_SKILLS order followed by any degree phrases
+    """
+    found_keys = find_skill_keys(text)
+
+    # Always add the skill with its original case
+    found_skills = [skill for skill in ALL_SKILLS if skill.casefold() in found_keys]
+
+    for pattern in DEGREE_PATTERNS:
+        match = pattern.search(text)
+        if match and match.group(0) not in found_skills:
+            found_skills.append(match.group(0))
+
+    return found_skills
+
+
+def skill_categories(skill: str) -> List[str]:
+    """
+    Return the categories a skill is reported under.
+
+    A skill can be both technical and an education requirement ("Statistics").
+    Degree phrases count as education; anything else that is neither technical
+    nor education is a soft skill.
+    """
+    categories = []
+    if skill in TECHNICAL_SKILLS:
+        categories.append("technical")
+    if skill in EDUCATION_REQUIREMENTS or _DEGREE_WORDS.search(skill):
+        categories.append("education")
+    return categories or ["soft"]
+
+
+def aggregate_skills(listings: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Count how many job postings ask for each skill, grouped by category.
+
+    Listings with the same "posting_id" are near-duplicates of one posting
+    (see near_duplicates.py) and are counted once.
+
+    Args:
+        listings: Job listings with a "skills" list
+
+    Returns:
+        {"listings": number of postings, "technical": [...], "education": [...],
+        "soft": [...]}, each category a list of {"skill", "count"} ranked by
+        count (ties by name)
+    """
+    counts: Counter = Counter()
+    total = 0
+    postings = set()
+    for listing in listings:
+        posting_id = listing.get("posting_id")
+        if posting_id:
+            if posting_id in postings:
+                continue
+            postings.add(posting_id)
+        total += 1
+        counts.update(set(skill for skill in listing.get("skills") or [] if skill))
+
+    return _ranked(counts, total)
+
+
+def merge_skill_aggregates(aggregates: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine the results of aggregate_skills() for several sets of listings."""
+    counts: Counter = Counter()
+    total = 0
+    for aggregate in aggregates:
+        total += aggregate["listings"]
+        # A skill in two categories is listed twice with the same count; take it once
+        counts.update({
+            entry["skill"]: entry["count"]
+            for category in SKILL_CATEGORIES for entry in aggregate[category]
+        })
+
+    return _ranked(counts, total)
+
+
+def _ranked(counts: Counter, total: int) -> Dict[str, Any]:
+    aggregate: Dict[str, Any] = {"listings": total}
+    for category in SKILL_CATEGORIES:
+        aggregate[category] = []
+
+    for skill, count in sorted(counts.items(), key=lambda item: (-item[1], item[0])):
+        for category in skill_categories(skill):
+            aggregate[category].append({"skill": skill, "count": count})
+
+    return aggregate
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for the dashboard manifest and content-hashed country files
+"""
+
+import json
+
+from artifacts import DETAIL_DIR, MANIFEST_FILE, write_artifacts
+
+LISTINGS = [{"title": "Data Analyst II", "company": "Northwind Analytics", "skills": ["SQL"], "link": ""}]
+
+
+def run_output(**runtime):
+    country_data = {"last_24h": 76, "last_7d": 283, "last_30d": 786, "remote": 212, "on_site": 574,
+                    "job_listings": LISTINGS}
+    country_data.update(runtime)
+    return {"last_updated": "2026-10-16 23:00:00", "role": "Data Analyst", "countries": {"Canada": country_data},
+            "roles": {}}
+
+
+def manifest(directory):
+    with open(directory / MANIFEST_FILE, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_detail_name_ignores_runtime_fields(tmp_path):
+    write_artifacts(run_output(memory={"peak_rss_mb": 180.2}, sources={"last_24h": "http"}), tmp_path)
+    first = manifest(tmp_path)["countries"]["Canada"]["detail"]
+
+    write_artifacts(run_output(memory={"peak_rss_mb": 214.9}, sources={"last_24h": "browser"}), tmp_path)
+    second = manifest(tmp_path)["countries"]["Canada"]
+
+    assert second["detail"] == first
+    assert second["last_30d"] == 786
+    detail = json.loads((tmp_path / first).read_text(encoding='utf-8'))
+    assert detail == {"job_listings": LISTINGS}
+
+
+def test_changed_listings_replace_the_detail_file(tmp_path):
+    write_artifacts(run_output(), tmp_path)
+    first = manifest(tmp_path)["countries"]["Canada"]["detail"]
+
+    data = run_output()
+    data["countries"]["Canada"]["job_listings"] = []
+    write_artifacts(data, tmp_path)
+    second = manifest(tmp_path)["countries"]["Canada"]["detail"]
+
+    assert second != first
+    # Files the manifest no longer references are removed
+    assert [path.name for path in (tmp_path / DETAIL_DIR).iterdir()] == [second.split("/")[1]]
+
+
+def test_manifest_of_every_role(tmp_path):
+    data = run_output(stale={"last_7d": "2026-10-15"})
+    data["skill_counts"] = {"listings": 1}
+    data["roles"] = {"BI Analyst": {"skill_counts": {"listings": 0}, "countries": run_output()["countries"]}}
+    write_artifacts(data, tmp_path)
+
+    written = manifest(tmp_path)
+    assert written["role"] == "Data Analyst"
+    assert written["skill_counts"] == {"listings": 1}
+    assert written["countries"]["Canada"]["stale"] == {"last_7d": "2026-10-15"}
+    # Other roles' detail files are prefixed with the role
+    assert written["roles"]["BI Analyst"]["countries"]["Canada"]["detail"].startswith(f"{DETAIL_DIR}/bi-analyst--canada.")
+    assert written["roles"]["BI Analyst"]["skill_counts"] == {"listings": 0}
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for the run checkpoint
+"""
+
+import datetime
+
+from checkpoint import Checkpoint, run_window
+
+COUNTRY_DATA = {"last_24h": 76, "last_7d": 283, "last_30d": 786, "job_listings": []}
+
+
+def test_resume_in_the_same_window(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    Checkpoint(path, window="2026-10-16").save("Data Analyst", "Canada", COUNTRY_DATA)
+
+    assert Checkpoint(path, window="2026-10-16").load() == {"Data Analyst": {"Canada": COUNTRY_DATA}}
+
+
+def test_checkpoint_of_another_window_is_ignored(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    Checkpoint(path, window="2026-10-15").save("Data Analyst", "Canada", COUNTRY_DATA)
+
+    assert Checkpoint(path, window="2026-10-16").load() == {}
+
+
+def test_clear(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    checkpoint = Checkpoint(path, window="2026-10-16")
+    checkpoint.save("Data Analyst", "Canada", COUNTRY_DATA)
+    checkpoint.clear()
+
+    assert not path.exists()
+    # Clearing twice is harmless
+    checkpoint.clear()
+
+
+def test_unreadable_checkpoint_starts_over(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    path.write_text("{", encoding='utf-8')
+
+    assert Checkpoint(path, window="2026-10-16").load() == {}
+
+
+def test_retry_after_midnight_is_in_the_same_window():
+    scheduled = datetime.datetime(2026, 10, 16, 23, 0, tzinfo=datetime.timezone.utc)
+
+    assert run_window(scheduled) == "2026-10-16"
+    assert run_window(scheduled + datetime.timedelta(hours=3)) == "2026-10-16"
+    assert run_window(scheduled + datetime.timedelta(days=1)) == "2026-10-17"
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for the job description archive and offline skill re-extraction
+"""
+
+import json
+
+from analysis import apply_skills
+from description_archive import DescriptionArchive, description_id, reextract_skills
+
+DESCRIPTION = "Build dashboards in Tableau and Power BI. Strong SQL required."
+
+
+def test_description_id_ignores_whitespace():
+    assert description_id(DESCRIPTION) == description_id(f"  {DESCRIPTION.replace(' ', chr(10))} ")
+    assert description_id(DESCRIPTION) != description_id("Excel and SQL reporting.")
+
+
+def test_descriptions_are_stored_once(tmp_path):
+    archive = DescriptionArchive.load(tmp_path)
+    key = archive.add(DESCRIPTION)
+    assert archive.add(DESCRIPTION) == key
+    segment = archive.save()
+
+    # Nothing new: no second segment
+    reloaded = DescriptionArchive.load(tmp_path)
+    reloaded.add(DESCRIPTION)
+    assert reloaded.save() is None
+
+    assert list(reloaded.descriptions()) == [(key, DESCRIPTION)]
+    assert reloaded.summary() == {"known": 1, "new": 0, "archived": 1}
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(["index.json", segment.name])
+
+
+def test_empty_archive_still_writes_its_index(tmp_path):
+    assert DescriptionArchive.load(tmp_path / "descriptions").save() is None
+    assert json.loads((tmp_path / "descriptions" / "index.json").read_text(encoding='utf-8')) == {}
+
+
+def test_reextracted_skills_replace_listing_skills(tmp_path):
+    archive = DescriptionArchive.load(tmp_path)
+    key = archive.add(DESCRIPTION)
+    archive.save()
+
+    skills_by_id = reextract_skills(archive, workers=1)
+    assert "Tableau" in skills_by_id[key]
+
+    data = {"countries": {"Canada": {"job_listings": [
+        {"title": "Data Analyst II", "skills": [], "description_id": key},
+        {"title": "Junior Data Analyst", "skills": ["Excel"]},
+    ]}}, "roles": {}}
+    assert apply_skills(data, skills_by_id) == {"updated": 1, "unarchived": 1}
+    assert data["countries"]["Canada"]["job_listings"][0]["skills"] == skills_by_id[key]
+    assert data["skill_counts"]["listings"] == 2
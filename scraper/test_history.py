@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for the daily job count history and trend files
+"""
+
+import json
+
+from history import CountHistory, country_slug
+
+
+def run(last_24h, last_7d=-1, stale=None):
+    country_data = {"last_24h": last_24h, "last_7d": last_7d, "last_30d": -1, "remote": -1, "on_site": -1}
+    if stale:
+        country_data["stale"] = stale
+    return {"countries": {"United Arab Emirates": country_data}}
+
+
+def test_country_slug():
+    assert country_slug("United Arab Emirates") == "united-arab-emirates"
+
+
+def test_only_observed_counts_are_kept(tmp_path):
+    with CountHistory(tmp_path / "history.sqlite") as history:
+        history.record_run(run(10, 50), date="2026-10-14")
+        # Carried forward from the 14th, and not scraped at all
+        history.record_run(run(12, 50, stale={"last_7d": "2026-10-14"}), date="2026-10-15")
+
+        assert history.latest("United Arab Emirates") == {"last_24h": ("2026-10-15", 12),
+                                                          "last_7d": ("2026-10-14", 50)}
+
+
+def test_a_second_run_on_the_same_day_replaces_the_first(tmp_path):
+    with CountHistory(tmp_path / "history.sqlite") as history:
+        history.record_run(run(10), date="2026-10-15")
+        history.record_run(run(11), date="2026-10-15")
+
+        assert [row[:2] for row in history.series("United Arab Emirates")] == [("2026-10-15", 11)]
+
+
+def test_trend_files_have_a_slot_per_day(tmp_path):
+    with CountHistory(tmp_path / "history.sqlite") as history:
+        history.record_run(run(10), date="2026-10-13")
+        history.record_run(run(12), date="2026-10-15")
+        paths = history.export_trends(tmp_path / "trends", days=365)
+
+    assert [path.name for path in paths] == ["united-arab-emirates.json"]
+    trend = json.loads(paths[0].read_text(encoding='utf-8'))
+    assert trend["start"] == "2026-10-13"
+    assert trend["last_24h"] == [10, None, 12]
+    assert trend["last_7d"] == [None, None, None]
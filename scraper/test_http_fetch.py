@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for the HTTP tier's page parsers
+
+The search and job pages come from scraper/fixtures, so the parsers are
+checked against the same pages the replay test loads in the browser.
+"""
+
+import json
+import re
+
+from http_fetch import HttpFetcher, job_count_pattern, parse_job_count, parse_job_detail, parse_search_page
+from queries import GLASSDOOR_ORIGIN, search_url
+from replay import FIXTURES_DIR, INDEX_FILE, load_index
+
+SEARCH_URL = search_url("Data Analyst", "Canada")
+REMOTE_URL = search_url("Data Analyst", "Canada", remote=True)
+
+
+def fixture(url: str) -> str:
+    """HTML of the fixture recorded for a live-site URL."""
+    with open(FIXTURES_DIR / INDEX_FILE, encoding='utf-8') as f:
+        index = json.load(f)
+    return (FIXTURES_DIR / index[url[len(GLASSDOOR_ORIGIN):]]).read_text(encoding='utf-8')
+
+
+def test_job_counts_of_every_window():
+    counts = {
+        days: parse_search_page(fixture(f"{SEARCH_URL}?fromAge={days}"), role="Data Analyst")["count"]
+        for days in (1, 7, 30)
+    }
+    assert counts == {1: 76, 7: 283, 30: 786}
+    assert parse_job_count(fixture(REMOTE_URL), role="Data Analyst") == 212
+
+
+def test_job_cards():
+    url = f"{SEARCH_URL}?fromAge=1"
+    cards = parse_search_page(fixture(url), base_url=url)["cards"]
+
+    assert [(card["title"], card["company"]) for card in cards] == [
+        ("Data Analyst II", "Northwind Analytics"),
+        ("Junior Data Analyst", "Maple Health"),
+        ("Business Intelligence Analyst", "Lakeshore Bank"),
+        ("Marketing Data Analyst", "Aurora Retail"),
+        ("Data Analyst, Operations", "Prairie Logistics"),
+    ]
+    # Relative links are resolved against the page URL
+    assert cards[0]["link"] == f"{GLASSDOOR_ORIGIN}/job-details/canada-1000.htm?jl=1000"
+
+
+def test_card_limit_and_last_page():
+    url = f"{SEARCH_URL}?fromAge=1"
+    parsed = parse_search_page(fixture(url), base_url=url, limit=2)
+
+    assert len(parsed["cards"]) == 2
+    assert parsed["next"] == ""
+
+
+def test_job_count_from_embedded_state():
+    html = ('<html><head><title>Jobs</title></head><body>'
+            '<script type="application/json">{"props": {"pageProps": {"totalJobsCount": 1234}}}</script>'
+            '</body></html>')
+    assert parse_job_count(html) == 1234
+
+
+def test_job_count_ignores_unrelated_numbers():
+    html = ('<html><head><title>Data Analyst jobs in Canada 2026 | 1,234 Data Analyst jobs</title></head><body>'
+            '<script type="application/json">{"props": {"pageProps": {"filters": {"jobCount": 12}}}}</script>'
+            '</body></html>')
+    assert parse_job_count(html, role="Data Analyst") == 1234
+    assert parse_job_count("<html><head><title>Jobs in Canada 2026</title></head><body></body></html>") is None
+
+
+def test_page_without_job_count():
+    assert parse_job_count("<html><head><title>Search</title></head><body></body></html>") is None
+
+
+def test_job_count_pattern_names_the_role():
+    pattern = re.compile(job_count_pattern("Data Engineer"), re.IGNORECASE)
+
+    assert pattern.search("1,234 Data  Engineer jobs").group(1) == "1,234"
+    assert pattern.search("56 jobs").group(1) == "56"
+    assert pattern.search("78 Data Analyst jobs") is None
+
+
+def test_job_detail():
+    detail = parse_job_detail(fixture(f"{GLASSDOOR_ORIGIN}/job-details/canada-1000.htm?jl=1000"))
+
+    assert detail["title"] == "Data Analyst II"
+    assert detail["company"] == "Northwind Analytics"
+    assert "Tableau" in detail["description"]
+
+
+class FakeResponse:
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+
+
+def test_fetched_pages_are_recorded(tmp_path, monkeypatch):
+    fetcher = HttpFetcher(record_dir=str(tmp_path))
+    url = f"{SEARCH_URL}?fromAge=1"
+    monkeypatch.setattr(fetcher.session, "get", lambda url, timeout: FakeResponse(fixture(url)))
+
+    html = fetcher.fetch(url)
+    recorded = tmp_path / load_index(tmp_path)[url[len(GLASSDOOR_ORIGIN):]]
+    assert parse_job_count(recorded.read_text(encoding='utf-8'), role="Data Analyst") == 76
+    assert html == fixture(url)
+
+    # Challenge pages are never recorded
+    monkeypatch.setattr(fetcher.session, "get", lambda url, timeout: FakeResponse("Just a moment", 403))
+    assert fetcher.fetch(REMOTE_URL) is None
+    assert len(load_index(tmp_path)) == 1
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for the seen-jobs index
+"""
+
+from job_index import DEFAULT_COMPANY, JobIndex, job_id
+
+LINK = "https://www.glassdoor.com/job-details/canada-1000.htm?jl=1000"
+
+
+def listing(**fields):
+    job = {"title": "Data Analyst II", "company": "Northwind Analytics", "skills": ["SQL", "Tableau"], "link": ""}
+    job.update(fields)
+    return job
+
+
+def test_job_id_prefers_listing_id():
+    assert job_id("Data Analyst II", "Northwind Analytics", LINK) == "jl:1000"
+    assert job_id("Another title", DEFAULT_COMPANY, LINK) == "jl:1000"
+
+
+def test_job_id_hashes_title_and_company():
+    key = job_id("Data Analyst II", "Northwind Analytics")
+
+    assert key.startswith("h:")
+    assert job_id(" data analyst ii ", "NORTHWIND ANALYTICS") == key
+
+
+def test_job_id_of_placeholders():
+    assert job_id("Data Analyst II", DEFAULT_COMPANY) is None
+    # A card without a title gets the role as its title
+    assert job_id("Data Engineer", "Northwind Analytics", placeholder_title=True) is None
+    assert job_id("Data Engineer", "Northwind Analytics", LINK, placeholder_title=True) == "jl:1000"
+
+
+def test_job_titled_like_the_role_is_indexed(tmp_path):
+    index = JobIndex(tmp_path / "job_index.json")
+    index.record(listing(title="Data Analyst"))
+    index.record(listing(title="Data Engineer"), placeholder_title=True)
+
+    assert index.lookup("Data Analyst", "Northwind Analytics") == listing(title="Data Analyst")
+    assert index.summary()["indexed"] == 1
+
+
+def test_record_and_lookup(tmp_path):
+    index = JobIndex(tmp_path / "job_index.json")
+    index.record(listing(link=LINK, description_id="abc"))
+    index.save()
+
+    loaded = JobIndex.load(tmp_path / "job_index.json")
+    assert loaded.lookup("Data Analyst II", "Northwind Analytics", LINK) == listing(link=LINK, description_id="abc")
+    assert loaded.summary() == {"known": 1, "new": 0, "indexed": 1}
+
+
+def test_jobs_without_skills_are_fetched_again(tmp_path):
+    index = JobIndex(tmp_path / "job_index.json")
+    index.record(listing(skills=[]))
+
+    assert index.lookup("Data Analyst II", "Northwind Analytics") is None
+
+
+def test_update_skills_and_prune(tmp_path):
+    index = JobIndex(tmp_path / "job_index.json")
+    index.record(listing(link=LINK, description_id="abc"))
+
+    assert index.update_skills({"abc": ["SQL"]}) == 1
+    assert index.jobs["jl:1000"]["skills"] == ["SQL"]
+
+    index.jobs["jl:1000"]["last_seen"] = "2000-01-01T00:00:00Z"
+    assert index.prune() == 1
+    assert index.jobs == {}
+
+
+def test_unreadable_index_starts_empty(tmp_path):
+    path = tmp_path / "job_index.json"
+    path.write_text("{not json", encoding='utf-8')
+
+    assert JobIndex.load(path).jobs == {}
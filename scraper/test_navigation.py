@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests for the classification of failed navigations and the retry budget
+"""
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from navigation import (
+    BACKOFF_BASE, BACKOFF_CAP, DRIVER_CRASH, SELECTOR_MISS, TIMEOUT, RetryBudget, backoff_delay, classify_exception
+)
+
+
+def test_page_load_timeout():
+    assert classify_exception(TimeoutException("timeout: Timed out receiving message from renderer")) == TIMEOUT
+
+
+def test_crashed_browser():
+    assert classify_exception(WebDriverException("invalid session id")) == DRIVER_CRASH
+    assert classify_exception(WebDriverException("chrome not reachable")) == DRIVER_CRASH
+
+
+def test_dead_chromedriver():
+    refused = NewConnectionError(None, "Failed to establish a new connection: [Errno 111] Connection refused")
+    assert classify_exception(MaxRetryError(None, "/session/abc/url", refused)) == DRIVER_CRASH
+    reset = ProtocolError("Connection aborted.", ConnectionResetError(104, "Connection reset by peer"))
+    assert classify_exception(reset) == DRIVER_CRASH
+    assert classify_exception(ConnectionRefusedError(111, "Connection refused")) == DRIVER_CRASH
+
+
+def test_other_errors_are_not_navigation_failures():
+    assert classify_exception(ValueError("connection refused")) is None
+    assert classify_exception(WebDriverException("element click intercepted")) is None
+
+
+def test_backoff_grows_and_is_capped():
+    for attempt in range(10):
+        delay = backoff_delay(attempt)
+        expected = min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt)
+        assert expected * 0.5 <= delay <= expected * 1.5
+
+
+def test_retry_budget():
+    budget = RetryBudget(10)
+    budget.record_failure(SELECTOR_MISS, 4)
+
+    assert budget.spend(5)
+    assert not budget.spend(5)
+    budget.record_recovery()
+    assert budget.summary() == {"cloudflare": 0, "timeout": 0, "selector_miss": 1, "driver_crash": 0,
+                                "retries": 1, "recovered": 1, "budget_exhausted": 1}
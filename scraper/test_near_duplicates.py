@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for near-duplicate detection of job postings
+"""
+
+from near_duplicates import NearDuplicateIndex, signature, similarity
+
+DESCRIPTION = ("Build dashboards in Tableau and Power BI. Strong SQL and Python skills required. "
+               "Work with stakeholders across finance and operations to define reporting needs, "
+               "automate recurring reports and present insights to the leadership team.")
+
+
+def listing(title="Data Analyst II", company="Northwind Analytics", skills=("SQL", "Tableau")):
+    return {"title": title, "company": company, "skills": list(skills), "link": ""}
+
+
+def test_similarity_of_near_copies():
+    original = signature("Data Analyst II", "Northwind Analytics", DESCRIPTION)
+    repost = signature("Data Analyst II", "Northwind Analytics", DESCRIPTION + " Apply today.")
+    unrelated = signature("Nurse", "Maple Health", "Provide patient care in a busy ward on rotating shifts.")
+
+    assert similarity(original, repost) >= 0.8
+    assert similarity(original, unrelated) < 0.3
+
+
+def test_listing_that_identifies_nothing():
+    assert signature("Data Analyst", "Unknown Company") is None
+
+
+def test_reposts_share_a_posting(tmp_path):
+    index = NearDuplicateIndex(tmp_path / "near_duplicates.json")
+    first, repost, other = listing(), listing(), listing("Nurse", "Maple Health")
+
+    posting_id = index.assign(first, DESCRIPTION)
+    assert index.assign(repost, DESCRIPTION + " Apply today.") == posting_id
+    assert index.assign(other, "Provide patient care in a busy ward on rotating shifts.") != posting_id
+    assert repost["posting_id"] == posting_id
+    assert index.summary() == {"new": 2, "duplicates": 1, "skipped_fetches": 0, "indexed": 2}
+
+
+def test_postings_survive_a_save(tmp_path):
+    path = tmp_path / "near_duplicates.json"
+    index = NearDuplicateIndex(path)
+    posting_id = index.assign(listing(), DESCRIPTION)
+    index.save()
+
+    assert NearDuplicateIndex.load(path).assign(listing(), DESCRIPTION) == posting_id
+
+
+def test_update_skills_and_prune(tmp_path):
+    index = NearDuplicateIndex(tmp_path / "near_duplicates.json")
+    job = listing()
+    job["description_id"] = "abc"
+    posting_id = index.assign(job, DESCRIPTION)
+
+    assert index.update_skills({"abc": ["SQL"]}) == 1
+    assert index.postings[posting_id]["skills"] == ["SQL"]
+
+    index.postings[posting_id]["last_seen"] = "2000-01-01T00:00:00Z"
+    assert index.prune() == 1
+    assert index.postings == {}
+
+
+def test_header_match_needs_the_snippet(tmp_path):
+    index = NearDuplicateIndex(tmp_path / "near_duplicates.json")
+    posting_id = index.assign(listing(), DESCRIPTION)
+    snippet = DESCRIPTION[:120]
+
+    repost = index.match_header("Data Analyst II", "Northwind Analytics", snippet, "https://example.com/jl=1")
+    assert repost["posting_id"] == posting_id
+    assert repost["skills"] == ["SQL", "Tableau"]
+
+    # Same title and company, different job
+    assert index.match_header("Data Analyst II", "Northwind Analytics", "Own the data warehouse and ETL.") is None
+    assert index.match_header("Data Analyst II", "Northwind Analytics", "") is None
+    assert index.summary()["skipped_fetches"] == 1
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-run result cache
+"""
+
+import main
+from main import ResultCache
+
+KEY = ("Canada", "https://www.glassdoor.com/Job/canada-data-analyst-jobs.htm?fromAge=1", "count")
+
+
+def test_hits_and_misses():
+    cache = ResultCache(ttl=60)
+    assert cache.get(KEY) is None
+
+    cache.put(KEY, 76)
+    assert cache.get(KEY) == 76
+    assert cache.summary() == {"hits": 1, "misses": 1}
+
+
+def test_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(main.time, "monotonic", lambda: now[0])
+    cache = ResultCache(ttl=60)
+    cache.put(KEY, 76)
+
+    now[0] += 60
+    assert cache.get(KEY) == 76
+    now[0] += 1
+    assert cache.get(KEY) is None
+    # An expired entry is dropped rather than served later
+    now[0] = 1000.0
+    assert cache.get(KEY) is None
+
+
+def test_disabled_cache_stores_nothing():
+    cache = ResultCache(ttl=0)
+    cache.put(KEY, 76)
+
+    assert cache.get(KEY) is None
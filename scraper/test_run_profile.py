@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-stage run profile
+"""
+
+from run_profile import RunProfile, load_events, percentile, summarize
+
+
+def test_stage_records_extra_fields():
+    profile = RunProfile("run-1")
+    with profile.stage("extract_job_count", country="Canada") as fields:
+        fields["strategy"] = "selector"
+    profile.record("humanize", 0.5, country=None)
+
+    assert [event["stage"] for event in profile.events] == ["extract_job_count", "humanize"]
+    assert profile.events[0]["strategy"] == "selector"
+    # Fields that are None are left out
+    assert "country" not in profile.events[1]
+    assert profile.summary()["humanize"] == {"count": 1, "seconds": 0.5}
+
+
+def test_save_keeps_the_last_runs(tmp_path):
+    path = tmp_path / "run_profile.jsonl"
+    for run in range(1, 5):
+        profile = RunProfile(f"run-{run}")
+        profile.record("driver.get", run)
+        profile.save(path, runs_kept=2)
+
+    assert [event["run"] for event in load_events(path)] == ["run-3", "run-4"]
+
+
+def test_unreadable_lines_are_skipped(tmp_path):
+    path = tmp_path / "run_profile.jsonl"
+    path.write_text('{"run": "run-1", "stage": "driver.get", "seconds": 1.0}\n{"run": \n', encoding='utf-8')
+
+    assert len(load_events(path)) == 1
+
+
+def test_summarize_across_runs():
+    events = [{"run": f"run-{run}", "stage": "driver.get", "seconds": float(seconds)}
+              for run, seconds in [(1, 1), (1, 3), (2, 2), (3, 4)]]
+
+    assert percentile([4, 1, 3, 2], 50) == 2
+    assert summarize(events) == {"driver.get": {"calls": 4, "p50": 2.0, "p95": 4.0, "per_run": 10 / 3}}
+    assert summarize(events, last_runs=1)["driver.get"]["calls"] == 1
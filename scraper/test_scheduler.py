@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for the adaptive refresh of job counts
+"""
+
+from scheduler import Scheduler
+
+LATEST = {
+    "Canada": {
+        "last_24h": ("2026-10-15", 100),
+        "last_7d": ("2026-10-15", 500),
+        "last_30d": ("2026-10-10", 2000),
+        "remote": ("2026-10-15", 300),
+    }
+}
+
+
+def scheduler() -> Scheduler:
+    return Scheduler(LATEST, today="2026-10-16")
+
+
+def test_carried_when_trigger_barely_changed():
+    assert scheduler().carry_forward("Canada", "last_7d", {"last_24h": 110}) == (500, "2026-10-15")
+
+
+def test_refreshed_when_trigger_changed():
+    assert scheduler().carry_forward("Canada", "last_7d", {"last_24h": 130}) is None
+
+
+def test_carried_trigger_does_not_carry_the_chain():
+    current = {"last_24h": 105}
+    carried = {}
+    for field in ("last_7d", "last_30d", "remote"):
+        result = scheduler().carry_forward("Canada", field, current, carried)
+        if result:
+            current[field], carried[field] = result
+
+    # last_7d was carried, so last_30d was scraped; remote depends on the scraped last_30d
+    assert carried == {"last_7d": "2026-10-15"}
+    assert scheduler().carry_forward("Canada", "remote", {"last_30d": 2100}, carried) == (300, "2026-10-15")
+
+
+def test_refreshed_when_too_old():
+    # last_30d is refreshed at least every 7 days
+    assert scheduler().carry_forward("Canada", "last_30d", {"last_7d": 500}) is not None
+    assert Scheduler(LATEST, today="2026-10-17").carry_forward("Canada", "last_30d", {"last_7d": 500}) is None
+
+
+def test_refreshed_without_trigger_value():
+    # The trigger failed to scrape this run
+    assert scheduler().carry_forward("Canada", "last_7d", {"last_24h": -1}) is None
+    # No trigger observation in the history
+    assert Scheduler({"Canada": {"last_7d": ("2026-10-15", 500)}}, today="2026-10-16").carry_forward(
+        "Canada", "last_7d", {"last_24h": 100}) is None
+
+
+def test_always_scraped():
+    current = {"last_24h": 100, "last_7d": 500, "last_30d": 2000}
+    # last_24h has no refresh rule, on_site and Germany have no history
+    assert scheduler().carry_forward("Canada", "last_24h", current) is None
+    assert scheduler().carry_forward("Canada", "on_site", current) is None
+    assert scheduler().carry_forward("Germany", "last_7d", current) is None
+
+
+def test_load_without_history(tmp_path):
+    assert Scheduler.load(["Canada"], tmp_path / "history.sqlite").latest == {}
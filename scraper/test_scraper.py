@@ -1,37 +1,62 @@
 #!/usr/bin/env python3
 """
-Test script for the job data generator
-This script runs the generator for a single country to test functionality
+Test script for the Glassdoor scraper
+This script scrapes a single country from the synthetic pages in scraper/fixtures
+with the browser, so it runs without reaching Glassdoor. The HTTP tier is
+disabled, since it would serve every page without the browser. Under pytest it
+is skipped when Chrome is not installed
 """
 
 import sys
-from main import JobDataGenerator, save_data
 from pathlib import Path
+from typing import Any, Dict
 
-def test_single_country(country_name):
-    """Test the data generator with a single country."""
-    print(f"Generating test data for {country_name}")
-    
-    output_file = Path(__file__).parent.parent / "data" / "test_data.json"
-    
-    generator = JobDataGenerator()
-    
-    try:
-        country_data = generator.generate_data(country_name)
-        
-        all_data = {
-            "countries": {
-                country_name: country_data
-            }
-        }
-        
-        save_data(all_data, output_file)
-        print(f"Test data saved to {output_file}")
-    
-    except Exception as e:
-        print(f"Error during test: {str(e)}")
+from main import COUNTRY_CONFIGS, GlassdoorScraper, save_data, setup_logging
+from replay import FIXTURES_DIR, ReplayServer, replay_country_configs
+
+# Counts shown by the Canada fixtures
+EXPECTED_COUNTS = {"last_24h": 76, "last_7d": 283, "last_30d": 786, "remote": 212, "on_site": 574}
+
+def scrape_fixtures(country_name: str = "Canada") -> Dict[str, Any]:
+    """Scrape a single country from the fixtures with the browser scraper."""
+    original_configs = {country: dict(config) for country, config in COUNTRY_CONFIGS.items()}
+
+    with ReplayServer(FIXTURES_DIR) as server:
+        COUNTRY_CONFIGS.update(replay_country_configs(COUNTRY_CONFIGS, server.origin))
+
+        scraper = GlassdoorScraper(http_first=False)
+
+        try:
+            scraper.initialize()
+            return scraper.scrape_country(country_name)
+
+        finally:
+            scraper.close()
+            COUNTRY_CONFIGS.update(original_configs)
+
+def test_single_country():
+    """Test the browser scraper with a single country against the fixtures."""
+    import pytest
+    # Imported only when the test runs, like the scraper does
+    import undetected_chromedriver as uc
+    if not uc.find_chrome_executable():
+        pytest.skip("Chrome is not installed")
+
+    country_data = scrape_fixtures("Canada")
+
+    assert {field: country_data[field] for field in EXPECTED_COUNTS} == EXPECTED_COUNTS
+    assert set(country_data["sources"].values()) <= {"browser", "cache"}
+    assert {listing["title"] for listing in country_data["job_listings"]} >= {"Data Analyst II", "Junior Data Analyst"}
 
 if __name__ == "__main__":
+    setup_logging()
     # Use the first command-line argument as the country name, or default to "Canada"
     country = sys.argv[1] if len(sys.argv) > 1 else "Canada"
-    test_single_country(country) 
\ No newline at end of file
+    print(f"Scraping fixture pages for {country}")
+
+    output_file = Path(__file__).parent.parent / "data" / "test_data.json"
+    country_data = scrape_fixtures(country)
+    print(f"Sources: {country_data['sources']}")
+
+    save_data({"countries": {country: country_data}}, output_file)
+    print(f"Test data saved to {output_file}")
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for the adaptive selector order
+"""
+
+from selector_registry import SelectorRegistry
+
+SELECTORS = [".jobCard", "[data-test='jobCard']", "li[id^='job_']"]
+
+
+def run(registry, hit=None):
+    """One run in which the card selectors are looked up and hit may find the cards."""
+    order = registry.order("search", "job_card", SELECTORS)
+    if hit:
+        registry.record_hit("search", "job_card", hit)
+    registry.save()
+    return order
+
+
+def test_selectors_that_hit_come_first(tmp_path):
+    path = tmp_path / "selector_stats.json"
+    registry = SelectorRegistry.load(path)
+
+    assert run(registry, "li[id^='job_']") == SELECTORS
+    assert SelectorRegistry.load(path).order("search", "job_card", SELECTORS) == [
+        "li[id^='job_']", ".jobCard", "[data-test='jobCard']"]
+
+
+def test_configured_order_without_reordering(tmp_path):
+    path = tmp_path / "selector_stats.json"
+    run(SelectorRegistry.load(path), "li[id^='job_']")
+
+    assert SelectorRegistry.load(path, reorder=False).order("search", "job_card", SELECTORS) == SELECTORS
+
+
+def test_recent_hits_outweigh_old_ones(tmp_path):
+    registry = SelectorRegistry.load(tmp_path / "selector_stats.json")
+    for _ in range(3):
+        run(registry, ".jobCard")
+    for _ in range(6):
+        run(registry, "[data-test='jobCard']")
+
+    assert registry.order("search", "job_card", SELECTORS)[0] == "[data-test='jobCard']"
+
+
+def test_stale_selectors(tmp_path):
+    registry = SelectorRegistry.load(tmp_path / "selector_stats.json")
+    for _ in range(3):
+        run(registry, ".jobCard")
+    registry.order("search", "job_card", SELECTORS)
+    registry.record_hit("search", "job_card", ".jobCard")
+
+    stale = registry.stale(runs=3)
+    assert [entry["selector"] for entry in stale] == ["[data-test='jobCard']", "li[id^='job_']"]
+    assert stale[0]["runs_since_hit"] is None
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for skill extraction, skill rankings and search query planning
+"""
+
+from queries import plan_pages, plan_queries, plan_tasks, query_configs, role_slug, search_url
+from skills import aggregate_skills, extract_skills, skill_categories
+
+
+def test_extract_skills():
+    skills = extract_skills("Strong SQL and python, dashboards in Power BI. Bachelor's degree in Statistics.")
+
+    for skill in ("SQL", "Python", "Power BI", "Statistics"):
+        assert skill in skills
+    assert "R" not in skills
+
+
+def test_skill_categories():
+    assert skill_categories("SQL") == ["technical"]
+    assert "education" in skill_categories("Bachelor's degree")
+    assert skill_categories("Teamwork") == ["soft"]
+
+
+def test_aggregate_counts_postings_once():
+    listings = [
+        {"skills": ["SQL", "Python"], "posting_id": "p:1"},
+        {"skills": ["SQL", "Python"], "posting_id": "p:1"},
+        {"skills": ["SQL"]},
+    ]
+    aggregate = aggregate_skills(listings)
+
+    assert aggregate["listings"] == 2
+    assert aggregate["technical"] == [{"skill": "SQL", "count": 2}, {"skill": "Python", "count": 1}]
+
+
+def test_search_urls():
+    assert role_slug("BI Analyst") == "bi-analyst"
+    assert search_url("Data Analyst", "Canada") == (
+        "https://www.glassdoor.com/Job/canada-data-analyst-jobs-SRCH_IL.0,6_IN3_KO7,19.htm")
+    assert search_url("Data Analyst", "Canada", remote=True) == (
+        "https://www.glassdoor.com/Job/canada-remote-data-analyst-jobs-SRCH_IL.0,6_IN3_KO7,27.htm")
+
+
+def test_roles_with_the_same_slug_are_searched_once():
+    configs = query_configs(["Data Analyst", "data analyst", "BI Analyst"], ["Canada"])
+
+    assert list(configs) == ["Data Analyst", "BI Analyst"]
+
+
+def test_plan_tasks():
+    configs = query_configs(["Data Analyst", "BI Analyst"], ["Canada", "Germany"])
+    queries = plan_queries(configs, {"last_24h": 1, "last_7d": 7})
+
+    # Two windows, remote and listings per role and country
+    assert len(queries) == 2 * 2 * 4
+    assert sorted(plan_tasks(queries)) == sorted(
+        (role, country) for role in ("Data Analyst", "BI Analyst") for country in ("Canada", "Germany"))
+
+
+def test_plan_pages_loads_each_url_once():
+    configs = query_configs(["Data Analyst"], ["Canada"])
+    pages = plan_pages(plan_queries(configs, {"last_24h": 1, "last_7d": 7}))[("Data Analyst", "Canada")]
+
+    # The 24-hour count and the listings come from one page
+    assert len(pages) == 3
+    assert pages[f"{search_url('Data Analyst', 'Canada')}?fromAge=1"] == ["last_24h", "job_listings"]
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for the browser worker pool
+"""
+
+import queue
+
+import main
+from main import empty_country_data, scrape_worker
+
+
+class FakeScraper:
+    """Stands in for GlassdoorScraper; its browser dies while scraping Germany."""
+
+    def __init__(self, **kwargs):
+        self.alive = False
+        self.starts = 0
+        self.stats = main.new_browser_stats()
+
+    def initialize(self):
+        self.alive = True
+        self.starts += 1
+
+    def is_alive(self):
+        return self.alive
+
+    def close(self):
+        self.alive = False
+
+    def save_cookies(self):
+        pass
+
+    def scrape_country(self, country, role):
+        if country == "Germany":
+            raise RuntimeError("chrome not reachable")
+        data = empty_country_data(country)
+        data["last_30d"] = 786
+        return data
+
+
+def test_failed_country_does_not_stop_the_worker(monkeypatch):
+    scrapers = []
+
+    def new_scraper(**kwargs):
+        scrapers.append(FakeScraper(**kwargs))
+        return scrapers[-1]
+
+    monkeypatch.setattr(main, "GlassdoorScraper", new_scraper)
+    monkeypatch.setattr(main, "KEEP_BROWSERS", False)
+    tasks = queue.Queue()
+    for country in ("Canada", "Germany", "India"):
+        tasks.put(("Data Analyst", country))
+    results = {}
+
+    scrape_worker(1, tasks, results)
+
+    assert results[("Data Analyst", "Germany")] == empty_country_data("Germany")
+    assert results[("Data Analyst", "Canada")]["last_30d"] == 786
+    assert results[("Data Analyst", "India")]["last_30d"] == 786
+    # The browser was restarted after the failure
+    assert scrapers[0].starts == 2